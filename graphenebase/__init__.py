@@ -15,6 +15,7 @@ __all__ = [
     "chains",
     "objects",
     "operations",
+    "schema",
     "signedtransactions",
     "objecttypes",
 ]
@@ -4,16 +4,80 @@ from __future__ import absolute_import
 import hashlib
 import re
 import os
+import time
 
 from binascii import hexlify, unhexlify
-from .base58 import ripemd160, Base58, doublesha256
+from functools import lru_cache, partial
+from .base58 import (
+    Base58,
+    BASE58_ALPHABET,
+    gphBase58CheckEncode_bytes,
+    _ripemd160,
+    _doublesha256,
+)
 from .dictionary import words as BrainKeyDictionary
-from .utils import _bytes
+from .utils import _bytes, map_chunked
 from .prefix import Prefix
 
 import ecdsa
 
 
+def _with_public_keys(secrets, public=False, address=False):
+    """ Raw private keys, or ``(private, public)`` tuples of raw keys with
+        the raw address (see :meth:`Address.from_pubkey`) appended if
+        ``address`` is set
+    """
+    if not public and not address:
+        return secrets
+    from .ecdsa import curve
+
+    mul_generator = curve().mul_generator
+    # Uncached, every key is only seen once
+    address_hash = _address_hash.__wrapped__
+    keys = []
+    for secret in secrets:
+        pubkey = mul_generator(secret)
+        if address:
+            keys.append((secret, pubkey, address_hash(pubkey, 56)))
+        else:
+            keys.append((secret, pubkey))
+    return keys
+
+
+def _key_objects(key, prefix):
+    """ Turn the result of :func:`_with_public_keys` into ``PrivateKey``,
+        ``PublicKey`` and ``Address`` instances
+    """
+    if isinstance(key, bytes):
+        return PrivateKey(key, prefix=prefix)
+    objects = (PrivateKey(key[0], prefix=prefix), PublicKey(key[1], prefix=prefix))
+    if len(key) > 2:
+        objects += (Address(key[2], prefix=prefix),)
+    return objects
+
+
+def _password_secrets(items, public=False, address=False):
+    """ Raw private keys of ``(account, role, password)`` tuples
+    """
+    secrets = [
+        hashlib.sha256(_bytes(account + role + password)).digest()
+        for account, role, password in items
+    ]
+    return _with_public_keys(secrets, public, address)
+
+
+def _brainkey_secrets(brainkey, sequences, public=False, address=False):
+    """ Raw private keys of a brain key for the given sequence numbers
+    """
+    secrets = [
+        hashlib.sha256(
+            hashlib.sha512(_bytes("%s %d" % (brainkey, sequence))).digest()
+        ).digest()
+        for sequence in sequences
+    ]
+    return _with_public_keys(secrets, public, address)
+
+
 class PasswordKey(Prefix):
     """ This class derives a private key given the account name, the
         role and a password. It leverages the technology of Brainkeys
@@ -33,7 +97,7 @@ class PasswordKey(Prefix):
         """
         a = _bytes(self.account + self.role + self.password)
         s = hashlib.sha256(a).digest()
-        return PrivateKey(hexlify(s).decode("ascii"), prefix=self.prefix)
+        return PrivateKey(s, prefix=self.prefix)
 
     def get_public(self):
         return self.get_private().pubkey
@@ -44,6 +108,55 @@ class PasswordKey(Prefix):
     def get_public_key(self):
         return self.get_public()
 
+    @classmethod
+    def derive_many(
+        cls,
+        credentials,
+        roles=("owner", "active", "memo"),
+        workers=None,
+        raw=False,
+        prefix=None,
+        public=False,
+        address=False,
+    ):
+        """ Derive the role keys of many accounts
+
+            :param list credentials: ``(account, password)`` tuples
+            :param list roles: Roles to derive keys for
+            :param int workers: Spread the derivation over this many
+                processes (defaults to the current process)
+            :param bool raw: Return raw keys (bytes) instead of instances of
+                ``PrivateKey``, ``PublicKey`` and ``Address``
+            :param str prefix: Network prefix
+            :param bool public: Also derive the public keys, every key is
+                then a ``(private, public)`` tuple
+            :param bool address: Also derive the addresses, every key is
+                then a ``(private, public, address)`` tuple
+            :return: One dict (role to key) per account, in order
+            :rtype: list
+
+            The public keys and addresses are derived in the worker
+            processes as well.
+        """
+        items = [
+            (account, role, password)
+            for account, password in credentials
+            for role in roles
+        ]
+        keys = map_chunked(
+            partial(_password_secrets, public=public, address=address),
+            items,
+            workers,
+            chunksize=256,
+        )
+        if not raw:
+            prefix = prefix or Prefix.prefix
+            keys = [_key_objects(key, prefix) for key in keys]
+        return [
+            dict(zip(roles, keys[i : i + len(roles)]))
+            for i in range(0, len(keys), len(roles))
+        ]
+
 
 class BrainKey(Prefix):
     """Brainkey implementation similar to the graphene-ui web-wallet.
@@ -101,13 +214,45 @@ class BrainKey(Prefix):
         encoded = "%s %d" % (self.brainkey, self.sequence)
         a = _bytes(encoded)
         s = hashlib.sha256(hashlib.sha512(a).digest()).digest()
-        return PrivateKey(hexlify(s).decode("ascii"), prefix=self.prefix)
+        return PrivateKey(s, prefix=self.prefix)
+
+    def derive_many(self, count, workers=None, raw=False, public=False, address=False):
+        """ Derive the private keys of ``count`` consecutive sequence
+            numbers, starting at the current sequence number (which is not
+            changed)
+
+            :param int count: Number of keys to derive
+            :param int workers: Spread the derivation over this many
+                processes (defaults to the current process)
+            :param bool raw: Return raw keys (bytes) instead of instances of
+                ``PrivateKey``, ``PublicKey`` and ``Address``
+            :param bool public: Also derive the public keys, every key is
+                then a ``(private, public)`` tuple
+            :param bool address: Also derive the addresses, every key is
+                then a ``(private, public, address)`` tuple
+            :rtype: list
+
+            The public keys and addresses are derived in the worker
+            processes as well.
+        """
+        sequences = range(self.sequence, self.sequence + count)
+        keys = map_chunked(
+            partial(
+                _brainkey_secrets, self.brainkey, public=public, address=address
+            ),
+            sequences,
+            workers,
+            chunksize=256,
+        )
+        if raw:
+            return keys
+        return [_key_objects(key, self.prefix) for key in keys]
 
     def get_blind_private(self):
         """ Derive private key from the brain key (and no sequence number)
         """
         a = _bytes(self.brainkey)
-        return PrivateKey(hashlib.sha256(a).hexdigest(), prefix=self.prefix)
+        return PrivateKey(hashlib.sha256(a).digest(), prefix=self.prefix)
 
     def get_public(self):
         return self.get_private().pubkey
@@ -135,6 +280,209 @@ class BrainKey(Prefix):
         return " ".join(brainkey).upper()
 
 
+#: Number of public keys whose decoded forms, points and addresses are cached
+PUBLIC_KEY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _address_hash(pubkey_plain, version):
+    """ Raw (PTS) address of a raw public key
+    """
+    s = bytes([version]) + _ripemd160(hashlib.sha256(pubkey_plain).digest())
+    return _ripemd160(s + _doublesha256(s)[:4])
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _graphene_address_hash(pubkey_plain):
+    """ Raw graphene address of a raw public key
+    """
+    return _ripemd160(hashlib.sha512(pubkey_plain).digest())
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _decode_public_key(pk, prefix):
+    """ Decode a public key (raw, hex or base58) into the ``Base58``
+        instance of the compressed key
+
+        The returned instance is shared and must not be modified.
+    """
+    if isinstance(pk, str) and pk.startswith("04"):
+        pk = unhexlify(pk)
+    if isinstance(pk, bytes) and pk[:1] == b"\x04":
+        # We only ever deal with compressed keys, so let's make it
+        # compressed
+        order = ecdsa.SECP256k1.order
+        p = ecdsa.VerifyingKey.from_string(pk[1:], curve=ecdsa.SECP256k1).pubkey.point
+        pk = bytes([2 + (p.y() & 1)]) + ecdsa.util.number_to_string(p.x(), order)
+    return Base58(pk, prefix=prefix)
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _uncompress_public_key(compressed):
+    """ Uncompressed hex representation of a compressed public key
+    """
+    from .ecdsa import curve
+
+    prefix = compressed[0:2]
+    assert prefix == "02" or prefix == "03"
+    return hexlify(curve().decompress(unhexlify(compressed))).decode("ascii")
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _public_key_point(compressed):
+    """ Curve point of a compressed public key
+    """
+    string = unhexlify(_uncompress_public_key(compressed))
+    return ecdsa.VerifyingKey.from_string(
+        string[1:], curve=ecdsa.SECP256k1
+    ).pubkey.point
+
+
+#: Address variants ``(compressed, version)`` that genesis balances may be
+#: assigned to
+GENESIS_ADDRESS_VARIANTS = [(False, 0), (True, 0), (False, 56), (True, 56)]
+
+
+def derive_addresses(
+    pubkeys, variants=GENESIS_ADDRESS_VARIANTS, prefix=None, raw=False
+):
+    """ Derive the addresses (see :meth:`Address.from_pubkey`) of many public
+        keys at once
+
+        :param list pubkeys: Public keys (``PublicKey`` or str)
+        :param list variants: ``(compressed, version)`` tuples
+        :param str prefix: Network prefix of the addresses (defaults to the
+            prefix of each ``PublicKey`` and to ``GPH`` for keys given as
+            str)
+        :param bool raw: Return the raw addresses (bytes) instead of str
+        :return: One list of addresses per public key, in the order of
+            ``variants``
+        :rtype: list
+
+        The hashes are computed on raw bytes and the hash of each key
+        format is shared among all versions.
+    """
+    result = []
+    for pubkey in pubkeys:
+        if prefix is None and isinstance(pubkey, PublicKey):
+            key_prefix = pubkey.prefix
+        else:
+            key_prefix = prefix or Prefix.prefix
+        pubkey = PublicKey(pubkey, prefix=key_prefix)
+        rep = dict()
+        addresses = []
+        for compressed, version in variants:
+            if compressed not in rep:
+                if compressed:
+                    data = bytes(pubkey)
+                else:
+                    data = unhexlify(pubkey.uncompressed())
+                rep[compressed] = _ripemd160(hashlib.sha256(data).digest())
+            s = bytes([version]) + rep[compressed]
+            address = _ripemd160(s + _doublesha256(s)[:4])
+            if raw:
+                addresses.append(address)
+            else:
+                addresses.append(key_prefix + gphBase58CheckEncode_bytes(address))
+        result.append(addresses)
+    return result
+
+
+#: Targets of :func:`vanity_search`
+VANITY_TARGETS = ("pubkey", "address")
+
+
+def _vanity_batch(pattern, target, count):
+    """ Try ``count`` random keys, returns ``(secret, tries)`` with ``secret``
+        being ``None`` if no key matched
+    """
+    from .ecdsa import curve
+
+    mul_generator = curve().mul_generator
+    for tries in range(1, count + 1):
+        secret = os.urandom(32)
+        data = mul_generator(secret)
+        if target == "address":
+            data = _ripemd160(hashlib.sha512(data).digest())
+        if gphBase58CheckEncode_bytes(data).startswith(pattern):
+            return secret, tries
+    return None, count
+
+
+def vanity_search(
+    pattern,
+    target="pubkey",
+    workers=None,
+    batch=256,
+    max_tries=None,
+    prefix=None,
+    report=None,
+):
+    """ Search for a private key whose public key (or address) starts with
+        ``pattern``
+
+        :param str pattern: Base58 characters that have to follow the
+            network prefix (e.g. ``"8Foo"`` for ``GPH8Foo...``)
+        :param str target: ``pubkey`` or ``address`` (see
+            :class:`GrapheneAddress`)
+        :param int workers: Search in this many processes
+        :param int batch: Number of keys a process tries at once
+        :param int max_tries: Give up after (about) this many keys
+        :param str prefix: Network prefix of the returned key
+        :param report: Called with ``(tries, seconds)`` after every batch
+        :return: The matching key or ``None`` if ``max_tries`` was reached
+        :rtype: PrivateKey
+        :raises ValueError: if ``pattern`` contains non-base58 characters
+
+        Keys are drawn from ``os.urandom`` and only raw bytes are handled in
+        the loop. Every base58 character of the pattern makes the search
+        about 58 times longer. Since public keys start with a ``02``/``03``
+        byte, their first character is one of ``4`` to ``8``.
+    """
+    if target not in VANITY_TARGETS:
+        raise ValueError("Unknown target {}".format(target))
+    if not set(_bytes(pattern)).issubset(BASE58_ALPHABET):
+        raise ValueError("Pattern {} is not base58".format(pattern))
+
+    start = time.time()
+    tries = 0
+    secret = None
+    if not workers:
+        while secret is None and (max_tries is None or tries < max_tries):
+            secret, n = _vanity_batch(pattern, target, batch)
+            tries += n
+            if report:
+                report(tries, time.time() - start)
+    else:
+        from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = {
+                executor.submit(_vanity_batch, pattern, target, batch)
+                for _ in range(workers)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, n = future.result()
+                    tries += n
+                    secret = secret or found
+                if report:
+                    report(tries, time.time() - start)
+                if secret is None and (max_tries is None or tries < max_tries):
+                    pending |= {
+                        executor.submit(_vanity_batch, pattern, target, batch)
+                        for _ in done
+                    }
+                else:
+                    for future in pending:
+                        future.cancel()
+                    pending = set()
+    if secret is None:
+        return None
+    return PrivateKey(secret, prefix=prefix or Prefix.prefix)
+
+
 class Address(Prefix):
     """ Address class
 
@@ -163,14 +511,10 @@ class Address(Prefix):
         # Ensure this is a public key
         pubkey = PublicKey(pubkey, prefix=prefix or Prefix.prefix)
         if compressed:
-            pubkey_plain = pubkey.compressed()
+            pubkey_plain = bytes(pubkey)
         else:
-            pubkey_plain = pubkey.uncompressed()
-        sha = hashlib.sha256(unhexlify(pubkey_plain)).hexdigest()
-        rep = hexlify(ripemd160(sha)).decode("ascii")
-        s = ("%.2x" % version) + rep
-        result = s + hexlify(doublesha256(s)[:4]).decode("ascii")
-        result = hexlify(ripemd160(result)).decode("ascii")
+            pubkey_plain = unhexlify(pubkey.uncompressed())
+        result = _address_hash(pubkey_plain, version)
         return cls(result, prefix=pubkey.prefix)
 
     def __repr__(self):
@@ -205,13 +549,12 @@ class GrapheneAddress(Address):
         # Ensure this is a public key
         pubkey = PublicKey(pubkey, prefix=prefix or Prefix.prefix)
         if compressed:
-            pubkey_plain = pubkey.compressed()
+            pubkey_plain = bytes(pubkey)
         else:
-            pubkey_plain = pubkey.uncompressed()
+            pubkey_plain = unhexlify(pubkey.uncompressed())
 
         """ Derive address using ``RIPEMD160(SHA512(x))`` """
-        addressbin = ripemd160(hashlib.sha512(unhexlify(pubkey_plain)).hexdigest())
-        result = Base58(hexlify(addressbin).decode("ascii"))
+        result = _graphene_address_hash(pubkey_plain)
         return cls(result, prefix=pubkey.prefix)
 
 
@@ -237,18 +580,13 @@ class PublicKey(Prefix):
         self.set_prefix(prefix)
         if isinstance(pk, PublicKey):
             pk = format(pk, self.prefix)
+        elif isinstance(pk, Base58):
+            pk = repr(pk)
 
-        if str(pk).startswith("04"):
-            # We only ever deal with compressed keys, so let's make it
-            # compressed
-            order = ecdsa.SECP256k1.order
-            p = ecdsa.VerifyingKey.from_string(
-                unhexlify(pk[2:]), curve=ecdsa.SECP256k1
-            ).pubkey.point
-            x_str = ecdsa.util.number_to_string(p.x(), order)
-            pk = hexlify(chr(2 + (p.y() & 1)).encode("ascii") + x_str).decode("ascii")
-
-        self._pk = Base58(pk, prefix=self.prefix)
+        if not isinstance(pk, bytes):
+            pk = str(pk)
+        # Decoded keys are cached (see PUBLIC_KEY_CACHE_SIZE)
+        self._pk = _decode_public_key(pk, self.prefix)
 
     @property
     def pubkey(self):
@@ -260,36 +598,22 @@ class PublicKey(Prefix):
 
     def _derive_y_from_x(self, x, is_even):
         """ Derive y point from x point """
-        curve = ecdsa.SECP256k1.curve
-        # The curve equation over F_p is:
-        #   y^2 = x^3 + ax + b
-        a, b, p = curve.a(), curve.b(), curve.p()
-        alpha = (pow(x, 3, p) + a * x + b) % p
-        beta = ecdsa.numbertheory.square_root_mod_prime(alpha, p)
-        if (beta % 2) == is_even:
-            beta = p - beta
-        return beta
+        from .ecdsa import curve
+
+        compressed = bytes([3 - bool(is_even)]) + x.to_bytes(32, "big")
+        return int.from_bytes(curve().decompress(compressed)[33:], "big")
 
     def compressed(self):
         """ returns the compressed key """
         return repr(self._pk)
 
     def uncompressed(self):
-        """ Derive uncompressed key """
-        public_key = repr(self._pk)
-        prefix = public_key[0:2]
-        assert prefix == "02" or prefix == "03"
-        x = int(public_key[2:], 16)
-        y = self._derive_y_from_x(x, (prefix == "02"))
-        key = "04" + "%064x" % x + "%064x" % y
-        return key
+        """ Derive uncompressed key (cached) """
+        return _uncompress_public_key(repr(self._pk))
 
     def point(self):
-        """ Return the point for the public key """
-        string = unhexlify(self.unCompressed())
-        return ecdsa.VerifyingKey.from_string(
-            string[1:], curve=ecdsa.SECP256k1
-        ).pubkey.point
+        """ Return the point for the public key (cached) """
+        return _public_key_point(repr(self._pk))
 
     def child(self, offset256):
         """ Derive new public key from this key and a sha256 "offset" """
@@ -306,21 +630,10 @@ class PublicKey(Prefix):
     @classmethod
     def from_privkey(cls, privkey, prefix=None):
         """ Derive uncompressed public key """
+        from .ecdsa import curve
+
         privkey = PrivateKey(privkey, prefix=prefix or Prefix.prefix)
-        secret = unhexlify(repr(privkey))
-        order = ecdsa.SigningKey.from_string(
-            secret, curve=ecdsa.SECP256k1
-        ).curve.generator.order()
-        p = ecdsa.SigningKey.from_string(
-            secret, curve=ecdsa.SECP256k1
-        ).verifying_key.pubkey.point
-        x_str = ecdsa.util.number_to_string(p.x(), order)
-        # y_str = ecdsa.util.number_to_string(p.y(), order)
-        compressed = hexlify(chr(2 + (p.y() & 1)).encode("ascii") + x_str).decode(
-            "ascii"
-        )
-        # uncompressed = hexlify(
-        #    chr(4).encode('ascii') + x_str + y_str).decode('ascii')
+        compressed = curve().mul_generator(bytes(privkey))
         return cls(compressed, prefix=prefix or Prefix.prefix)
 
     def __repr__(self):
@@ -343,11 +656,15 @@ class PublicKey(Prefix):
         """ Returns the raw public key (has length 33)"""
         return bytes(self._pk)
 
+    def to_python(self):
+        """ Returns the readable public key (see
+            :meth:`graphenebase.types.to_python`)
+        """
+        return str(self)
+
     @staticmethod
     def fromBytes(d, prefix="GPH"):
-        _pk = hexlify(d[:33]).decode('ascii')
-
-        k = PublicKey(_pk)
+        k = PublicKey(bytes(d[:33]))
 
         return k, d[33:]
 
@@ -398,7 +715,7 @@ class PrivateKey(Prefix):
         if wif is None:
             import os
 
-            self._wif = Base58(hexlify(os.urandom(32)).decode("ascii"))
+            self._wif = Base58(os.urandom(32))
         elif isinstance(wif, PrivateKey):
             self._wif = wif._wif
         elif isinstance(wif, Base58):
@@ -407,7 +724,7 @@ class PrivateKey(Prefix):
             self._wif = Base58(wif)
 
         # test for valid key by trying to obtain a public key
-        assert len(repr(self._wif)) == 64
+        assert len(bytes(self._wif)) == 32
 
     @property
     def bitcoin(self):
@@ -441,7 +758,7 @@ class PrivateKey(Prefix):
         encoded = "%s %d" % (str(self), sequence)
         a = bytes(encoded, "ascii")
         s = hashlib.sha256(hashlib.sha512(a).digest()).digest()
-        return PrivateKey(hexlify(s).decode("ascii"), prefix=self.pubkey.prefix)
+        return PrivateKey(s, prefix=self.pubkey.prefix)
 
     def child(self, offset256):
         """ Derive new private key from this key and a sha256 "offset"
@@ -455,13 +772,11 @@ class PrivateKey(Prefix):
             Here, the key itself serves as a `seed`, and `offset`
             is expected to be a sha256 digest.
         """
-        seed = int(hexlify(bytes(self)).decode("ascii"), 16)
-        z = int(hexlify(offset).decode("ascii"), 16)
+        seed = int.from_bytes(bytes(self), "big")
+        z = int.from_bytes(offset, "big")
         order = ecdsa.SECP256k1.order
         secexp = (seed + z) % order
-        secret = "%0x" % secexp
-        if len(secret) < 64: # left-pad with zeroes
-            secret = ("0" * (64-len(secret))) + secret
+        secret = secexp.to_bytes(32, "big")
         return PrivateKey(secret, prefix=self.pubkey.prefix)
 
     def __format__(self, _format):
@@ -491,13 +806,13 @@ class BitcoinAddress(Address):
         # Ensure this is a public key
         pubkey = PublicKey(pubkey)
         if compressed:
-            pubkey = pubkey.compressed()
+            pubkey = bytes(pubkey)
         else:
-            pubkey = pubkey.uncompressed()
+            pubkey = unhexlify(pubkey.uncompressed())
 
         """ Derive address using ``RIPEMD160(SHA256(x))`` """
-        addressbin = ripemd160(hexlify(hashlib.sha256(unhexlify(pubkey)).digest()))
-        return cls(hexlify(addressbin).decode("ascii"))
+        addressbin = _ripemd160(hashlib.sha256(pubkey).digest())
+        return cls(addressbin)
 
     def __str__(self):
         """ Returns the readable Graphene address. This call is equivalent to
@@ -49,3 +49,53 @@ class AESCipher(object):
         iv = enc[: AES.block_size]
         cipher = AES.new(self.key, AES.MODE_CBC, iv)
         return self._unpad(cipher.decrypt(enc[AES.block_size :])).decode("utf-8")
+
+    def encrypt_stream(self, source, dest, chunksize=64 * 1024):
+        """ Encrypt a binary stream chunk by chunk
+
+            The output is the binary (not base64 encoded) form of
+            :meth:`encrypt`.
+
+            :param source: File-like object to read the plain data from
+            :param dest: File-like object to write the encrypted data to
+            :param int chunksize: Number of bytes to read at once
+        """
+        iv = Random.new().read(AES.block_size)
+        cipher = AES.new(self.key, AES.MODE_CBC, iv)
+        dest.write(iv)
+        buf = b""
+        while True:
+            data = source.read(chunksize)
+            if not data:
+                break
+            buf += data
+            n = len(buf) - len(buf) % self.bs
+            if n:
+                dest.write(cipher.encrypt(buf[:n]))
+                buf = buf[n:]
+        dest.write(cipher.encrypt(self._pad(buf)))
+
+    def decrypt_stream(self, source, dest, chunksize=64 * 1024):
+        """ Decrypt a binary stream written by :meth:`encrypt_stream`
+
+            :param source: File-like object to read the encrypted data from
+            :param dest: File-like object to write the plain data to
+            :param int chunksize: Number of bytes to read at once
+        """
+        iv = source.read(AES.block_size)
+        cipher = AES.new(self.key, AES.MODE_CBC, iv)
+        buf = b""
+        # The padding is in the last block, so that one is held back
+        pending = b""
+        while True:
+            data = source.read(chunksize)
+            if not data:
+                break
+            buf += data
+            n = len(buf) - len(buf) % AES.block_size
+            if n:
+                pending += cipher.decrypt(buf[:n])
+                buf = buf[n:]
+                dest.write(pending[: -self.bs])
+                pending = pending[-self.bs :]
+        dest.write(self._unpad(pending))
@@ -9,6 +9,8 @@ from .prefix import Prefix
 
 log = logging.getLogger(__name__)
 
+_HEXDIGITS = frozenset(string.hexdigits)
+
 
 class Base58(Prefix):
     """Base58 base class
@@ -38,18 +40,24 @@ class Base58(Prefix):
 
     def __init__(self, data, prefix=None):
         self.set_prefix(prefix)
+        # The raw bytes are the canonical form, hex is derived on demand
+        self._hex = None
         if isinstance(data, Base58):
-            data = repr(data)
-        if all(c in string.hexdigits for c in data):
+            self._raw = data._raw
+            self._hex = data._hex
+        elif isinstance(data, (bytes, bytearray)):
+            self._raw = bytes(data)
+        elif _HEXDIGITS.issuperset(data):
+            self._raw = unhexlify(data)
             self._hex = data
         elif data[0] == "5" or data[0] == "6":
-            self._hex = base58CheckDecode(data)
+            self._raw = base58CheckDecode_bytes(data)
         elif data[0] == "K" or data[0] == "L":  # pragma: no cover
             raise NotImplementedError(
                 "Private Keys starting with L or K are not supported!"
             )
         elif data[: len(self.prefix)] == self.prefix:
-            self._hex = gphBase58CheckDecode(data[len(self.prefix) :])
+            self._raw = gphBase58CheckDecode_bytes(data[len(self.prefix) :])
         else:
             raise ValueError("Error loading Base58 object")
 
@@ -62,11 +70,11 @@ class Base58(Prefix):
 
         """
         if _format.upper() == "WIF":
-            return base58CheckEncode(0x80, self._hex)
+            return base58CheckEncode_bytes(0x80, self._raw)
         elif _format.upper() == "ENCWIF":
-            return base58encode(self._hex)
+            return base58encode_bytes(self._raw)
         elif _format.upper() == "BTC":
-            return base58CheckEncode(0x00, self._hex)
+            return base58CheckEncode_bytes(0x00, self._raw)
         else:
             return _format.upper() + str(self)
 
@@ -76,6 +84,8 @@ class Base58(Prefix):
             :return: Hex string of instance's data
             :rtype: hex string
         """
+        if self._hex is None:
+            self._hex = hexlify(self._raw).decode("ascii")
         return self._hex
 
     def __str__(self):
@@ -84,7 +94,7 @@ class Base58(Prefix):
             :return: Base58 encoded data
             :rtype: str
         """
-        return gphBase58CheckEncode(self._hex)
+        return gphBase58CheckEncode_bytes(self._raw)
 
     def __bytes__(self):
         """ Return raw bytes
@@ -93,57 +103,134 @@ class Base58(Prefix):
             :rtype: bytes
 
         """
-        return unhexlify(self._hex)
+        return self._raw
 
 
 # https://github.com/tochev/python3-cryptocoins/raw/master/cryptocoins/base58.py
 BASE58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
+#: Value of every (byte) character, -1 for characters outside the alphabet
+BASE58_VALUES = [-1] * 256
+for _i, _c in enumerate(BASE58_ALPHABET):
+    BASE58_VALUES[_c] = _i
 
-def base58decode(base58_str):
-    base58_text = _bytes(base58_str)
-    n = 0
-    leading_zeroes_count = 0
-    for b in base58_text:
-        n = n * 58 + BASE58_ALPHABET.find(b)
-        if n == 0:
-            leading_zeroes_count += 1
-    res = bytearray()
-    while n >= 256:
-        div, mod = divmod(n, 256)
-        res.insert(0, mod)
-        n = div
-    else:
-        res.insert(0, n)
-    return hexlify(bytearray(1) * leading_zeroes_count + res).decode("ascii")
+#: Number of base58 digits that are decoded per big integer operation
+_CHUNK_DIGITS = 10
+_CHUNK = 58 ** _CHUNK_DIGITS
 
+#: All two digit base58 strings (``58 * a + b`` maps to digits ``a`` and ``b``)
+_DIGIT_PAIRS = [bytes([a, b]) for a in BASE58_ALPHABET for b in BASE58_ALPHABET]
 
-def base58encode(hexstring):
-    byteseq = unhexlify(_bytes(hexstring))
+
+def base58decode_bytes(base58_str):
+    """ Decode a base58 string
+
+        :param str base58_str: Base58 encoded data
+        :return: Raw data
+        :rtype: bytes
+        :raises ValueError: if ``base58_str`` contains invalid characters
+    """
+    base58_text = _bytes(base58_str) if isinstance(base58_str, str) else base58_str
+    stripped = base58_text.lstrip(BASE58_ALPHABET[0:1])
+    leading_zeroes_count = len(base58_text) - len(stripped)
+    values = BASE58_VALUES
     n = 0
-    leading_zeroes_count = 0
-    for c in byteseq:
-        n = n * 256 + c
-        if n == 0:
-            leading_zeroes_count += 1
+    for i in range(0, len(stripped), _CHUNK_DIGITS):
+        chunk = stripped[i : i + _CHUNK_DIGITS]
+        v = 0
+        for b in chunk:
+            d = values[b]
+            if d < 0:
+                raise ValueError("Invalid base58 character {!r}".format(chr(b)))
+            v = v * 58 + d
+        n = n * 58 ** len(chunk) + v
+    if n == 0:
+        leading_zeroes_count += 1
+    return bytes(leading_zeroes_count) + n.to_bytes((n.bit_length() + 7) // 8, "big")
+
+
+def base58decode(base58_str):
+    """ Decode a base58 string
+
+        :param str base58_str: Base58 encoded data
+        :return: Hex representation of the data
+        :rtype: str
+        :raises ValueError: if ``base58_str`` contains invalid characters
+    """
+    return hexlify(base58decode_bytes(base58_str)).decode("ascii")
+
+
+def base58encode_bytes(data):
+    """ Encode data as base58
+
+        :param bytes data: Raw data
+        :return: Base58 encoded data
+        :rtype: str
+    """
+    leading_zeroes_count = len(data) - len(data.lstrip(b"\x00"))
+    n = int.from_bytes(data, "big")
+    # Split off ten digits per big integer operation
+    chunks = []
+    while n >= _CHUNK:
+        n, chunk = divmod(n, _CHUNK)
+        chunks.append(chunk)
+    # The most significant chunk has no leading zeros
     res = bytearray()
-    while n >= 58:
-        div, mod = divmod(n, 58)
-        res.insert(0, BASE58_ALPHABET[mod])
-        n = div
-    else:
-        res.insert(0, BASE58_ALPHABET[n])
+    while n:
+        n, mod = divmod(n, 58)
+        res.append(BASE58_ALPHABET[mod])
+    res.reverse()
+    if not res and not chunks:
+        leading_zeroes_count += 1
+    # Every other chunk yields exactly five pairs of digits
+    pairs = _DIGIT_PAIRS
+    for chunk in reversed(chunks):
+        high, low = divmod(chunk, 3364 ** 3)
+        p0, p1 = divmod(high, 3364)
+        p2, low = divmod(low, 3364 ** 2)
+        p3, p4 = divmod(low, 3364)
+        res += pairs[p0] + pairs[p1] + pairs[p2] + pairs[p3] + pairs[p4]
     return (BASE58_ALPHABET[0:1] * leading_zeroes_count + res).decode("ascii")
 
 
+def base58encode(hexstring):
+    """ Encode data as base58
+
+        :param str hexstring: Hex representation of the data
+        :return: Base58 encoded data
+        :rtype: str
+    """
+    return base58encode_bytes(unhexlify(_bytes(hexstring)))
+
+
+def encode_many(hexstrings):
+    """ Encode a list of hex strings as base58 (see :func:`base58encode`)
+    """
+    return [base58encode(hexstring) for hexstring in hexstrings]
+
+
+def decode_many(base58_strs):
+    """ Decode a list of base58 strings (see :func:`base58decode`)
+    """
+    return [base58decode(base58_str) for base58_str in base58_strs]
+
+
+def _ripemd160(data):
+    h = hashlib.new("ripemd160")
+    h.update(data)
+    return h.digest()
+
+
+def _doublesha256(data):
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
+
+
 def ripemd160(s):
-    ripemd160 = hashlib.new("ripemd160")
-    ripemd160.update(unhexlify(s))
-    return ripemd160.digest()
+    return _ripemd160(unhexlify(s))
 
 
 def doublesha256(s):
-    return hashlib.sha256(hashlib.sha256(unhexlify(s)).digest()).digest()
+    return _doublesha256(unhexlify(s))
 
 
 def b58encode(v):
@@ -154,30 +241,50 @@ def b58decode(v):
     return base58decode(v)
 
 
+def base58CheckEncode_bytes(version, payload):
+    """ Like :func:`base58CheckEncode` but with raw ``payload``
+    """
+    s = bytes([version]) + payload
+    return base58encode_bytes(s + _doublesha256(s)[:4])
+
+
+def base58CheckDecode_bytes(s):
+    """ Like :func:`base58CheckDecode` but returns raw bytes
+    """
+    s = base58decode_bytes(s)
+    dec = s[:-4]
+    checksum = _doublesha256(dec)[:4]
+    assert s[-4:] == checksum
+    return dec[1:]
+
+
+def gphBase58CheckEncode_bytes(s):
+    """ Like :func:`gphBase58CheckEncode` but with raw data
+    """
+    return base58encode_bytes(s + _ripemd160(s)[:4])
+
+
+def gphBase58CheckDecode_bytes(s):
+    """ Like :func:`gphBase58CheckDecode` but returns raw bytes
+    """
+    s = base58decode_bytes(s)
+    dec = s[:-4]
+    checksum = _ripemd160(dec)[:4]
+    assert s[-4:] == checksum
+    return dec
+
+
 def base58CheckEncode(version, payload):
-    s = ("%.2x" % version) + payload
-    checksum = doublesha256(s)[:4]
-    result = s + hexlify(checksum).decode("ascii")
-    return base58encode(result)
+    return base58CheckEncode_bytes(version, unhexlify(payload))
 
 
 def base58CheckDecode(s):
-    s = unhexlify(base58decode(s))
-    dec = hexlify(s[:-4]).decode("ascii")
-    checksum = doublesha256(dec)[:4]
-    assert s[-4:] == checksum
-    return dec[2:]
+    return hexlify(base58CheckDecode_bytes(s)).decode("ascii")
 
 
 def gphBase58CheckEncode(s):
-    checksum = ripemd160(s)[:4]
-    result = s + hexlify(checksum).decode("ascii")
-    return base58encode(result)
+    return gphBase58CheckEncode_bytes(unhexlify(s))
 
 
 def gphBase58CheckDecode(s):
-    s = unhexlify(base58decode(s))
-    dec = hexlify(s[:-4]).decode("ascii")
-    checksum = ripemd160(dec)[:4]
-    assert s[-4:] == checksum
-    return dec
+    return hexlify(gphBase58CheckDecode_bytes(s)).decode("ascii")
@@ -1,10 +1,16 @@
 # -*- coding: utf-8 -*-
 import logging
 import hashlib
-from binascii import hexlify, unhexlify
-from .account import PrivateKey
-from .base58 import Base58, base58decode
-from .utils import _bytes
+from binascii import unhexlify
+from functools import lru_cache
+from .account import PrivateKey, _uncompress_public_key
+from .base58 import (
+    Base58,
+    base58decode_bytes,
+    base58CheckEncode_bytes,
+    _ripemd160,
+    _doublesha256,
+)
 
 log = logging.getLogger(__name__)
 
@@ -16,31 +22,99 @@ except ImportError:
     except ImportError:
         raise ImportError("Missing dependency: pyCryptodome")
 
+#: Available scrypt implementations, the first one is used by default
+SCRYPT_MODULES = []
 SCRYPT_MODULE = None
 if not SCRYPT_MODULE:  # pragma: no cover
+    # hashlib.scrypt (OpenSSL) is the fastest and releases the GIL while
+    # hashing
+    if hasattr(hashlib, "scrypt"):
+        SCRYPT_MODULES.append("hashlib")
     try:
         import scrypt
 
-        SCRYPT_MODULE = "scrypt"
+        SCRYPT_MODULES.append("scrypt")
     except ImportError:
         try:
             import pylibscrypt as scrypt
 
-            SCRYPT_MODULE = "pylibscrypt"
+            SCRYPT_MODULES.append("pylibscrypt")
         except ImportError:
-            raise ImportError("Missing dependency: scrypt or pylibscrypt")
+            pass
+    if not SCRYPT_MODULES:
+        raise ImportError("Missing dependency: scrypt or pylibscrypt")
+    SCRYPT_MODULE = SCRYPT_MODULES[0]
 
 log.debug("Using scrypt module: %s" % SCRYPT_MODULE)
 
+#: Number of private keys for which the address salt is cached
+SALT_CACHE_SIZE = 1024
+
 
 class SaltException(Exception):
     pass
 
 
-def _encrypt_xor(a, b, aes):
-    """ Returns encrypt(a ^ b). """
-    a = unhexlify("%0.32x" % (int((a), 16) ^ int(hexlify(b), 16)))
-    return aes.encrypt(a)
+def set_scrypt_module(module):
+    """ Select the scrypt implementation
+
+        :param str module: One of ``SCRYPT_MODULES``
+        :raises ValueError: if the implementation is not available
+    """
+    global SCRYPT_MODULE
+    if module not in SCRYPT_MODULES:
+        raise ValueError(
+            "Scrypt module {} is not available (one of {})".format(
+                module, ", ".join(SCRYPT_MODULES)
+            )
+        )
+    SCRYPT_MODULE = module
+    log.debug("Using scrypt module: %s" % SCRYPT_MODULE)
+
+
+def _xor(a, b):
+    """ Returns a ^ b for two byte strings of equal length """
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(
+        len(a), "big"
+    )
+
+
+def _scrypt(passphrase, salt):
+    """ Derive the 64 byte BIP38 key with the selected ``SCRYPT_MODULE``
+    """
+    if SCRYPT_MODULE == "scrypt":  # pragma: no cover
+        return scrypt.hash(passphrase, salt, 16384, 8, 8)
+    elif SCRYPT_MODULE == "pylibscrypt":  # pragma: no cover
+        return scrypt.scrypt(bytes(passphrase, "utf-8"), salt, 16384, 8, 8)
+    elif SCRYPT_MODULE == "hashlib":  # pragma: no cover
+        return hashlib.scrypt(
+            bytes(passphrase, "utf-8"),
+            salt=salt,
+            n=16384,
+            r=8,
+            p=8,
+            maxmem=2 ** 26,
+            dklen=64,
+        )
+    else:  # pragma: no cover
+        raise ValueError("No scrypt module loaded")  # pragma: no cover
+
+
+@lru_cache(maxsize=SALT_CACHE_SIZE)
+def _address_salt(secret):
+    """ Salt of a raw private key (first 4 bytes of the double sha256 of
+        its uncompressed bitcoin address)
+
+        The cache is keyed by the private key, it is cleared by
+        :func:`graphenestorage.masterpassword.clear_key_caches` (e.g. when
+        a store is locked).
+    """
+    pubkey = repr(PrivateKey(secret).pubkey)
+    uncompressed = unhexlify(_uncompress_public_key(pubkey))
+    addr = base58CheckEncode_bytes(
+        0x00, _ripemd160(hashlib.sha256(uncompressed).digest())
+    )
+    return _doublesha256(bytes(addr, "ascii"))[0:4]
 
 
 def encrypt(privkey, passphrase):
@@ -55,29 +129,17 @@ def encrypt(privkey, passphrase):
     """
     if isinstance(privkey, str):
         privkey = PrivateKey(privkey)
-    else:
-        privkey = PrivateKey(repr(privkey))
-
-    privkeyhex = repr(privkey)  # hex
-    addr = format(privkey.bitcoin.address, "BTC")
-    a = _bytes(addr)
-    salt = hashlib.sha256(hashlib.sha256(a).digest()).digest()[0:4]
-    if SCRYPT_MODULE == "scrypt":  # pragma: no cover
-        key = scrypt.hash(passphrase, salt, 16384, 8, 8)
-    elif SCRYPT_MODULE == "pylibscrypt":  # pragma: no cover
-        key = scrypt.scrypt(bytes(passphrase, "utf-8"), salt, 16384, 8, 8)
-    else:  # pragma: no cover
-        raise ValueError("No scrypt module loaded")  # pragma: no cover
+    secret = bytes(privkey)
+    salt = _address_salt(secret)
+    key = _scrypt(passphrase, salt)
     (derived_half1, derived_half2) = (key[:32], key[32:])
     aes = AES.new(derived_half2, AES.MODE_ECB)
-    encrypted_half1 = _encrypt_xor(privkeyhex[:32], derived_half1[:16], aes)
-    encrypted_half2 = _encrypt_xor(privkeyhex[32:], derived_half1[16:], aes)
+    encrypted = aes.encrypt(_xor(secret, derived_half1))
     " flag byte is forced 0xc0 because Graphene only uses compressed keys "
-    payload = b"\x01" + b"\x42" + b"\xc0" + salt + encrypted_half1 + encrypted_half2
+    payload = b"\x01" + b"\x42" + b"\xc0" + salt + encrypted
     " Checksum "
-    checksum = hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
-    privatkey = hexlify(payload + checksum).decode("ascii")
-    return Base58(privatkey)
+    checksum = _doublesha256(payload)[:4]
+    return Base58(payload + checksum)
 
 
 def decrypt(encrypted_privkey, passphrase):
@@ -91,35 +153,23 @@ def decrypt(encrypted_privkey, passphrase):
         password)
 
     """
-
-    d = unhexlify(base58decode(encrypted_privkey))
+    if isinstance(encrypted_privkey, Base58):
+        d = bytes(encrypted_privkey)
+    else:
+        d = base58decode_bytes(encrypted_privkey)
     d = d[2:]  # remove trailing 0x01 and 0x42
     flagbyte = d[0:1]  # get flag byte
     d = d[1:]  # get payload
     assert flagbyte == b"\xc0", "Flagbyte has to be 0xc0"
     salt = d[0:4]
     d = d[4:-4]
-    if SCRYPT_MODULE == "scrypt":  # pragma: no cover
-        key = scrypt.hash(passphrase, salt, 16384, 8, 8)
-    elif SCRYPT_MODULE == "pylibscrypt":  # pragma: no cover
-        key = scrypt.scrypt(bytes(passphrase, "utf-8"), salt, 16384, 8, 8)
-    else:
-        raise ValueError("No scrypt module loaded")  # pragma: no cover
+    key = _scrypt(passphrase, salt)
     derivedhalf1 = key[0:32]
     derivedhalf2 = key[32:64]
-    encryptedhalf1 = d[0:16]
-    encryptedhalf2 = d[16:32]
     aes = AES.new(derivedhalf2, AES.MODE_ECB)
-    decryptedhalf2 = aes.decrypt(encryptedhalf2)
-    decryptedhalf1 = aes.decrypt(encryptedhalf1)
-    privraw = decryptedhalf1 + decryptedhalf2
-    privraw = "%064x" % (int(hexlify(privraw), 16) ^ int(hexlify(derivedhalf1), 16))
-    wif = Base58(privraw)
+    privraw = _xor(aes.decrypt(d[0:32]), derivedhalf1)
     """ Verify Salt """
-    privkey = PrivateKey(format(wif, "wif"))
-    addr = format(privkey.bitcoin.address, "BTC")
-    a = _bytes(addr)
-    saltverify = hashlib.sha256(hashlib.sha256(a).digest()).digest()[0:4]
-    if saltverify != salt:  # pragma: no cover
+    # Not cached: with a wrong passphrase privraw is garbage
+    if _address_salt.__wrapped__(privraw) != salt:  # pragma: no cover
         raise SaltException("checksum verification failed! Password may be incorrect.")
-    return wif
+    return Base58(privraw)
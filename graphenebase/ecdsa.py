@@ -1,16 +1,18 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 
-import time
 import ecdsa
 import hashlib
 import struct
 import logging
 
 from binascii import hexlify
+from collections import OrderedDict
+from functools import lru_cache, partial
 
-from .account import PrivateKey, PublicKey
-from .utils import _bytes
+from .account import PrivateKey, PublicKey, _public_key_point
+from .types import Array, Signature
+from .utils import _bytes, map_chunked, submit
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +42,11 @@ if not SECP256K1_MODULE:  # pragma: no branch
         from cryptography.hazmat.primitives.asymmetric.utils import (
             decode_dss_signature,
             encode_dss_signature,
+            Prehashed,
+        )
+        from cryptography.hazmat.primitives.serialization import (
+            Encoding,
+            PublicFormat,
         )
         from cryptography.exceptions import InvalidSignature
 
@@ -99,7 +106,8 @@ def recover_public_key(digest, signature, i, message=None):
     # 1.5 Compute e
     e = ecdsa.util.string_to_number(digest)
     # 1.6 Compute Q = r^-1(sR - eG)
-    Q = ecdsa.numbertheory.inverse_mod(r, order) * (s * R + (-e % order) * G)
+    rinv = ecdsa.numbertheory.inverse_mod(r, order)
+    Q = (s * rinv % order) * R + (-e * rinv % order) * G
 
     if SECP256K1_MODULE == "cryptography" and message is not None:
         if not isinstance(message, bytes):
@@ -111,46 +119,250 @@ def recover_public_key(digest, signature, i, message=None):
         public_key.verify(sigder, message, ec.ECDSA(hashes.SHA256()))
         return public_key
     else:
+        verifying_key = ecdsa.VerifyingKey.from_public_point(Q, curve=ecdsa.SECP256k1)
         # Not strictly necessary, but let's verify the message for paranoia's sake.
-        if not ecdsa.VerifyingKey.from_public_point(
-            Q, curve=ecdsa.SECP256k1
-        ).verify_digest(
+        if not verifying_key.verify_digest(
             signature, digest, sigdecode=ecdsa.util.sigdecode_string
         ):  # pragma: no cover
             return None  # pragma: no cover
-        return ecdsa.VerifyingKey.from_public_point(
-            Q, curve=ecdsa.SECP256k1
-        )  # pragma: no cover
+        return verifying_key
+
+
+def _public_point(pubkey):
+    """ Coordinates ``(x, y)`` of a public key of any of the backends
+    """
+    if isinstance(pubkey, PublicKey):
+        point = pubkey.point()
+        return point.x(), point.y()
+    elif isinstance(pubkey, ecdsa.keys.VerifyingKey):
+        point = pubkey.pubkey.point
+        return point.x(), point.y()
+    elif SECP256K1_AVAILABLE and isinstance(pubkey, secp256k1.PublicKey):
+        raw = pubkey.serialize(compressed=False)
+        return (
+            ecdsa.util.string_to_number(raw[1:33]),
+            ecdsa.util.string_to_number(raw[33:]),
+        )
+    numbers = pubkey.public_numbers()
+    return numbers.x, numbers.y
 
 
 def recoverPubkeyParameter(message, digest, signature, pubkey):
     """ Use to derive a number that allows to easily recover the
         public key from the signature
+
+        Since the public key ``Q`` is known, ``R = s^-1 (e*G + r*Q)`` is
+        computed once and the parameter follows from the parity of ``R.y``
+        and the overflow of ``R.x`` (instead of trying all four recoveries).
+        Returns ``None`` if the signature does not match the public key.
     """
-    if not isinstance(message, bytes):
-        message = bytes(message, "utf-8")  # pragma: no cover
-    for i in range(0, 4):
-        if SECP256K1_MODULE == "secp256k1":  # pragma: no cover
-            sig = pubkey.ecdsa_recoverable_deserialize(signature, i)
-            p = secp256k1.PublicKey(pubkey.ecdsa_recover(message, sig))
-            if p.serialize() == pubkey.serialize():
-                return i
-        elif SECP256K1_MODULE == "cryptography" and not isinstance(pubkey, PublicKey):
-            p = recover_public_key(digest, signature, i, message)
-            p_comp = hexlify(compressedPubkey(p))
-            pubkey_comp = hexlify(compressedPubkey(pubkey))
-            if p_comp == pubkey_comp:
-                return i
-        else:  # pragma: no cover
-            p = recover_public_key(digest, signature, i)
-            p_comp = hexlify(compressedPubkey(p))
-            p_string = hexlify(p.to_string())
-            if isinstance(pubkey, PublicKey):  # pragma: no cover
-                pubkey_string = bytes(repr(pubkey), "ascii")
-            else:  # pragma: no cover
-                pubkey_string = hexlify(pubkey.to_string())
-            if p_string == pubkey_string or p_comp == pubkey_string:  # pragma: no cover
-                return i
+    curve = ecdsa.SECP256k1.curve
+    G = ecdsa.SECP256k1.generator
+    order = ecdsa.SECP256k1.order
+    r, s = ecdsa.util.sigdecode_string(signature, order)
+    e = ecdsa.util.string_to_number(digest)
+    x, y = _public_point(pubkey)
+    Q = ecdsa.ellipticcurve.Point(curve, x, y, order)
+    w = ecdsa.numbertheory.inverse_mod(s, order)
+    R = (e * w % order) * G + (r * w % order) * Q
+    if R == ecdsa.ellipticcurve.INFINITY or R.x() % order != r:
+        return None
+    return (R.y() & 1) | (2 if R.x() >= order else 0)
+
+
+def _recover_ecdsa(digest, signature, i):
+    try:
+        verifying_key = recover_public_key(digest, signature, i)
+    except (ecdsa.BadSignatureError, ecdsa.numbertheory.SquareRootError):
+        verifying_key = None
+    if verifying_key is None:
+        raise ValueError("No public key can be recovered from the signature")
+    return compressedPubkey(verifying_key)
+
+
+def _recover_secp256k1(digest, signature, i):
+    ctx = _secp256k1_context()
+    pub = secp256k1.PublicKey(flags=secp256k1.ALL_FLAGS, ctx=ctx)
+    sig = pub.ecdsa_recoverable_deserialize(signature, i)
+    try:
+        raw = pub.ecdsa_recover(digest, sig, raw=True)
+    except Exception:
+        raise ValueError("No public key can be recovered from the signature")
+    recovered = secp256k1.PublicKey(raw, flags=secp256k1.ALL_FLAGS, ctx=ctx)
+    return recovered.serialize(compressed=True)
+
+
+#: Backends for :func:`recover_public_keys`, each is called with
+#: ``(digest, signature, i)`` and returns the compressed public key
+recover_backends = {"ecdsa": _recover_ecdsa}
+if SECP256K1_AVAILABLE:  # pragma: no branch
+    recover_backends["secp256k1"] = _recover_secp256k1
+
+
+def recover_public_keys(items, backend=None):
+    """ Recover many public keys
+
+        :param list items: List of ``(digest, signature, i)`` tuples with
+            ``signature`` being the 64 bytes ``r + s`` and ``i`` the
+            recovery parameter (0..3)
+        :param backend: Name of a backend in ``recover_backends`` or a
+            callable (defaults to the fastest available backend)
+        :return: Compressed public keys (bytes), in order
+        :rtype: list
+        :raises ValueError: if a signature does not yield a public key
+    """
+    if backend is None:
+        backend = "secp256k1" if "secp256k1" in recover_backends else "ecdsa"
+    if not callable(backend):
+        backend = recover_backends[backend]
+    return [backend(digest, signature, i) for digest, signature, i in items]
+
+
+#: Number of private keys whose backend key objects are kept in memory
+SIGNING_KEY_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=SIGNING_KEY_CACHE_SIZE)
+def signing_keys(secret, module):
+    """ Backend specific private and public key objects of a private key
+
+        :param bytes secret: Raw private key (32 bytes)
+        :param str module: Backend (``cryptography`` or ``ecdsa``)
+        :return: ``(private_key, public_key)``
+        :rtype: tuple
+
+        Deriving the key objects (and the public key) is costly compared to
+        a signature. They are kept in a (process wide, in memory only) LRU
+        cache, so that frequently used keys are derived only once. The
+        cache is cleared when a key store is locked.
+    """
+    if module == "cryptography":
+        private_key = ec.derive_private_key(
+            int.from_bytes(secret, "big"), ec.SECP256K1(), default_backend()
+        )
+        return private_key, private_key.public_key()
+    sk = ecdsa.SigningKey.from_string(secret, curve=ecdsa.SECP256k1)
+    vk = sk.get_verifying_key()
+    if hasattr(vk, "precompute"):  # pragma: no cover
+        vk.precompute()
+    return sk, vk
+
+
+def _secp256k1_context():
+    """ Process wide secp256k1 context (creating a context is expensive
+        compared to a signature, so it is created only once)
+    """
+    global _SECP256K1_CONTEXT
+    if _SECP256K1_CONTEXT is None:
+        _SECP256K1_CONTEXT = secp256k1.Base(None, secp256k1.ALL_FLAGS)
+    return _SECP256K1_CONTEXT.ctx
+
+
+_SECP256K1_CONTEXT = None
+
+
+def _secp256k1_sign(ctx, digest, p):
+    ffi = secp256k1.ffi
+    lib = secp256k1.lib
+    ndata = ffi.new("const int *ndata")
+    sig = ffi.new("secp256k1_ecdsa_recoverable_signature *")
+    output = ffi.new("unsigned char[64]")
+    recid = ffi.new("int *")
+    while True:
+        ndata[0] += 1
+        signed = lib.secp256k1_ecdsa_sign_recoverable(
+            ctx, sig, digest, p, ffi.NULL, ndata
+        )
+        if not signed == 1:  # pragma: no cover
+            raise AssertionError()
+        lib.secp256k1_ecdsa_recoverable_signature_serialize_compact(
+            ctx, output, recid, sig
+        )
+        signature = bytes(ffi.buffer(output, 64))
+        if _is_canonical(signature):
+            return signature, recid[0]
+
+
+def _ecdsa_mul_generator(k):
+    R = ecdsa.SECP256k1.generator * k
+    return R.x(), R.y()
+
+
+def _cryptography_mul_generator(k):
+    # OpenSSL only exposes k*G through a new key object (about 1ms)
+    R = (
+        ec.derive_private_key(k, ec.SECP256K1(), default_backend())
+        .public_key()
+        .public_numbers()
+    )
+    return R.x, R.y
+
+
+def _secp256k1_mul_generator(k):
+    ffi = secp256k1.ffi
+    lib = secp256k1.lib
+    ctx = _secp256k1_context()
+    pubkey = ffi.new("secp256k1_pubkey *")
+    if not lib.secp256k1_ec_pubkey_create(ctx, pubkey, k.to_bytes(32, "big")):
+        raise ValueError("Nonce is out of range")  # pragma: no cover
+    output = ffi.new("unsigned char[65]")
+    outputlen = ffi.new("size_t *", 65)
+    lib.secp256k1_ec_pubkey_serialize(
+        ctx, output, outputlen, pubkey, lib.SECP256K1_EC_UNCOMPRESSED
+    )
+    raw = bytes(ffi.buffer(output, 65))
+    return int.from_bytes(raw[1:33], "big"), int.from_bytes(raw[33:], "big")
+
+
+def _nonce_mul_generator():
+    """ Fastest available ``k*G`` for :func:`_canonical_signature`
+    """
+    if SECP256K1_AVAILABLE:
+        return _secp256k1_mul_generator
+    elif CRYPTOGRAPHY_AVAILABLE:
+        return _cryptography_mul_generator
+    return _ecdsa_mul_generator  # pragma: no cover
+
+
+def _canonical_signature(digest, secret, mul_generator):
+    """ Deterministic canonical signature of a digest
+
+        :param bytes digest: Digest to sign
+        :param secret: Raw private key (bytes) or its secret exponent (int)
+        :param mul_generator: Returns the coordinates ``(x, y)`` of ``k*G``
+        :return: Signature (r + s) and recovery id
+        :rtype: tuple
+
+        The nonce ``k`` is derived according to RFC6979. Since ``R = k*G``
+        is known, the recovery id is taken from the parity of ``R.y`` and
+        the overflow of ``R.x``. A high ``s`` is replaced by ``order - s``
+        (which flips the parity of the recovery id). Only if ``r`` or ``s``
+        do not have the canonical length, a new nonce is derived from the
+        digest and a counter.
+    """
+    order = ecdsa.SECP256k1.order
+    if isinstance(secret, int):
+        d = secret
+    else:
+        d = ecdsa.util.string_to_number(secret)
+    e = ecdsa.util.string_to_number(digest)
+    data = digest
+    attempt = 0
+    while True:
+        k = ecdsa.rfc6979.generate_k(order, d, hashlib.sha256, data)
+        x, y = mul_generator(k)
+        r = x % order
+        s = ecdsa.numbertheory.inverse_mod(k, order) * (e + r * d) % order
+        i = (y & 1) | (2 if x >= order else 0)
+        if s > order // 2:
+            s = order - s
+            i ^= 1
+        if r and s:
+            signature = ecdsa.util.sigencode_string(r, s, order)
+            if _is_canonical(signature):
+                return signature, i
+        attempt += 1
+        data = hashlib.sha256(digest + struct.pack("<I", attempt)).digest()
 
 
 def sign_message(message, wif, hashfn=hashlib.sha256):
@@ -163,106 +375,43 @@ def sign_message(message, wif, hashfn=hashlib.sha256):
         message = bytes(message, "utf-8")
 
     digest = hashfn(message).digest()
-    priv_key = PrivateKey(wif)
+    return sign_digest(digest, PrivateKey(wif))
+
+
+def sign_digest(digest, priv_key):
+    """ Sign a 32 byte digest with a private key
+
+        :param bytes digest: Digest to sign
+        :param PrivateKey priv_key: Private key (or wif)
+        :return: Compact signature (recovery parameter + r + s)
+        :rtype: bytes
+    """
+    if not isinstance(priv_key, PrivateKey):
+        priv_key = PrivateKey(priv_key)
     p = bytes(priv_key)
 
     if SECP256K1_MODULE == "secp256k1":
-        ndata = secp256k1.ffi.new("const int *ndata")
-        ndata[0] = 0
-        while True:
-            ndata[0] += 1
-            privkey = secp256k1.PrivateKey(p, raw=True)
-            sig = secp256k1.ffi.new("secp256k1_ecdsa_recoverable_signature *")
-            signed = secp256k1.lib.secp256k1_ecdsa_sign_recoverable(
-                privkey.ctx, sig, digest, privkey.private_key, secp256k1.ffi.NULL, ndata
-            )
-            if not signed == 1:  # pragma: no cover
-                raise AssertionError()
-            signature, i = privkey.ecdsa_recoverable_serialize(sig)
-            if _is_canonical(signature):
-                i += 4  # compressed
-                i += 27  # compact
-                break
+        signature, i = _secp256k1_sign(_secp256k1_context(), digest, p)
+        i += 4  # compressed
+        i += 27  # compact
     elif SECP256K1_MODULE == "cryptography":
-        cnt = 0
-        private_key = ec.derive_private_key(
-            int(repr(priv_key), 16), ec.SECP256K1(), default_backend()
+        private_key, public_key = signing_keys(p, SECP256K1_MODULE)
+        d = private_key.private_numbers().private_value
+        signature, i = _canonical_signature(digest, d, _nonce_mul_generator())
+        # Paranoia: verify the hand made signature with openssl (cheap)
+        r, s = ecdsa.util.sigdecode_string(signature, ecdsa.SECP256k1.order)
+        public_key.verify(
+            encode_dss_signature(r, s), digest, ec.ECDSA(Prehashed(hashes.SHA256()))
         )
-        public_key = private_key.public_key()
-        while True:
-            cnt += 1
-            if not cnt % 20:  # pragma: no cover
-                log.info(
-                    "Still searching for a canonical signature. Tried %d times already!"
-                    % cnt
-                )
-            order = ecdsa.SECP256k1.order
-            # signer = private_key.signer(ec.ECDSA(hashes.SHA256()))
-            # signer.update(message)
-            # sigder = signer.finalize()
-            sigder = private_key.sign(message, ec.ECDSA(hashes.SHA256()))
-            r, s = decode_dss_signature(sigder)
-            signature = ecdsa.util.sigencode_string(r, s, order)
-            # Make sure signature is canonical!
-            #
-            sigder = bytearray(sigder)
-            lenR = sigder[3]
-            lenS = sigder[5 + lenR]
-            if lenR is 32 and lenS is 32:
-                # Derive the recovery parameter
-                #
-                i = recoverPubkeyParameter(message, digest, signature, public_key)
-                i += 4  # compressed
-                i += 27  # compact
-                break
+        i += 4  # compressed
+        i += 27  # compact
     else:  # pragma: no branch # pragma: no cover
-        cnt = 0
-        sk = ecdsa.SigningKey.from_string(p, curve=ecdsa.SECP256k1)
-        while 1:
-            cnt += 1
-            if not cnt % 20:  # pragma: no branch
-                log.info(
-                    "Still searching for a canonical signature. Tried %d times already!"
-                    % cnt
-                )
-
-            # Deterministic k
-            #
-            k = ecdsa.rfc6979.generate_k(
-                sk.curve.generator.order(),
-                sk.privkey.secret_multiplier,
-                hashlib.sha256,
-                hashlib.sha256(
-                    digest
-                    + struct.pack(
-                        "d", time.time()
-                    )  # use the local time to randomize the signature
-                ).digest(),
-            )
-
-            # Sign message
-            #
-            sigder = sk.sign_digest(digest, sigencode=ecdsa.util.sigencode_der, k=k)
-
-            # Reformating of signature
-            #
-            r, s = ecdsa.util.sigdecode_der(sigder, sk.curve.generator.order())
-            signature = ecdsa.util.sigencode_string(r, s, sk.curve.generator.order())
-
-            # Make sure signature is canonical!
-            #
-            sigder = bytearray(sigder)
-            lenR = sigder[3]
-            lenS = sigder[5 + lenR]
-            if lenR is 32 and lenS is 32:
-                # Derive the recovery parameter
-                #
-                i = recoverPubkeyParameter(
-                    message, digest, signature, sk.get_verifying_key()
-                )
-                i += 4  # compressed
-                i += 27  # compact
-                break
+        sk = signing_keys(p, SECP256K1_MODULE)[0]
+        signature, i = _canonical_signature(
+            digest, sk.privkey.secret_multiplier, _ecdsa_mul_generator
+        )
+        i += 4  # compressed
+        i += 27  # compact
 
     # pack signature
     #
@@ -272,6 +421,15 @@ def sign_message(message, wif, hashfn=hashlib.sha256):
     return sigstr
 
 
+def sign_async(message, wif, hashfn=hashlib.sha256):
+    """ Like :func:`sign_message` but signs in the executor configured with
+        :func:`graphenebase.utils.set_executor`
+
+        :rtype: concurrent.futures.Future
+    """
+    return submit(sign_message, message, wif, hashfn)
+
+
 def verify_message(message, signature, hashfn=hashlib.sha256):
     if not isinstance(message, bytes):
         message = bytes(message, "utf-8")
@@ -286,20 +444,21 @@ def verify_message(message, signature, hashfn=hashlib.sha256):
     recoverParameter = bytearray(signature)[0] - 4 - 27  # recover parameter only
 
     if SECP256K1_MODULE == "secp256k1":
-        ALL_FLAGS = (
-            secp256k1.lib.SECP256K1_CONTEXT_VERIFY
-            | secp256k1.lib.SECP256K1_CONTEXT_SIGN
-        )
+        ctx = _secp256k1_context()
         # Placeholder
-        pub = secp256k1.PublicKey(flags=ALL_FLAGS)
+        pub = secp256k1.PublicKey(flags=secp256k1.ALL_FLAGS, ctx=ctx)
         # Recover raw signature
         sig = pub.ecdsa_recoverable_deserialize(sig, recoverParameter)
         # Recover PublicKey
-        verifyPub = secp256k1.PublicKey(pub.ecdsa_recover(message, sig))
+        verifyPub = secp256k1.PublicKey(
+            pub.ecdsa_recover(digest, sig, raw=True),
+            flags=secp256k1.ALL_FLAGS,
+            ctx=ctx,
+        )
         # Convert recoverable sig to normal sig
         normalSig = verifyPub.ecdsa_recoverable_convert(sig)
         # Verify
-        verifyPub.ecdsa_verify(message, normalSig)
+        verifyPub.ecdsa_verify(digest, normalSig, raw=True)
         phex = verifyPub.serialize(compressed=True)
     elif SECP256K1_MODULE == "cryptography":
         p = recover_public_key(digest, sig, recoverParameter, message)
@@ -317,6 +476,316 @@ def verify_message(message, signature, hashfn=hashlib.sha256):
     return phex
 
 
+def _verify_messages(pairs, hashfn=hashlib.sha256):
+    """ Worker of :func:`verify_messages` (runs in a separate process)
+    """
+    return [verify_message(message, signature, hashfn) for message, signature in pairs]
+
+
+def verify_messages(pairs, workers=None, chunksize=64, hashfn=hashlib.sha256):
+    """ Recover the public keys of many signed messages
+
+        :param list pairs: List of ``(message, signature)`` tuples
+        :param int workers: Spread the recoveries over this many processes
+            (defaults to the current process)
+        :param int chunksize: Number of signatures handed to a worker at once
+        :return: Compressed public key (bytes) for each pair, in order
+        :rtype: list
+
+        Pairs with the same digest and signature are only recovered once.
+        Raises the same exceptions as :func:`verify_message` if any of the
+        signatures is invalid.
+    """
+    keys = []
+    unique = OrderedDict()
+    for message, signature in pairs:
+        if not isinstance(message, bytes):
+            message = bytes(message, "utf-8")
+        if not isinstance(signature, bytes):  # pragma: no cover
+            signature = bytes(signature, "utf-8")
+        key = (hashfn(message).digest(), signature)
+        unique.setdefault(key, (message, signature))
+        keys.append(key)
+
+    results = map_chunked(
+        partial(_verify_messages, hashfn=hashfn), unique.values(), workers, chunksize
+    )
+    recovered = dict(zip(unique, results))
+    return [recovered[key] for key in keys]
+
+
+def _sign_digests(keys, digests):
+    """ Worker of :class:`BatchSigner` (runs in a separate process)
+    """
+    return BatchSigner(keys).sign_digests(digests)
+
+
+class BatchSigner(object):
+    """ Sign many digests, messages or transactions with the same set of
+        private keys
+
+        :param list wifkeys: Private keys (wif, ``PrivateKey`` or raw
+            32 bytes), duplicates are ignored
+        :param int workers: Spread batches over this many processes
+            (defaults to signing in the current process)
+        :param int chunksize: Number of digests handed to a worker at once
+
+        The keys are parsed only once and all signatures created with
+        ``secp256k1`` share one context::
+
+            signer = BatchSigner([wif1, wif2])
+            signer.sign_transactions(transactions, chain="GPH")
+    """
+
+    def __init__(self, wifkeys, workers=None, chunksize=64):
+        self.privkeys = []
+        self.keys = []
+        for wif in wifkeys:
+            if isinstance(wif, bytes) and len(wif) == 32:
+                wif = PrivateKey(hexlify(wif).decode("ascii"))
+            elif not isinstance(wif, PrivateKey):
+                wif = PrivateKey(wif)
+            key = bytes(wif)
+            if key not in self.keys:
+                self.keys.append(key)
+                self.privkeys.append(wif)
+        self.workers = workers
+        self.chunksize = chunksize
+
+    def sign_digest(self, digest):
+        """ Sign a digest with every key
+
+            :param bytes digest: Digest to sign
+            :return: One compact signature per key
+            :rtype: list
+        """
+        if SECP256K1_MODULE == "secp256k1":
+            ctx = _secp256k1_context()
+            sigs = []
+            for key in self.keys:
+                signature, i = _secp256k1_sign(ctx, digest, key)
+                sigs.append(struct.pack("<B", i + 4 + 27) + signature)
+            return sigs
+        return [sign_digest(digest, priv_key) for priv_key in self.privkeys]
+
+    def sign_digests(self, digests):
+        """ Sign a list of digests with every key
+
+            :param list digests: Digests to sign
+            :return: List of signatures (one list per digest)
+            :rtype: list
+        """
+        if not self.workers:
+            return [self.sign_digest(digest) for digest in digests]
+        return map_chunked(
+            partial(_sign_digests, self.keys), digests, self.workers, self.chunksize
+        )
+
+    def sign_messages(self, messages, hashfn=hashlib.sha256):
+        """ Sign a list of messages with every key
+
+            :param list messages: Messages to sign
+            :return: List of signatures (one list per message)
+            :rtype: list
+        """
+        digests = []
+        for message in messages:
+            if not isinstance(message, bytes):
+                message = bytes(message, "utf-8")
+            digests.append(hashfn(message).digest())
+        return self.sign_digests(digests)
+
+    def sign_transactions(self, transactions, chain=None):
+        """ Sign a list of transactions with every key
+
+            :param list transactions: Instances of
+                :class:`graphenebase.signedtransactions.Signed_Transaction`
+            :param str chain: identifier for the chain
+            :return: The signed transactions
+            :rtype: list
+        """
+        transactions = list(transactions)
+        for tx in transactions:
+            tx.deriveDigest(chain or tx.get_default_prefix())
+        sigs = self.sign_digests([tx.digest for tx in transactions])
+        for tx, tx_sigs in zip(transactions, sigs):
+            tx.data["signatures"] = Array([Signature(s) for s in tx_sigs])
+        return transactions
+
+
+#: Number of key sets whose :class:`BatchSigner` is kept (see
+#: :func:`batch_signer`)
+BATCH_SIGNER_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=BATCH_SIGNER_CACHE_SIZE)
+def _batch_signer(wifkeys):
+    return BatchSigner(wifkeys)
+
+
+def batch_signer(wifkeys):
+    """ Shared :class:`BatchSigner` (signing in the current process) for
+        a list of private keys
+
+        :param list wifkeys: Private keys (wif, ``PrivateKey`` or raw
+            32 bytes)
+        :rtype: BatchSigner
+
+        Signing with the same keys again reuses the parsed keys. Like the
+        other caches that are keyed by private keys, the cache is cleared
+        when a key store is locked.
+    """
+    return _batch_signer(tuple(wifkeys))
+
+
+class EcdsaCurve(object):
+    """ Curve arithmetic on raw keys using the pure python ``ecdsa`` library
+
+        Public keys are given and returned as compressed (33 bytes) keys,
+        private keys and scalars as 32 bytes (big endian). Subclasses route
+        operations to faster libraries; see :func:`curve`.
+    """
+
+    name = "ecdsa"
+
+    @staticmethod
+    def _point(pubkey):
+        return _public_key_point(hexlify(pubkey).decode("ascii"))
+
+    @staticmethod
+    def _compress(point):
+        return bytes([2 + (point.y() & 1)]) + point.x().to_bytes(32, "big")
+
+    @classmethod
+    def mul_generator(cls, secret):
+        """ Public key of a private key (``secret * G``)
+        """
+        return cls._compress(ecdsa.SECP256k1.generator * int.from_bytes(secret, "big"))
+
+    @classmethod
+    def mul(cls, pubkey, scalar):
+        """ Multiply a public key by a scalar
+        """
+        return cls._compress(cls._point(pubkey) * int.from_bytes(scalar, "big"))
+
+    @classmethod
+    def add(cls, pubkey, tweak):
+        """ Add ``tweak * G`` to a public key
+        """
+        point = cls._point(pubkey) + ecdsa.SECP256k1.generator * int.from_bytes(
+            tweak, "big"
+        )
+        return cls._compress(point)
+
+    @classmethod
+    def decompress(cls, pubkey):
+        """ Uncompressed (65 bytes) form of a compressed public key
+        """
+        assert pubkey[0] in (2, 3)
+        curve = ecdsa.SECP256k1.curve
+        x = int.from_bytes(pubkey[1:], "big")
+        # The curve equation over F_p is:
+        #   y^2 = x^3 + ax + b
+        a, b, p = curve.a(), curve.b(), curve.p()
+        alpha = (pow(x, 3, p) + a * x + b) % p
+        y = ecdsa.numbertheory.square_root_mod_prime(alpha, p)
+        if (y & 1) != (pubkey[0] & 1):
+            y = p - y
+        return b"\x04" + pubkey[1:] + y.to_bytes(32, "big")
+
+    @classmethod
+    def ecdh(cls, secret, pubkey):
+        """ Shared secret (the raw x coordinate of ``secret * pubkey``)
+        """
+        return cls.mul(pubkey, secret)[1:]
+
+
+class Secp256k1Curve(EcdsaCurve):
+    """ Curve arithmetic using libsecp256k1 (``secp256k1prp``)
+    """
+
+    name = "secp256k1"
+
+    @staticmethod
+    def _pubkey(pubkey):
+        return secp256k1.PublicKey(pubkey, raw=True, ctx=_secp256k1_context())
+
+    @classmethod
+    def mul_generator(cls, secret):
+        key = secp256k1.PrivateKey(secret, raw=True, ctx=_secp256k1_context())
+        return key.pubkey.serialize()
+
+    @classmethod
+    def _tweak(cls, func, pubkey, scalar):
+        # PublicKey.tweak_* copy the key into a new context, which is more
+        # expensive than the operation itself, so the key is tweaked in place
+        key = cls._pubkey(pubkey)
+        if not func(key.ctx, key.public_key, scalar):  # pragma: no cover
+            raise ValueError("Tweak is out of range")
+        return key.serialize()
+
+    @classmethod
+    def mul(cls, pubkey, scalar):
+        return cls._tweak(secp256k1.lib.secp256k1_ec_pubkey_tweak_mul, pubkey, scalar)
+
+    @classmethod
+    def add(cls, pubkey, tweak):
+        return cls._tweak(secp256k1.lib.secp256k1_ec_pubkey_tweak_add, pubkey, tweak)
+
+    @classmethod
+    def decompress(cls, pubkey):
+        return cls._pubkey(pubkey).serialize(compressed=False)
+
+
+class CryptographyCurve(EcdsaCurve):
+    """ Curve arithmetic using ``cryptography`` (OpenSSL)
+
+        .. note:: ``cryptography`` offers no arithmetic on arbitrary points,
+            hence :meth:`mul` and :meth:`add` use the ``ecdsa`` library.
+    """
+
+    name = "cryptography"
+
+    @staticmethod
+    def _pubkey(pubkey):
+        return ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), pubkey)
+
+    @classmethod
+    def mul_generator(cls, secret):
+        return (
+            signing_keys(secret, "cryptography")[1]
+            .public_bytes(Encoding.X962, PublicFormat.CompressedPoint)
+        )
+
+    @classmethod
+    def decompress(cls, pubkey):
+        return cls._pubkey(pubkey).public_bytes(
+            Encoding.X962, PublicFormat.UncompressedPoint
+        )
+
+    @classmethod
+    def ecdh(cls, secret, pubkey):
+        private_key = signing_keys(secret, "cryptography")[0]
+        return private_key.exchange(ec.ECDH(), cls._pubkey(pubkey))
+
+
+#: Curve arithmetic backends by module name (see :func:`curve`)
+curve_backends = {"ecdsa": EcdsaCurve}
+if CRYPTOGRAPHY_AVAILABLE:  # pragma: no branch
+    curve_backends["cryptography"] = CryptographyCurve
+if SECP256K1_AVAILABLE:  # pragma: no branch
+    curve_backends["secp256k1"] = Secp256k1Curve
+
+
+def curve(module=None):
+    """ Curve arithmetic backend
+
+        :param str module: Backend name (defaults to ``SECP256K1_MODULE``)
+        :rtype: EcdsaCurve
+    """
+    return curve_backends.get(module or SECP256K1_MODULE, EcdsaCurve)
+
+
 # def pointToPubkey(x, y, order=None):  # pragma: no cover
 #     """ This code is untested und thus not commented in. Waiting for unit tests of
 #         the original author.
@@ -327,14 +796,8 @@ def verify_message(message, signature, hashfn=hashlib.sha256):
 #
 
 
-def tweakaddPubkey(pk, digest256, SECP256K1_MODULE=SECP256K1_MODULE):
-    if SECP256K1_MODULE == "secp256k1":
-        tmp_key = secp256k1.PublicKey(pubkey=bytes(pk), raw=True)
-        new_key = tmp_key.tweak_add(digest256)  # <-- add
-        raw_key = hexlify(new_key.serialize()).decode("ascii")
-    else:
-        raise Exception("Must have secp256k1 for `tweak_add`")
-        # raw_key = ecmult(pk, 1, digest256, SECP256K1_MODULE)
+def tweakaddPubkey(pk, digest256, SECP256K1_MODULE=None):
+    raw_key = curve(SECP256K1_MODULE).add(bytes(pk), digest256)
     return PublicKey(raw_key, prefix=pk.prefix)
 
 
@@ -3,6 +3,10 @@ import struct
 import sys
 
 from binascii import hexlify, unhexlify
+from functools import lru_cache
+
+from . import ecdsa
+from .utils import map_chunked
 
 
 try:
@@ -17,6 +21,15 @@ except ImportError:
 assert sys.version_info[0] == 3, "this library requires python3"
 
 
+#: Number of shared secrets (per private/public key pair) that are cached
+SHARED_SECRET_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=SHARED_SECRET_CACHE_SIZE)
+def _shared_secret(secret, pubkey, module):
+    return hexlify(ecdsa.curve(module).ecdh(secret, pubkey)).decode("ascii")
+
+
 def get_shared_secret(priv, pub):
     """ Derive the share secret between ``priv`` and ``pub``
 
@@ -29,14 +42,20 @@ def get_shared_secret(priv, pub):
 
             Pub(Alice) * Priv(Bob) = Pub(Bob) * Priv(Alice)
 
+        The multiplication is done by the backend selected in
+        :data:`graphenebase.ecdsa.SECP256K1_MODULE` and the result is cached
+        per key pair (until a key store is locked).
+
+    """
+    return _shared_secret(bytes(priv), bytes(pub), ecdsa.SECP256K1_MODULE)
+
+
+@lru_cache(maxsize=SHARED_SECRET_CACHE_SIZE)
+def _shared_secret_digest(shared_secret):
+    """ Hex encoded sha512 of the shared secret (the nonce independent part
+        of the AES seed)
     """
-    pub_point = pub.point()
-    priv_point = int(repr(priv), 16)
-    res = pub_point * priv_point
-    res_hex = "%032x" % res.x()
-    # Zero padding
-    res_hex = "0" * (64 - len(res_hex)) + res_hex
-    return res_hex
+    return hexlify(hashlib.sha512(unhexlify(shared_secret)).digest())
 
 
 def init_aes(shared_secret, nonce):
@@ -48,14 +67,12 @@ def init_aes(shared_secret, nonce):
         :rtype: AES
 
     """
-    " Shared Secret "
-    ss = hashlib.sha512(unhexlify(shared_secret)).digest()
     " Seed "
-    seed = bytes(str(nonce), "ascii") + hexlify(ss)
-    seed_digest = hexlify(hashlib.sha512(seed).digest()).decode("ascii")
+    seed = bytes(str(nonce), "ascii") + _shared_secret_digest(shared_secret)
+    seed_digest = hashlib.sha512(seed).digest()
     " AES "
-    key = unhexlify(seed_digest[0:64])
-    iv = unhexlify(seed_digest[64:96])
+    key = seed_digest[0:32]
+    iv = seed_digest[32:48]
     return AES.new(key, AES.MODE_CBC, iv)
 
 
@@ -124,3 +141,41 @@ def decode_memo(priv, pub, nonce, message):
     if check != checksum:
         raise ValueError("checksum verification failure")
     return message.decode("utf8")
+
+
+def _decode_memos(items):
+    results = []
+    for priv, pub, nonce, message in items:
+        try:
+            results.append(decode_memo(priv, pub, nonce, message))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def decode_memos(items, workers=None, chunksize=64):
+    """ Decode many messages (see :func:`decode_memo`)
+
+        :param list items: List of ``(priv, pub, nonce, message)`` tuples
+        :param int workers: Decode in this many processes
+        :param int chunksize: Number of messages handed to a worker at once
+        :return: Decrypted messages in the order of ``items``. Messages that
+            could not be decoded are represented by the exception that was
+            raised.
+        :rtype: list
+
+        Messages are processed grouped by key pair so that every shared
+        secret is derived only once.
+    """
+    items = [
+        (bytes(priv), bytes(pub), nonce, message)
+        for priv, pub, nonce, message in items
+    ]
+    order = sorted(range(len(items)), key=lambda i: items[i][:2])
+    decoded = map_chunked(
+        _decode_memos, [items[i] for i in order], workers, chunksize
+    )
+    results = [None] * len(items)
+    for i, result in zip(order, decoded):
+        results[i] = result
+    return results
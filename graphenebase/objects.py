@@ -26,6 +26,7 @@ from graphenebase.types import (
     VoteId,
     ObjectId,
     JsonObj,
+    to_python,
 )
 from .chains import known_chains
 from .objecttypes import object_type
@@ -125,13 +126,24 @@ class Operation(list):
     def __json__(self):
         return [self.id, self.op.json()]
 
+    def to_python(self):
+        return self.__json__()
+
     def _getklass(self, name):
         module = __import__(self.module, fromlist=self.fromlist)
         class_ = getattr(module, name)
         return class_
 
     def klass(self):
-        return self._getklass(self.klass_name)
+        try:
+            return self._getklass(self.klass_name)
+        except AttributeError:
+            # Operations that are only defined declaratively
+            module = __import__(self.module, fromlist=self.fromlist)
+            schemas = getattr(module, "operation_schemas", None)
+            if schemas is None or self.name not in schemas:
+                raise
+            return schemas.klass(self.name)
 
     @property
     def ops(self):
@@ -162,6 +174,7 @@ class GrapheneObject(OrderedDict):
         This class is used for any JSON reflected object in Graphene.
 
         * ``instance.__json__()``: encodes data into json format
+        * ``instance.to_python()``: same as ``__json__()``
         * ``bytes(instance)``: encodes data into wire format
         * ``str(instances)``: dumps json object as string
 
@@ -191,22 +204,20 @@ class GrapheneObject(OrderedDict):
         return b
 
     def __json__(self):
-        if len(self) is 0:
+        if len(self) == 0:
             return {}
         d = {}  # JSON output is *not* ordered
         for name, value in self.items():
             if isinstance(value, Optional) and value.isempty():
                 continue
-
-            if isinstance(value, String):
-                d.update({name: str(value)})
-            else:
-                try:
-                    d.update({name: JsonObj(value)})
-                except Exception:
-                    d.update({name: value.__str__()})
+            d[name] = to_python(value)
         return d
 
+    def to_python(self):
+        """ Returns the object as native python types (no JSON round trip)
+        """
+        return self.__json__()
+
     def __str__(self):
         return json.dumps(self.__json__())
 
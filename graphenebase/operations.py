@@ -13,8 +13,19 @@ from .types import (
     ObjectId,
 )
 from .objects import GrapheneObject, isArgsThisClass
+from .schema import (
+    SchemaObject,
+    OperationSchemas,
+    Field,
+    ObjectIdField,
+    ExtensionsField,
+)
 from .account import PublicKey
 from .chains import default_prefix
+from .operationids import operations
+
+#: Declarative operation definitions (see :mod:`graphenebase.schema`)
+operation_schemas = OperationSchemas(operations)
 
 
 # Old style of defining an operation
@@ -56,14 +67,9 @@ class Newdemooepration2(GrapheneObject):
         )
 
 
-class Asset(GrapheneObject):
-    def detail(self, *args, **kwargs):
-        return OrderedDict(
-            [
-                ("amount", Int64(kwargs["amount"])),
-                ("asset_id", ObjectId(kwargs["asset_id"], "asset")),
-            ]
-        )
+# Declarative definition of an object
+class Asset(SchemaObject):
+    fields = [("amount", Int64), ("asset_id", ObjectIdField("asset"))]
 
 
 class Permission(GrapheneObject):
@@ -118,20 +124,19 @@ class AccountOptions(GrapheneObject):
         )
 
 
-# For more detailed unit testing
-class Account_create(GrapheneObject):
-    def detail(self, *args, **kwargs):
-        prefix = kwargs.get("prefix", default_prefix)
-        return OrderedDict(
-            [
-                ("fee", Asset(kwargs["fee"])),
-                ("registrar", ObjectId(kwargs["registrar"], "account")),
-                ("referrer", ObjectId(kwargs["referrer"], "account")),
-                ("referrer_percent", Uint16(kwargs["referrer_percent"])),
-                ("name", String(kwargs["name"])),
-                ("owner", Permission(kwargs["owner"], prefix=prefix)),
-                ("active", Permission(kwargs["active"], prefix=prefix)),
-                ("options", AccountOptions(kwargs["options"], prefix=prefix)),
-                ("extensions", Set([])),
-            ]
-        )
+# For more detailed unit testing, defined through the schema registry
+operation_schemas.register(
+    "account_create",
+    [
+        ("fee", Asset),
+        ("registrar", ObjectIdField("account")),
+        ("referrer", ObjectIdField("account")),
+        ("referrer_percent", Uint16),
+        ("name", String),
+        ("owner", Field(Permission, prefix=True)),
+        ("active", Field(Permission, prefix=True)),
+        ("options", Field(AccountOptions, prefix=True)),
+        ("extensions", ExtensionsField()),
+    ],
+)
+Account_create = operation_schemas.klass("account_create")
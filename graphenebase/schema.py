@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+
+from .types import Array, Set, Map, Optional, ObjectId, varintdecode2
+from .objects import GrapheneObject
+from .chains import default_prefix
+
+
+class Field:
+    """ Describes a single member of a :class:`SchemaObject`
+
+        :param klass: Type from :mod:`graphenebase.types` (or any
+            :class:`graphenebase.objects.GrapheneObject`) that wraps the value
+        :param bool prefix: Hand the network prefix to ``klass`` (e.g. for
+            public keys)
+
+        Instead of a ``Field``, the bare type can be used in the list of
+        fields, i.e. ``("amount", Int64)`` equals
+        ``("amount", Field(Int64))``.
+    """
+
+    #: Required fields need to be provided when instanciating the object
+    required = True
+    default = None
+
+    def __init__(self, klass, prefix=False):
+        self.klass = klass
+        self.prefix = prefix
+
+    def __call__(self, value, prefix=default_prefix):
+        if self.prefix:
+            return self.klass(value, prefix=prefix)
+        return self.klass(value)
+
+    def fromBytes(self, d, prefix=default_prefix):
+        if not hasattr(self.klass, "fromBytes"):
+            raise NotImplementedError(
+                "{} can not be deserialized".format(self.klass.__name__)
+            )
+        if self.prefix:
+            return self.klass.fromBytes(d, prefix=prefix)
+        return self.klass.fromBytes(d)
+
+
+class ObjectIdField(Field):
+    """ Object id of a given type, e.g. ``ObjectIdField("account")``
+    """
+
+    def __init__(self, type_name, klass=ObjectId):
+        self.klass = klass
+        self.type_name = type_name
+        self.id_prefix = "1.{}.".format(klass.object_types[type_name])
+
+    def __call__(self, value, prefix=default_prefix):
+        return self.klass(value, self.type_name)
+
+    def fromBytes(self, d, prefix=default_prefix):
+        return self.klass.fromBytes(d, prefix=self.id_prefix)
+
+
+class OptionalField(Field):
+    """ Optional member, ``None`` (or not provided) serializes as empty
+    """
+
+    required = False
+
+    def __init__(self, field):
+        self.field = as_field(field)
+
+    def __call__(self, value, prefix=default_prefix):
+        if value is None:
+            return Optional(None)
+        return Optional(self.field(value, prefix))
+
+    def fromBytes(self, d, prefix=default_prefix):
+        if not d[0]:
+            return Optional(None), d[1:]
+        value, d = self.field.fromBytes(d[1:], prefix)
+        return Optional(value), d
+
+
+class ArrayField(Field):
+    """ Array of elements of the same type
+
+        :param field: Type of the elements
+        :param klass: Container type (:class:`graphenebase.types.Array` or
+            :class:`graphenebase.types.Set`)
+    """
+
+    def __init__(self, field, klass=Array):
+        self.field = as_field(field)
+        self.klass = klass
+
+    def __call__(self, value, prefix=default_prefix):
+        return self.klass([self.field(x, prefix) for x in value])
+
+    def fromBytes(self, d, prefix=default_prefix):
+        count, length = varintdecode2(d)
+        d = d[length:]
+        values = []
+        for _ in range(count):
+            value, d = self.field.fromBytes(d, prefix)
+            values.append(value)
+        return self.klass(values), d
+
+
+class MapField(Field):
+    """ List of key/value pairs
+    """
+
+    def __init__(self, key, value):
+        self.key = as_field(key)
+        self.value = as_field(value)
+
+    def __call__(self, value, prefix=default_prefix):
+        return Map([[self.key(k, prefix), self.value(v, prefix)] for k, v in value])
+
+    def fromBytes(self, d, prefix=default_prefix):
+        count, length = varintdecode2(d)
+        d = d[length:]
+        pairs = []
+        for _ in range(count):
+            k, d = self.key.fromBytes(d, prefix)
+            v, d = self.value.fromBytes(d, prefix)
+            pairs.append([k, v])
+        return Map(pairs), d
+
+
+class ExtensionsField(Field):
+    """ The (unused) ``extensions`` member, always serialized as empty set
+    """
+
+    required = False
+
+    def __init__(self):
+        self.klass = Set
+
+    def __call__(self, value, prefix=default_prefix):
+        return Set([])
+
+    def fromBytes(self, d, prefix=default_prefix):
+        count, length = varintdecode2(d)
+        if count:
+            raise NotImplementedError("Extensions can not be deserialized")
+        return Set([]), d[length:]
+
+
+def as_field(spec):
+    """ Turn a type into a :class:`Field` (fields are returned as is)
+    """
+    if isinstance(spec, Field):
+        return spec
+    return Field(spec)
+
+
+class SchemaObject(GrapheneObject):
+    """ A :class:`graphenebase.objects.GrapheneObject` that is defined by a
+        list of ``(name, field)`` tuples instead of a hand-written
+        ``detail()``::
+
+            class Asset(SchemaObject):
+                fields = [
+                    ("amount", Int64),
+                    ("asset_id", ObjectIdField("asset")),
+                ]
+
+        Construction, validation and deserialization are derived from the
+        fields. The fields are normalized once per class on first use.
+    """
+
+    fields = []
+
+    @classmethod
+    def compiled_fields(cls):
+        """ Normalized fields of this class as tuple of ``(name, Field)``
+        """
+        compiled = cls.__dict__.get("_compiled_fields")
+        if compiled is None:
+            compiled = tuple((name, as_field(spec)) for name, spec in cls.fields)
+            cls._compiled_fields = compiled
+        return compiled
+
+    @classmethod
+    def validate(cls, data):
+        """ Make sure all required fields are present in ``data``
+
+            :param dict data: Data to instanciate the object with
+            :raises ValueError: if required fields are missing
+        """
+        missing = [
+            name
+            for name, field in cls.compiled_fields()
+            if field.required and name not in data
+        ]
+        if missing:
+            raise ValueError(
+                "Missing field(s) {} for {}".format(
+                    ", ".join(missing), cls.__name__
+                )
+            )
+
+    def detail(self, *args, **kwargs):
+        prefix = kwargs.get("prefix", default_prefix)
+        result = OrderedDict()
+        for name, field in self.compiled_fields():
+            if name in kwargs:
+                result[name] = field(kwargs[name], prefix)
+            elif field.required:
+                self.validate(kwargs)
+            else:
+                result[name] = field(field.default, prefix)
+        return result
+
+    @classmethod
+    def fromBytes(cls, d, prefix=default_prefix):
+        """ Deserialize an object from its wire format
+
+            :param bytes d: Data to read from
+            :param str prefix: Network prefix for public keys
+            :return: The object and the remaining data
+            :rtype: tuple
+        """
+        data = OrderedDict()
+        for name, field in cls.compiled_fields():
+            data[name], d = field.fromBytes(d, prefix)
+        obj = cls()
+        obj.update(data)
+        return obj, d
+
+
+class OperationSchemas(object):
+    """ Registry of declarative operation definitions
+
+        :param dict operations: Known operation ids (name to id). If
+            provided, only known operations can be registered.
+
+        Operations are registered with their name and their fields. The
+        corresponding :class:`SchemaObject` class is generated on first
+        use::
+
+            schemas = OperationSchemas(operations)
+            schemas.register("account_create", [("fee", Asset), ...])
+            Account_create = schemas.klass("account_create")
+
+        :class:`graphenebase.objects.Operation` falls back to an
+        ``operation_schemas`` registry in its operations module if no
+        hand-written class exists for an operation.
+    """
+
+    def __init__(self, operations=None):
+        self.operations = operations
+        self._fields = dict()
+        self._klasses = dict()
+
+    def register(self, name, fields):
+        """ Register (or replace) the fields of operation ``name``
+        """
+        if self.operations is not None and name not in self.operations:
+            raise ValueError("Unknown operation {}".format(name))
+        self._fields[name] = list(fields)
+        self._klasses.pop(name, None)
+
+    def unregister(self, name):
+        """ Remove the definition of operation ``name``
+        """
+        del self._fields[name]
+        self._klasses.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._fields
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def klass(self, name):
+        """ Return the (generated) class for operation ``name``
+        """
+        if name not in self._klasses:
+            klass_name = name[0].upper() + name[1:]
+            self._klasses[name] = type(
+                klass_name, (SchemaObject,), {"fields": self._fields[name]}
+            )
+        return self._klasses[name]
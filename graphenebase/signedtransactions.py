@@ -5,7 +5,7 @@ import logging
 
 # We load 'ecdsa' from installation and .ecdsa from relative
 # import ecdsa
-from .ecdsa import sign_message, verify_message
+from .ecdsa import sign_message, verify_message, verify_messages, batch_signer
 
 from binascii import hexlify, unhexlify
 from collections import OrderedDict
@@ -158,12 +158,12 @@ class Signed_Transaction(GrapheneObject):
         chain_params = self.getChainParams(chain)
         self.deriveDigest(chain)
         signatures = self.data["signatures"].data
-        pubKeysFound = []
-
-        for signature in signatures:
-            p = verify_message(self.message, bytes(signature))
-            phex = hexlify(p).decode("ascii")
-            pubKeysFound.append(phex)
+        pubKeysFound = [
+            hexlify(p).decode("ascii")
+            for p in verify_messages(
+                [(self.message, bytes(signature)) for signature in signatures]
+            )
+        ]
 
         for pubkey in pubkeys:
             if not isinstance(pubkey, PublicKey):
@@ -194,10 +194,8 @@ class Signed_Transaction(GrapheneObject):
                 self.privkeys.append(item)
 
         # Sign the message with every private key given!
-        sigs = []
-        for wif in self.privkeys:
-            signature = sign_message(self.message, wif)
-            sigs.append(Signature(signature))
+        signer = batch_signer(self.privkeys)
+        sigs = [Signature(signature) for signature in signer.sign_digest(self.digest)]
 
         self.data["signatures"] = Array(sigs)
         return self
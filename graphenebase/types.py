@@ -2,6 +2,7 @@
 import json
 import struct
 import time
+from functools import lru_cache
 from calendar import timegm
 from binascii import hexlify, unhexlify
 from .objecttypes import object_type
@@ -10,44 +11,91 @@ from .utils import unicodify
 timeformat = "%Y-%m-%dT%H:%M:%S%Z"
 
 
+#: Pre-encoded varints for all values that fit into a single byte
+_varint_table = [bytes([i]) for i in range(0x80)]
+
+
 def varint(n):
     """ Varint encoding
     """
-    data = b""
+    if n < 0x80:
+        return _varint_table[n]
+    data = bytearray()
     while n >= 0x80:
-        data += bytes([(n & 0x7F) | 0x80])
+        data.append((n & 0x7F) | 0x80)
         n >>= 7
-    data += bytes([n])
-    return data
+    data.append(n)
+    return bytes(data)
 
 
-def varintdecode(data):  # pragma: no cover
+def varint_many(values):
+    """ Varint encoding of a sequence of integers into one buffer
+    """
+    table = _varint_table
+    data = bytearray()
+    for n in values:
+        if n < 0x80:
+            data += table[n]
+            continue
+        while n >= 0x80:
+            data.append((n & 0x7F) | 0x80)
+            n >>= 7
+        data.append(n)
+    return bytes(data)
+
+
+def varintdecode(data):
     """ Varint decoding
     """
-    shift = 0
-    result = 0
-    for b in bytes(data):
-        result |= (b & 0x7F) << shift
-        if not (b & 0x80):
-            break
-        shift += 7
-    return result
+    return varintdecode2(data)[0]
 
 
-def varintdecode2(data):
+def varintdecode2(data, offset=0):
     """ Varint decoding (with length counting)
+
+        :param data: ``bytes``, ``bytearray`` or ``memoryview`` to read from
+        :param int offset: Position of the varint in ``data`` (no slicing
+            is required to read from the middle of a buffer)
+        :return: Decoded value and number of bytes consumed
+        :rtype: tuple
+        :raises ValueError: if the buffer ends in the middle of the varint
     """
-    nbytes = 0
+    end = len(data)
+    if offset < end and data[offset] < 0x80:
+        return data[offset], 1
+    pos = offset
     shift = 0
     result = 0
-    for c in data:
-        b = c # ord(c) not needed, `data` is bytes
-        result |= ((b & 0x7f) << shift)
-        nbytes += 1
+    while pos < end:
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
         if not (b & 0x80):
-            break
+            return result, pos - offset
         shift += 7
-    return result, nbytes
+    if pos > offset:
+        raise ValueError("Truncated varint at offset %d" % offset)
+    return result, 0
+
+
+def varintdecode_many(data, count, offset=0):
+    """ Decode ``count`` consecutive varints
+
+        :param data: ``bytes``, ``bytearray`` or ``memoryview`` to read from
+        :param int count: Number of varints to decode
+        :param int offset: Position of the first varint in ``data``
+        :return: List of decoded values and number of bytes consumed
+        :rtype: tuple
+    """
+    values = []
+    pos = offset
+    for _ in range(count):
+        value, length = varintdecode2(data, pos)
+        if not length:
+            raise ValueError("Buffer too short for %d varints" % count)
+        values.append(value)
+        pos += length
+    return values, pos - offset
 
 
 def variable_buffer(s):
@@ -62,7 +110,26 @@ def JsonObj(data):
     return json.loads(str(data))
 
 
+def to_python(value):
+    """ Returns the native python representation (dict, list, str, int,
+        ...) of ``value``.
+
+        Objects that implement ``to_python()`` are converted directly,
+        everything else is converted through :func:`JsonObj` and falls
+        back to ``str()``.
+    """
+    method = getattr(value, "to_python", None)
+    if method is not None:
+        return method()
+    try:
+        return JsonObj(value)
+    except Exception:
+        return str(value)
+
+
 class Uint8:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = int(d)
 
@@ -72,8 +139,17 @@ class Uint8:
     def __str__(self):
         return "%d" % self.data
 
+    def to_python(self):
+        return self.data
+
+    @staticmethod
+    def fromBytes(d):
+        return Uint8(struct.unpack_from("<B", d)[0]), d[1:]
+
 
 class Int16:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = int(d)
 
@@ -83,8 +159,17 @@ class Int16:
     def __str__(self):
         return "%d" % self.data
 
+    def to_python(self):
+        return self.data
+
+    @staticmethod
+    def fromBytes(d):
+        return Int16(struct.unpack_from("<h", d)[0]), d[2:]
+
 
 class Uint16:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = int(d)
 
@@ -94,8 +179,17 @@ class Uint16:
     def __str__(self):
         return "%d" % self.data
 
+    def to_python(self):
+        return self.data
+
+    @staticmethod
+    def fromBytes(d):
+        return Uint16(struct.unpack_from("<H", d)[0]), d[2:]
+
 
 class Uint32:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = int(d)
 
@@ -105,6 +199,9 @@ class Uint32:
     def __str__(self):
         return "%d" % self.data
 
+    def to_python(self):
+        return self.data
+
     @staticmethod
     def fromBytes(d):
        val = struct.unpack("<I", d[:4]) [0]
@@ -112,6 +209,8 @@ class Uint32:
 
 
 class Uint64:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = int(d)
 
@@ -121,8 +220,17 @@ class Uint64:
     def __str__(self):
         return "%d" % self.data
 
+    def to_python(self):
+        return self.data
+
+    @staticmethod
+    def fromBytes(d):
+        return Uint64(struct.unpack_from("<Q", d)[0]), d[8:]
+
 
 class Varint32:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = int(d)
 
@@ -132,8 +240,18 @@ class Varint32:
     def __str__(self):
         return "%d" % self.data
 
+    def to_python(self):
+        return self.data
+
+    @staticmethod
+    def fromBytes(d):
+        val, vallen = varintdecode2(d)
+        return Varint32(val), d[vallen:]
+
 
 class Int64:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = int(d)
 
@@ -143,6 +261,9 @@ class Int64:
     def __str__(self):
         return "%d" % self.data
 
+    def to_python(self):
+        return self.data
+
     @staticmethod
     def fromBytes(d):
        val = struct.unpack("<q", d[:8]) [0]
@@ -151,11 +272,15 @@ class Int64:
 
 
 class String:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = d
 
     def __bytes__(self):
-        if self.data:
+        if isinstance(self.data, bytes):
+            d = self.data  # as read by fromBytes()
+        elif self.data:
             d = unicodify(self.data)
         else:
             d = b""
@@ -164,15 +289,19 @@ class String:
     def __str__(self):
         return "%s" % str(self.data)
 
+    def to_python(self):
+        return str(self.data)
+
     @staticmethod
     def fromBytes(d):
         vallen, lenlen = varintdecode2(d)
-        d = d[lenlen:]
-        val = d[:vallen]
-        return String(val), d[vallen:]
+        end = lenlen + vallen
+        return String(d[lenlen:end]), d[end:]
 
 
 class Bytes:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = d
 
@@ -186,15 +315,18 @@ class Bytes:
     def __json__(self):
         return str(self)
 
+    to_python = __json__
+
     @staticmethod
     def fromBytes(d):
         vallen, lenlen = varintdecode2(d)
-        d = d[lenlen:]
-        val = d[:vallen]
-        return Bytes(val), d[vallen:]
+        end = lenlen + vallen
+        return Bytes(d[lenlen:end]), d[end:]
 
 
 class Fixed_Bytes():
+    __slots__ = ("data", "length")
+
     def __init__(self, d, length=None):
         if isinstance(d, str):
             d = unhexlify(bytes(d, 'utf-8'))
@@ -214,6 +346,8 @@ class Fixed_Bytes():
     def __json__(self):
         return str(self)
 
+    to_python = __json__
+
     @staticmethod
     def fromBytes(d, vallen):
         val = d[:vallen]
@@ -221,6 +355,8 @@ class Fixed_Bytes():
 
 
 class Void:
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -230,8 +366,13 @@ class Void:
     def __str__(self):
         return ""
 
+    def to_python(self):
+        return ""
+
 
 class Array:
+    __slots__ = ("data", "length")
+
     def __init__(self, d):
         self.data = d or []
         self.length = Varint32(len(self.data))
@@ -240,16 +381,15 @@ class Array:
         return bytes(self.length) + b"".join([bytes(a) for a in self.data])
 
     def __str__(self):
-        r = []
-        for a in self.data:
-            try:
-                r.append(JsonObj(a))
-            except Exception:
-                r.append(str(a))
-        return json.dumps(r)
+        return json.dumps(self.to_python())
+
+    def to_python(self):
+        return [to_python(a) for a in self.data]
 
 
 class PointInTime:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = d
 
@@ -259,8 +399,18 @@ class PointInTime:
     def __str__(self):
         return self.data
 
+    def to_python(self):
+        return self.data
+
+    @staticmethod
+    def fromBytes(d):
+        t = time.gmtime(struct.unpack_from("<I", d)[0])
+        return PointInTime(time.strftime("%Y-%m-%dT%H:%M:%S", t)), d[4:]
+
 
 class Signature:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = d
 
@@ -268,18 +418,32 @@ class Signature:
         return self.data
 
     def __str__(self):
-        return json.dumps(hexlify(self.data).decode("ascii"))
+        return json.dumps(self.to_python())
+
+    def to_python(self):
+        return hexlify(self.data).decode("ascii")
 
 
 class Bool(Uint8):  # Bool = Uint8
+    __slots__ = ()
+
     def __init__(self, d):
         super().__init__(d)
 
     def __str__(self):
         return json.dumps(True) if self.data else json.dumps(False)
 
+    def to_python(self):
+        return bool(self.data)
+
+    @staticmethod
+    def fromBytes(d):
+        return Bool(struct.unpack_from("<B", d)[0]), d[1:]
+
 
 class Set(Array):  # Set = Array
+    __slots__ = ()
+
     def __init__(self, d):
         super().__init__(d)
 
@@ -289,6 +453,8 @@ class Fixed_array:
 
 
 class Optional:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = d
 
@@ -305,6 +471,9 @@ class Optional:
     def __str__(self):
         return str(self.data)
 
+    def to_python(self):
+        return to_python(self.data)
+
     def isempty(self):
         if self.data is None:
             return True
@@ -321,6 +490,8 @@ class Optional:
         return Optional(v), d
 
 class Static_variant:
+    __slots__ = ("data", "type_id")
+
     def __init__(self, d, type_id):
         self.data = d
         self.type_id = type_id
@@ -329,10 +500,15 @@ class Static_variant:
         return varint(self.type_id) + bytes(self.data)
 
     def __str__(self):
-        return json.dumps([self.type_id, self.data.json()])
+        return json.dumps(self.to_python())
+
+    def to_python(self):
+        return [self.type_id, self.data.json()]
 
 
 class Map:
+    __slots__ = ("data",)
+
     def __init__(self, data):
         self.data = data
 
@@ -344,13 +520,15 @@ class Map:
         return b
 
     def __str__(self):
-        r = []
-        for e in self.data:
-            r.append([str(e[0]), str(e[1])])
-        return json.dumps(r)
+        return json.dumps(self.to_python())
+
+    def to_python(self):
+        return [[str(e[0]), str(e[1])] for e in self.data]
 
 
 class Id:
+    __slots__ = ("data",)
+
     def __init__(self, d):
         self.data = Varint32(d)
 
@@ -360,8 +538,13 @@ class Id:
     def __str__(self):
         return str(self.data)
 
+    def to_python(self):
+        return self.data.data
+
 
 class VoteId:
+    __slots__ = ("type", "instance")
+
     def __init__(self, vote):
         parts = vote.split(":")
         assert len(parts) == 2
@@ -375,38 +558,117 @@ class VoteId:
     def __str__(self):
         return "%d:%d" % (self.type, self.instance)
 
+    def to_python(self):
+        return str(self)
+
+    @staticmethod
+    def fromBytes(d):
+        binary = struct.unpack_from("<I", d)[0]
+        return VoteId("%d:%d" % (binary & 0xFF, binary >> 8)), d[4:]
+
+
+#: Number of distinct object ids that are kept parsed/interned
+OBJECT_ID_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=OBJECT_ID_CACHE_SIZE)
+def parse_object_id(object_str):
+    """ Split an object id of the form ``space.type.instance``
+
+        :param str object_str: Object id, e.g. ``1.2.0``
+        :return: ``(space, type, instance)`` as integers
+        :rtype: tuple
+        :raises ValueError: if ``object_str`` is not a valid object id
+
+        Results are cached, so that frequently used ids are only parsed once.
+    """
+    parts = object_str.split(".")
+    if len(parts) != 3:
+        raise ValueError("Object id is invalid")
+    return tuple(int(x) for x in parts)
+
+
+@lru_cache(maxsize=OBJECT_ID_CACHE_SIZE)
+def _interned_object_id(cls, object_str):
+    """ Create the single shared instance of ``cls`` for ``object_str``
+    """
+    return _load_object_id(cls, object_str)
+
+
+def _load_object_id(cls, object_str):
+    obj = object.__new__(cls)
+    obj._load(object_str, *parse_object_id(object_str))
+    return obj
+
+
+def _is_interned(cls, base):
+    """ Instances of ``cls`` are interned (and immutable) unless it defines
+        an ``__init__`` of its own (e.g. to set further attributes)
+    """
+    return cls.__init__ is base.__init__
+
 
 class ObjectId:
     """ Encodes protocol ids - serializes to the *instance* only!
+
+        Instances are immutable and interned, i.e. ``ObjectId("1.3.0")``
+        returns the same object every time it is called and setting an
+        attribute raises ``AttributeError``.
+
+        Subclasses that define their own ``__init__`` get a new (mutable)
+        instance on every call instead, so that they can set attributes.
     """
 
+    __slots__ = ("space", "type", "instance", "Id", "_bytes")
+
     object_types = object_type
 
+    def __new__(cls, object_str, type_verify=None, *args, **kwargs):
+        if type_verify:
+            cls._verify_type(object_str, type_verify)
+        if _is_interned(cls, ObjectId):
+            return _interned_object_id(cls, object_str)
+        return _load_object_id(cls, object_str)
+
     def __init__(self, object_str, type_verify=None):
-        if len(object_str.split(".")) == 3:
-            space, type, id = object_str.split(".")
-            self.space = int(space)
-            self.type = int(type)
-            self.instance = Id(int(id))
-            self.Id = object_str
-            if type_verify:
-                assert (
-                    type_verify in self.object_types
-                ), "Type {} is not defined!".format(type_verify)
-                assert self.object_types[type_verify] == int(type), (
-                    "Object id does not match object type! "
-                    + "Excpected %d, got %d"
-                    % (self.object_types[type_verify], int(type))
-                )
-        else:
-            raise Exception("Object id is invalid")
+        # Everything is done in __new__
+        pass
+
+    @classmethod
+    def _verify_type(cls, object_str, type_verify):
+        assert type_verify in cls.object_types, "Type {} is not defined!".format(
+            type_verify
+        )
+        type = parse_object_id(object_str)[1]
+        assert cls.object_types[type_verify] == type, (
+            "Object id does not match object type! "
+            + "Excpected %d, got %d" % (cls.object_types[type_verify], type)
+        )
+
+    def _load(self, object_str, space, type, id):
+        object.__setattr__(self, "space", space)
+        object.__setattr__(self, "type", type)
+        object.__setattr__(self, "instance", Id(id))
+        object.__setattr__(self, "Id", object_str)
+        object.__setattr__(self, "_bytes", varint(id))
+
+    def __setattr__(self, name, value):
+        if _is_interned(type(self), ObjectId):
+            raise AttributeError("{} is immutable".format(self.__class__.__name__))
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return (self.__class__, (self.Id,))
 
     def __bytes__(self):
-        return bytes(self.instance)  # only yield instance
+        return self._bytes  # only yield instance
 
     def __str__(self):
         return self.Id
 
+    def to_python(self):
+        return self.Id
+
     @staticmethod
     def fromBytes(d, prefix="1.2."):
         val, vallen = varintdecode2(d)
@@ -415,29 +677,52 @@ class ObjectId:
 
 class FullObjectId:
     """ Encodes object ids - serializes to a full object id
+
+        Instances are immutable and interned (see :class:`ObjectId`).
     """
 
-    def __init__(self, object_str):
-        if len(object_str.split(".")) == 3:
-            space, type, id = object_str.split(".")
-            self.space = int(space)
-            self.type = int(type)
-            self.id = int(id)
-            self.instance = Id(int(id))
-            self.Id = object_str
-        else:
-            raise ValueError("Object id is invalid")
+    __slots__ = ("space", "type", "id", "instance", "Id", "_bytes")
+
+    def __new__(cls, object_str, *args, **kwargs):
+        if _is_interned(cls, FullObjectId):
+            return _interned_object_id(cls, object_str)
+        return _load_object_id(cls, object_str)
+
+    def _load(self, object_str, space, type, id):
+        object.__setattr__(self, "space", space)
+        object.__setattr__(self, "type", type)
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "instance", Id(id))
+        object.__setattr__(self, "Id", object_str)
+        object.__setattr__(
+            self,
+            "_bytes",
+            (space << 56 | type << 48 | id).to_bytes(
+                8, byteorder="little", signed=False
+            ),
+        )
+
+    def __setattr__(self, name, value):
+        if _is_interned(type(self), FullObjectId):
+            raise AttributeError("{} is immutable".format(self.__class__.__name__))
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return (self.__class__, (self.Id,))
 
     def __bytes__(self):
-        return (self.space << 56 | self.type << 48 | self.id).to_bytes(
-            8, byteorder="little", signed=False
-        )
+        return self._bytes
 
     def __str__(self):
         return self.Id
 
+    def to_python(self):
+        return self.Id
+
 
 class Enum8(Uint8):
+    __slots__ = ()
+
     # List needs to be provided by super class
     options = []
 
@@ -453,3 +738,6 @@ class Enum8(Uint8):
 
     def __str__(self):
         return str(self.options[self.data])
+
+    def to_python(self):
+        return str(self)
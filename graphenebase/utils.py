@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import os
 import sys
 import time
 from datetime import datetime, timezone
@@ -66,5 +67,145 @@ def parse_time(block_time):
     return datetime.strptime(block_time, timeFormat).replace(tzinfo=timezone.utc)
 
 
+def map_chunked(func, items, workers=None, chunksize=64):
+    """ Apply ``func`` to chunks of ``items`` and join the results
+
+        :param func: Function that takes a list of items and returns a list
+            of results (needs to be defined at module level if ``workers``
+            are used)
+        :param list items: Items to process
+        :param int workers: Process the chunks in this many processes
+            (defaults to the current process)
+        :param int chunksize: Number of items handed to a worker at once
+        :rtype: list
+
+        The processes are started on first use and shared by all calls with
+        the same number of ``workers`` (see :func:`get_executor`).
+    """
+    items = list(items)
+    if not workers or len(items) <= chunksize:
+        return list(func(items))
+
+    from concurrent.futures.process import BrokenProcessPool
+
+    chunks = [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+    results = []
+    try:
+        for result in _process_pool(workers).map(func, chunks):
+            results.extend(result)
+    except BrokenProcessPool:
+        # A worker died, start new processes next time
+        _shutdown_pool(workers)
+        raise
+    return results
+
+
+#: Process pools by number of workers, shared by map_chunked and the default
+#: executor
+_POOLS = {}
+
+
+def _process_pool(workers):
+    """ ``ProcessPoolExecutor`` with ``workers`` processes (created once per
+        process, as starting the workers is costly compared to most batches)
+    """
+    pid, pool = _POOLS.get(workers, (None, None))
+    if pid != os.getpid():
+        # Pools of the parent are not usable after a fork
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+        _POOLS[workers] = (os.getpid(), pool)
+    return pool
+
+
+def _shutdown_pool(workers):
+    pid, pool = _POOLS.pop(workers, (None, None))
+    if pid == os.getpid():
+        pool.shutdown(wait=False)
+
+
+_EXECUTOR = None
+_EXECUTOR_WORKERS = None
+_EXECUTOR_OWNED = False
+
+
+def set_executor(executor=None, workers=None):
+    """ Configure the executor that runs the ``*_async`` calls (e.g.
+        :func:`graphenebase.ecdsa.sign_async`)
+
+        :param executor: A :class:`concurrent.futures.Executor`. If ``None``,
+            a ``ProcessPoolExecutor`` with ``workers`` processes is created
+            on first use.
+        :param int workers: Number of processes of the default executor
+            (defaults to the number of CPUs)
+
+        A default executor that was created before is shut down.
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS, _EXECUTOR_OWNED
+    if _EXECUTOR is not None and _EXECUTOR_OWNED:
+        _shutdown_pool(_EXECUTOR_WORKERS)
+    _EXECUTOR = executor
+    _EXECUTOR_WORKERS = workers
+    _EXECUTOR_OWNED = False
+
+
+def get_executor():
+    """ Executor that runs the ``*_async`` calls (see :func:`set_executor`)
+
+        The default executor is the process pool that :func:`map_chunked`
+        uses for the same number of workers.
+    """
+    global _EXECUTOR, _EXECUTOR_OWNED
+    if _EXECUTOR is None or _EXECUTOR_OWNED:
+        # Also replaces a broken pool or one of the parent process
+        _EXECUTOR = _process_pool(_EXECUTOR_WORKERS)
+        _EXECUTOR_OWNED = True
+    return _EXECUTOR
+
+
+def submit(func, *args, **kwargs):
+    """ Run ``func(*args, **kwargs)`` in the configured executor
+
+        :rtype: concurrent.futures.Future
+
+        The future can be awaited from asyncio code with
+        ``await asyncio.wrap_future(future)``.
+    """
+    return get_executor().submit(func, *args, **kwargs)
+
+
+def chain_future(future, func):
+    """ Future that resolves to ``func(future.result())``
+
+        ``func`` is called in the thread that completes ``future`` and may
+        raise to fail the returned future.
+
+        :rtype: concurrent.futures.Future
+    """
+    from concurrent.futures import Future
+
+    chained = Future()
+
+    def done(f):
+        try:
+            chained.set_result(func(f.result()))
+        except Exception as e:
+            chained.set_exception(e)
+
+    future.add_done_callback(done)
+    return chained
+
+
+def completed_future(result):
+    """ Future that is already resolved to ``result``
+    """
+    from concurrent.futures import Future
+
+    future = Future()
+    future.set_result(result)
+    return future
+
+
 # Legacy names
 formatTimeString = formatTime
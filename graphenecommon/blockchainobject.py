@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from datetime import datetime, timedelta
+from graphenebase.types import parse_object_id
 from .instance import AbstractBlockchainInstanceProvider
 
 
@@ -292,13 +293,10 @@ class BlockchainObject(Caching, dict):
         """
         if "." not in i:
             return False
-        parts = i.split(".")
-        if len(parts) == 3:
-            try:
-                [int(x) for x in parts]
-                return True
-            except Exception:
-                pass
+        try:
+            parse_object_id(i)
+            return True
+        except Exception:
             return False
 
     def test_valid_objectid(self, i):
@@ -310,17 +308,17 @@ class BlockchainObject(Caching, dict):
         """ In contrast to validity, this method tests if the objectid
             matches the type_id provided in self.type_id or self.type_ids
         """
-        parts = id.split(".")
         if not self.type_id:
             return
+        space, type, _ = parse_object_id(id)
 
         if not self.type_ids:
             self.type_ids = [self.type_id]
 
-        assert int(parts[0]) == self.space_id, "Valid id's for {} are {}.{}.x".format(
+        assert space == self.space_id, "Valid id's for {} are {}.{}.x".format(
             self.__class__.__name__, self.space_id, self.type_id
         )
-        assert int(parts[1]) in self.type_ids, "Valid id's for {} are {}.{}.x".format(
+        assert type in self.type_ids, "Valid id's for {} are {}.{}.x".format(
             self.__class__.__name__, self.space_id, self.type_ids
         )
 
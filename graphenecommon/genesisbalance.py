@@ -1,9 +1,38 @@
 # -*- coding: utf-8 -*-
+from graphenebase.account import Address, derive_addresses, GENESIS_ADDRESS_VARIANTS
 from .blockchainobject import BlockchainObject
 from .exceptions import GenesisBalanceDoesNotExistsException, MissingKeyError
 from .instance import AbstractBlockchainInstanceProvider
 
 
+def _genesis_addresses(instance, pubkeys):
+    """ Addresses (str) of all :data:`GENESIS_ADDRESS_VARIANTS` of the
+        public keys, formatted with ``instance.address_class`` and the
+        prefix of the blockchain instance
+    """
+    address_class = instance.address_class
+    prefix = instance.blockchain.prefix
+    if getattr(address_class.from_pubkey, "__func__", None) is not (
+        Address.from_pubkey.__func__
+    ):
+        # Custom address derivation
+        return [
+            [
+                str(
+                    address_class.from_pubkey(
+                        pubkey, compressed=compressed, version=version, prefix=prefix
+                    )
+                )
+                for compressed, version in GENESIS_ADDRESS_VARIANTS
+            ]
+            for pubkey in pubkeys
+        ]
+    return [
+        [str(address_class(address, prefix=prefix)) for address in derived]
+        for derived in derive_addresses(pubkeys, prefix=prefix, raw=True)
+    ]
+
+
 class GenesisBalance(BlockchainObject, AbstractBlockchainInstanceProvider):
     """ Deals with Assets of the network.
 
@@ -52,24 +81,13 @@ class GenesisBalance(BlockchainObject, AbstractBlockchainInstanceProvider):
         if not account:
             raise ValueError("You need to provide an account")
         account = self.account_class(account)
-        pubkeys = self.blockchain.wallet.getPublicKeys()
+        pubkeys = [
+            self.publickey_class(p) for p in self.blockchain.wallet.getPublicKeys()
+        ]
         addresses = dict()
-        for p in pubkeys:
-            pubkey = self.publickey_class(p)
-            addresses[
-                str(self.address_class.from_pubkey(pubkey, compressed=False, version=0))
-            ] = pubkey
-            addresses[
-                str(self.address_class.from_pubkey(pubkey, compressed=True, version=0))
-            ] = pubkey
-            addresses[
-                str(
-                    self.address_class.from_pubkey(pubkey, compressed=False, version=56)
-                )
-            ] = pubkey
-            addresses[
-                str(self.address_class.from_pubkey(pubkey, compressed=True, version=56))
-            ] = pubkey
+        for pubkey, derived in zip(pubkeys, _genesis_addresses(self, pubkeys)):
+            for address in derived:
+                addresses[address] = pubkey
 
         if self["owner"] not in addresses.keys():
             raise MissingKeyError("Need key for address {}".format(self["owner"]))
@@ -102,24 +120,12 @@ class GenesisBalances(list, AbstractBlockchainInstanceProvider):
         assert self.publickey_class
         assert self.address_class
 
-        pubkeys = self.blockchain.wallet.getPublicKeys()
+        pubkeys = [
+            self.publickey_class(p) for p in self.blockchain.wallet.getPublicKeys()
+        ]
         addresses = list()
-        for p in pubkeys:
-            pubkey = self.publickey_class(p)
-            addresses.append(
-                str(self.address_class.from_pubkey(pubkey, compressed=False, version=0))
-            )
-            addresses.append(
-                str(self.address_class.from_pubkey(pubkey, compressed=True, version=0))
-            )
-            addresses.append(
-                str(
-                    self.address_class.from_pubkey(pubkey, compressed=False, version=56)
-                )
-            )
-            addresses.append(
-                str(self.address_class.from_pubkey(pubkey, compressed=True, version=56))
-            )
+        for derived in _genesis_addresses(self, pubkeys):
+            addresses.extend(derived)
 
         balancess = self.blockchain.rpc.get_balance_objects(addresses)
 
@@ -148,3 +148,66 @@ class Memo(AbstractBlockchainInstanceProvider):
             message.get("nonce"),
             message.get("message"),
         )
+
+    def decrypt_many(self, messages, workers=None):
+        """ Decrypt many messages at once
+
+            Every memo key is looked up in the wallet only once and messages
+            that share a key pair are decrypted with the same shared secret.
+
+            :param list messages: encrypted memo messages
+            :param int workers: Decrypt in this many processes
+            :returns: decrypted messages in the order of ``messages``. Items
+                that could not be decrypted are represented by the exception
+                (e.g. :class:`MissingKeyError`) that was raised.
+            :rtype: list
+        """
+        if not hasattr(self, "chain_prefix"):
+            self.chain_prefix = self.blockchain.prefix
+
+        privkeys = {}
+        pubkeys = {}
+
+        def privkey(pub):
+            if pub not in privkeys:
+                try:
+                    wif = self.blockchain.wallet.getPrivateKeyForPublicKey(pub)
+                except KeyNotFound:
+                    wif = None
+                privkeys[pub] = bytes(self.privatekey_class(wif)) if wif else None
+            return privkeys[pub]
+
+        def pubkey(pub):
+            if pub not in pubkeys:
+                pubkeys[pub] = bytes(
+                    self.publickey_class(pub, prefix=self.chain_prefix)
+                )
+            return pubkeys[pub]
+
+        results = [None] * len(messages)
+        indices = []
+        items = []
+        for i, message in enumerate(messages):
+            if not message:
+                continue
+            try:
+                # We first try to decode assuming we received the memo
+                priv, pub = privkey(message["to"]), message["from"]
+                if priv is None:
+                    # if that failed, we assume that we have sent the memo
+                    priv, pub = privkey(message["from"]), message["to"]
+                if priv is None:
+                    raise MissingKeyError(
+                        "None of the required memo keys are installed!"
+                        "Need any of {}".format([message["to"], message["from"]])
+                    )
+                items.append(
+                    (priv, pubkey(pub), message.get("nonce"), message.get("message"))
+                )
+                indices.append(i)
+            except Exception as e:
+                results[i] = e
+
+        for i, result in zip(indices, memo.decode_memos(items, workers=workers)):
+            results[i] = result
+        return results
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
+import json
 import logging
 
 from graphenestorage import InRamPlainKeyStore, SqliteEncryptedKeyStore
+from graphenestorage import exceptions as storage_exceptions
+from graphenestorage.masterpassword import clear_key_caches
 from graphenecommon.exceptions import (
     InvalidWifError,
     KeyAlreadyInStoreException,
@@ -39,11 +42,17 @@ class Wallet(AbstractBlockchainInstanceProvider):
           signatures!
     """
 
+    #: Config key under which the public key/account index is persisted
+    account_index_config_key = "wallet_account_index"
+
     def __init__(self, *args, **kwargs):
         self.define_classes()
         assert self.privatekey_class
         assert self.default_key_store_app_name
 
+        # Parsed account index (see getAccountIndex), loaded on first use
+        self._account_index = None
+
         # Compatibility after name change from wif->keys
         if "wif" in kwargs and "keys" not in kwargs:
             kwargs["keys"] = kwargs["wif"]
@@ -161,6 +170,27 @@ class Wallet(AbstractBlockchainInstanceProvider):
         if str(pub) in self.store:
             raise KeyAlreadyInStoreException("Key already in the store")
         self.store.add(str(wif), str(pub))
+        self._indexPublicKeys([str(pub)])
+
+    def addPrivateKeys(self, wifs, workers=None):
+        """ Add many private keys to the wallet database at once
+
+            :param list wifs: Private keys
+            :param int workers: Number of processes to use for encryption
+        """
+        pairs = []
+        for wif in wifs:
+            try:
+                pub = self.publickey_from_wif(wif)
+            except Exception:
+                raise InvalidWifError("Invalid Key format!")
+            pairs.append((str(wif), str(pub)))
+        # The store checks for existing keys in one go
+        try:
+            self.store.add_many(pairs, workers=workers)
+        except storage_exceptions.KeyAlreadyInStoreException:
+            raise KeyAlreadyInStoreException("Key already in the store")
+        self._indexPublicKeys([pub for wif, pub in pairs])
 
     def getPrivateKeyForPublicKey(self, pub):
         """ Obtain the private key for a given public key
@@ -175,6 +205,9 @@ class Wallet(AbstractBlockchainInstanceProvider):
         """ Remove a key from the wallet database
         """
         self.store.delete(str(pub))
+        index = self._loadAccountIndex()
+        if index.pop(str(pub), None) is not None:
+            self._saveAccountIndex(index)
 
     def removeAccount(self, account):
         """ Remove all keys associated with a given account
@@ -182,7 +215,7 @@ class Wallet(AbstractBlockchainInstanceProvider):
         accounts = self.getAccounts()
         for a in accounts:
             if a["name"] == account:
-                self.store.delete(a["pubkey"])
+                self.removePrivateKeyFromPublicKey(a["pubkey"])
 
     def getOwnerKeyForAccount(self, name):
         """ Obtain owner Private Key for an account from the wallet database
@@ -221,24 +254,138 @@ class Wallet(AbstractBlockchainInstanceProvider):
         return self.getAccountFromPublicKey(pub)
 
     def getAccountsFromPublicKey(self, pub):
-        """ Obtain all accounts associated with a public key
+        """ Obtain all accounts (ids) associated with a public key
         """
-        names = self.rpc.get_key_references([str(pub)])
-        for name in names:
-            for i in name:
-                yield i
+        pub = str(pub)
+        index = self._loadAccountIndex()
+        if pub not in index:
+            references = self._resolveKeyReferences([pub])
+            if pub in self.store:
+                index.update(references)
+                self._saveAccountIndex(index)
+            index = references
+        for account_id in index[pub]:
+            yield account_id
 
     def getAccountFromPublicKey(self, pub):
-        """ Obtain the first account name from public key
+        """ Obtain the first account id from public key
         """
         # FIXME, this only returns the first associated key.
         # If the key is used by multiple accounts, this
         # will surely lead to undesired behavior
-        names = self.rpc.get_key_references([str(pub)])[0]
-        if not names:
+        ids = list(self.getAccountsFromPublicKey(pub))
+        if not ids:
             return None
         else:
-            return names[0]
+            return ids[0]
+
+    def _resolveKeyReferences(self, pubs):
+        """ Obtain ``{pub: {account_id: None}}`` for many public keys with
+            one ``get_key_references`` call (see :meth:`_resolveAccounts`)
+        """
+        pubs = list(pubs)
+        if not pubs:
+            return {}
+        references = self.rpc.get_key_references(pubs)
+        return {
+            pub: {account_id: None for account_id in ids}
+            for pub, ids in zip(pubs, references)
+        }
+
+    def _resolveAccounts(self, index):
+        """ Fill in name and key type of all accounts in ``index`` that are
+            not resolved yet, with one ``get_objects`` call
+        """
+        ids = list(
+            dict.fromkeys(
+                account_id
+                for accounts in index.values()
+                for account_id, account in accounts.items()
+                if account is None
+            )
+        )
+        if not ids:
+            return
+        accounts = {
+            account["id"]: account for account in self.rpc.get_objects(ids) if account
+        }
+        for pub, references in index.items():
+            for account_id in list(references):
+                if references[account_id] is not None:
+                    continue
+                account = accounts.get(account_id)
+                if account is None:
+                    # Unknown account
+                    del references[account_id]
+                    continue
+                references[account_id] = {
+                    "name": account["name"],
+                    "type": self.getKeyType(account, pub),
+                }
+
+    def _indexPublicKeys(self, pubs):
+        """ Add the accounts of newly added keys to the index (with one
+            ``get_key_references`` call)
+
+            Without a connection, or if the call fails, the keys are indexed
+            on first use instead.
+        """
+        pubs = [pub for pub in pubs if pub[: len(self.prefix)] == self.prefix]
+        if not pubs or not self.blockchain.is_connected():
+            return
+        try:
+            references = self._resolveKeyReferences(pubs)
+        except Exception as e:
+            log.warning("Could not index the accounts of new keys: %s" % e)
+            return
+        index = self._loadAccountIndex()
+        index.update(references)
+        self._saveAccountIndex(index)
+
+    def _loadAccountIndex(self):
+        """ The account index, parsed from the configuration store only once
+            per wallet instance
+        """
+        if self._account_index is None:
+            data = self.blockchain.config[self.account_index_config_key]
+            self._account_index = json.loads(data) if data else {}
+        return self._account_index
+
+    def _saveAccountIndex(self, index):
+        self.blockchain.config[self.account_index_config_key] = json.dumps(index)
+        self._account_index = index
+
+    def getAccountIndex(self, refresh=False):
+        """ Index of the accounts that the installed public keys belong to
+
+            :param bool refresh: Query all keys again (instead of only the
+                keys that are not indexed yet)
+            :return: ``{pub: {account_id: {"name": name, "type": type}}}``
+                with the type being ``owner``, ``active`` or ``memo`` (see
+                :meth:`getKeyType`)
+            :rtype: dict
+
+            The index is persisted in the configuration store (and kept in
+            memory) and updated incrementally: keys are looked up when they
+            are added or, if that was not possible, on the next call (all of
+            them in a single ``get_key_references`` call, their accounts in
+            a single ``get_objects`` call), removed keys are dropped.
+        """
+        pubkeys = [
+            pub
+            for pub in self.getPublicKeys()
+            # Filter those keys not for our network
+            if pub[: len(self.prefix)] == self.prefix
+        ]
+        index = {} if refresh else self._loadAccountIndex()
+        updated = {pub: dict(index[pub]) for pub in pubkeys if pub in index}
+        updated.update(
+            self._resolveKeyReferences([pub for pub in pubkeys if pub not in index])
+        )
+        self._resolveAccounts(updated)
+        if refresh or updated != index:
+            self._saveAccountIndex(updated)
+        return updated
 
     def getAllAccounts(self, pub):
         """ Get the account data for a public key (all accounts found for this
@@ -263,12 +410,12 @@ class Wallet(AbstractBlockchainInstanceProvider):
     def getAccounts(self):
         """ Return all accounts installed in the wallet database
         """
-        pubkeys = self.getPublicKeys()
         accounts = []
-        for pubkey in pubkeys:
-            # Filter those keys not for our network
-            if pubkey[: len(self.prefix)] == self.prefix:
-                accounts.extend(self.getAllAccounts(pubkey))
+        for pubkey, references in self.getAccountIndex().items():
+            for account_id, account in references.items():
+                accounts.append(
+                    {"name": account["name"], "type": account["type"], "pubkey": pubkey}
+                )
         return accounts
 
     def getPublicKeys(self):
@@ -286,3 +433,5 @@ class Wallet(AbstractBlockchainInstanceProvider):
             return
         else:
             self.store.wipe()
+            clear_key_caches()
+            self._saveAccountIndex({})
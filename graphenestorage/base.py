@@ -124,6 +124,40 @@ class KeyEncryption(MasterPassword, EncryptedKeyInterface):
             raise KeyAlreadyInStoreException
         self[str(pub)] = self.encrypt(str(wif))  # From Masterpassword
 
+    def add_many(self, pairs, workers=None, **kwargs):
+        """ Add many public/private key pairs at once
+
+            The BIP38 encryption is distributed over ``workers`` processes
+            and all keys are stored in one go. Existing keys are looked up
+            before anything is encrypted.
+
+            :param list pairs: List of ``(wif, pub)`` tuples
+            :param int workers: Number of processes to use for encryption
+        """
+        pairs = [(str(wif), str(pub)) for wif, pub in pairs]
+        pubs = [pub for wif, pub in pairs]
+        if len(set(pubs)) != len(pubs) or self.existing_keys(pubs):
+            raise KeyAlreadyInStoreException
+        encrypted = self.encrypt_many(
+            [wif for wif, pub in pairs], workers=workers, **kwargs
+        )
+        try:
+            self.insert_many(zip(pubs, encrypted))
+        except KeyError:
+            raise KeyAlreadyInStoreException
+
+    def export_all(self, workers=None, **kwargs):
+        """ Returns all stored keys (decrypted) as a list of ``(wif, pub)``
+            tuples
+
+            :param int workers: Number of processes to use for decryption
+        """
+        items = list(self.items())
+        wifs = self.decrypt_many(
+            [wif for pub, wif in items], workers=workers, **kwargs
+        )
+        return [(wif, pub) for wif, (pub, _) in zip(wifs, items)]
+
     def is_encrypted(self):
         return True
 
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+from .exceptions import KeyAlreadyInStoreException
+
+
 class StoreInterface(dict):
 
     """ The store interface is the most general store that we can have.
@@ -85,6 +88,35 @@ class StoreInterface(dict):
         """
         return dict.get(self, key, default)
 
+    def set_many(self, items):
+        """ Sets many items in the store at once
+
+            :param list items: List of ``(key, value)`` tuples
+        """
+        for key, value in items:
+            self[key] = value
+
+    def existing_keys(self, keys):
+        """ Returns those of ``keys`` that are already in the store
+
+            :param list keys: Keys to look up
+            :rtype: list
+        """
+        return [key for key in keys if key in self]
+
+    def insert_many(self, items):
+        """ Inserts many new items into the store at once
+
+            :param list items: List of ``(key, value)`` tuples
+            :raises KeyError: if any of the keys is already in the store,
+                nothing is inserted then
+        """
+        items = list(items)
+        existing = self.existing_keys([key for key, value in items])
+        if existing:
+            raise KeyError(existing[0])
+        self.set_many(items)
+
     # Specific for this library
     def delete(self, key):
         """ Delete a key from the store
@@ -142,6 +174,30 @@ class KeyInterface(StoreInterface):
         """
         raise NotImplementedError
 
+    def add_many(self, pairs, **kwargs):
+        """ Add many public/private key pairs at once
+
+           :param list pairs: List of ``(wif, pub)`` tuples
+
+           Nothing is added if any of the public keys is already in the
+           store (or given more than once).
+        """
+        items = [(str(pub), str(wif)) for wif, pub in pairs]
+        if len(set(pub for pub, wif in items)) != len(items):
+            raise KeyAlreadyInStoreException
+        try:
+            self.insert_many(items)
+        except KeyError:
+            raise KeyAlreadyInStoreException
+
+    def export_all(self, **kwargs):
+        """ Returns all stored keys as a list of ``(wif, pub)`` tuples
+        """
+        return [
+            (self.getPrivateKeyForPublicKey(pub), pub)
+            for pub in self.getPublicKeys()
+        ]
+
 
 class EncryptedKeyInterface(KeyInterface):
     """ The EncryptedKeyInterface extends KeyInterface to work with encrypted
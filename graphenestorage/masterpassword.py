@@ -1,18 +1,66 @@
 # -*- coding: utf-8 -*-
 import os
+import time
 import hashlib
 import logging
+import threading
 
 from binascii import hexlify
+from collections import OrderedDict
+from functools import partial
 
-from graphenebase import bip38
+from graphenebase import bip38, ecdsa, memo
 from graphenebase.aes import AESCipher
+from graphenebase.utils import map_chunked, submit, chain_future, completed_future
 
 from .exceptions import WrongMasterPasswordException, WalletLocked
 
 
 log = logging.getLogger(__name__)
 
+#: Number of decrypted keys that are kept while the store is unlocked
+DECRYPTED_KEY_CACHE_SIZE = 256
+
+#: Number of keys handed to a worker process at once (one scrypt each)
+BIP38_CHUNK_SIZE = 8
+
+
+def _encrypt_keys(masterkey, wifs):
+    return [format(bip38.encrypt(str(wif), masterkey), "encwif") for wif in wifs]
+
+
+def _decrypt_keys(masterkey, wifs):
+    return [format(bip38.decrypt(wif, masterkey), "wif") for wif in wifs]
+
+
+def clear_key_caches():
+    """ Forget the process wide caches that are keyed by private keys
+        (BIP38 address salts, signing keys and memo shared secrets)
+    """
+    bip38._address_salt.cache_clear()
+    ecdsa.signing_keys.cache_clear()
+    ecdsa._batch_signer.cache_clear()
+    memo._shared_secret.cache_clear()
+    memo._shared_secret_digest.cache_clear()
+
+
+def _derive_checksum(s):
+    checksum = hashlib.sha256(bytes(s, "ascii")).hexdigest()
+    return checksum[:4]
+
+
+def _decrypt_master(password, encrypted):
+    """ Decrypted master key, or ``None`` if the password is wrong
+    """
+    checksum, encrypted_master = encrypted.split("$")
+    try:
+        decrypted_master = AESCipher(password).decrypt(encrypted_master)
+    except Exception:
+        return None
+    if checksum != _derive_checksum(decrypted_master):
+        return None
+    return decrypted_master
+
 
 class MasterPassword(object):
     """ The keys are encrypted with a Masterpassword that is stored in
@@ -24,15 +72,41 @@ class MasterPassword(object):
 
         :param ConfigStore config: Configuration store to get access to the
             encrypted master password
+        :param int decrypted_key_cache_size: Number of decrypted keys to keep
+            in memory while unlocked (``0`` disables the cache)
+        :param float decrypted_key_cache_ttl: Seconds after which a cached
+            decrypted key expires (``None`` for no expiry)
+
+        .. note:: Decrypting a key runs scrypt (BIP38) which is slow by
+            design. Decrypted keys are therefore cached until the store is
+            locked.
+
+        The decrypted master key and the cache are guarded by a lock, so
+        that the callbacks of :meth:`unlock_async` and :meth:`decrypt_async`
+        can run in other threads. Every :meth:`lock` starts a new
+        *generation*; results of calls that were started before are
+        discarded.
     """
 
-    def __init__(self, config=None, **kwargs):
+    def __init__(
+        self,
+        config=None,
+        decrypted_key_cache_size=DECRYPTED_KEY_CACHE_SIZE,
+        decrypted_key_cache_ttl=None,
+        **kwargs
+    ):
         if config is None:
             raise ValueError("If using encrypted store, a config store is required!")
         self.config = config
         self.password = None
         self.decrypted_master = None
         self.config_key = "encrypted_master_password"
+        self.decrypted_key_cache_size = decrypted_key_cache_size
+        self.decrypted_key_cache_ttl = decrypted_key_cache_ttl
+        self._decrypted_keys = OrderedDict()
+        self._aes = None
+        self._state_lock = threading.RLock()
+        self._generation = 0
 
     @property
     def masterkey(self):
@@ -72,8 +146,58 @@ class MasterPassword(object):
         """ Lock the store so that we can no longer decrypt the content of the
             store
         """
-        self.password = None
-        self.decrypted_master = None
+        with self._state_lock:
+            self._generation += 1
+            self.password = None
+            self.decrypted_master = None
+            self._aes = None
+            self.clear_decrypted_keys()
+            clear_key_caches()
+
+    def clear_decrypted_keys(self):
+        """ Forget all decrypted keys held in memory
+        """
+        with self._state_lock:
+            self._decrypted_keys.clear()
+
+    def _get_decrypted_key(self, wif):
+        with self._state_lock:
+            entry = self._decrypted_keys.get(wif)
+            if entry is None:
+                return None
+            key, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._decrypted_keys[wif]
+                return None
+            self._decrypted_keys.move_to_end(wif)
+            return key
+
+    def _unlocked_state(self):
+        """ Current generation and decrypted master key
+
+            :raises WalletLocked: if the store was locked in the meantime
+        """
+        with self._state_lock:
+            if self.decrypted_master is None:
+                raise WalletLocked
+            return self._generation, self.decrypted_master
+
+    def _cache_decrypted_key(self, wif, key, generation=None):
+        """ Cache a decrypted key, unless the store was locked since
+            ``generation``
+        """
+        if not self.decrypted_key_cache_size:
+            return
+        expires = None
+        if self.decrypted_key_cache_ttl is not None:
+            expires = time.monotonic() + self.decrypted_key_cache_ttl
+        with self._state_lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._decrypted_keys[wif] = (key, expires)
+            self._decrypted_keys.move_to_end(wif)
+            while len(self._decrypted_keys) > self.decrypted_key_cache_size:
+                self._decrypted_keys.popitem(last=False)
 
     def unlock(self, password):
         """ The password is used to encrypt this masterpassword. To
@@ -92,10 +216,45 @@ class MasterPassword(object):
             self.newMaster(password)
             self.saveEncrytpedMaster()
 
+    def _cipher(self):
+        """ AES cipher for the current password (reused until the password
+            changes)
+        """
+        if self._aes is None or self._aes[0] != self.password:
+            self._aes = (self.password, AESCipher(self.password))
+        return self._aes[1]
+
+    def unlock_async(self, password):
+        """ Like :meth:`unlock` but decrypts the master key in the executor
+            configured with :func:`graphenebase.utils.set_executor`
+
+            :param str password: Password to use for en-/de-cryption
+            :rtype: concurrent.futures.Future
+        """
+        if not (self.config_key in self.config and self.config[self.config_key]):
+            self.unlock(password)
+            return completed_future(None)
+        generation = self._generation
+
+        def unlocked(decrypted_master):
+            if decrypted_master is None:
+                raise WrongMasterPasswordException
+            with self._state_lock:
+                if generation != self._generation:
+                    # Locked in the meantime
+                    raise WalletLocked
+                self.password = password
+                self.decrypted_master = decrypted_master
+
+        return chain_future(
+            submit(_decrypt_master, password, self.config[self.config_key]),
+            unlocked,
+        )
+
     def decryptEncryptedMaster(self):
         """ Decrypt the encrypted masterkey
         """
-        aes = AESCipher(self.password)
+        aes = self._cipher()
         checksum, encrypted_master = self.config[self.config_key].split("$")
         try:
             decrypted_master = aes.decrypt(encrypted_master)
@@ -103,7 +262,8 @@ class MasterPassword(object):
             self.raiseWrongMasterPasswordException()
         if checksum != self.deriveChecksum(decrypted_master):
             self.raiseWrongMasterPasswordException()
-        self.decrypted_master = decrypted_master
+        with self._state_lock:
+            self.decrypted_master = decrypted_master
 
     def raiseWrongMasterPasswordException(self):
         self.password = None
@@ -122,7 +282,10 @@ class MasterPassword(object):
         if self.config_key in self.config and self.config[self.config_key]:
             raise Exception("Storage already has a masterpassword!")
 
-        self.decrypted_master = hexlify(os.urandom(32)).decode("ascii")
+        with self._state_lock:
+            self._generation += 1
+            self.decrypted_master = hexlify(os.urandom(32)).decode("ascii")
+            self.clear_decrypted_keys()
 
         # Encrypt and save master
         self.password = password
@@ -134,8 +297,7 @@ class MasterPassword(object):
 
             :param str s: Random string for which to derive the checksum
         """
-        checksum = hashlib.sha256(bytes(s, "ascii")).hexdigest()
-        return checksum[:4]
+        return _derive_checksum(s)
 
     def getEncryptedMaster(self):
         """ Obtain the encrypted masterkey
@@ -146,7 +308,7 @@ class MasterPassword(object):
         """
         if not self.unlocked():
             raise WalletLocked
-        aes = AESCipher(self.password)
+        aes = self._cipher()
         return "{}${}".format(
             self.deriveChecksum(self.masterkey), aes.encrypt(self.masterkey)
         )
@@ -166,7 +328,36 @@ class MasterPassword(object):
         """
         if not self.unlocked():
             raise WalletLocked
-        return format(bip38.decrypt(wif, self.masterkey), "wif")
+        key = self._get_decrypted_key(wif)
+        if key is None:
+            generation, masterkey = self._unlocked_state()
+            key = format(bip38.decrypt(wif, masterkey), "wif")
+            self._cache_decrypted_key(wif, key, generation)
+        return key
+
+    def decrypt_async(self, wif):
+        """ Like :meth:`decrypt` but runs BIP38 in the executor configured
+            with :func:`graphenebase.utils.set_executor`
+
+            :param str wif: Encrypted key
+            :rtype: concurrent.futures.Future
+        """
+        if not self.unlocked():
+            raise WalletLocked
+        key = self._get_decrypted_key(wif)
+        if key is not None:
+            return completed_future(key)
+        generation, masterkey = self._unlocked_state()
+
+        def decrypted(keys):
+            with self._state_lock:
+                if generation != self._generation:
+                    # Locked in the meantime
+                    raise WalletLocked
+                self._cache_decrypted_key(wif, keys[0])
+            return keys[0]
+
+        return chain_future(submit(_decrypt_keys, masterkey, [wif]), decrypted)
 
     def encrypt(self, wif):
         """ Encrypt the content according to BIP38
@@ -175,4 +366,58 @@ class MasterPassword(object):
         """
         if not self.unlocked():
             raise WalletLocked
-        return format(bip38.encrypt(str(wif), self.masterkey), "encwif")
+        generation, masterkey = self._unlocked_state()
+        encrypted = format(bip38.encrypt(str(wif), masterkey), "encwif")
+        self._cache_decrypted_key(encrypted, str(wif), generation)
+        return encrypted
+
+    def encrypt_many(self, wifs, workers=None, chunksize=BIP38_CHUNK_SIZE):
+        """ Encrypt many keys according to BIP38
+
+            :param list wifs: Unencrypted keys
+            :param int workers: Run the scrypt work in this many processes
+            :param int chunksize: Number of keys handed to a worker at once
+            :rtype: list
+        """
+        if not self.unlocked():
+            raise WalletLocked
+        wifs = [str(wif) for wif in wifs]
+        generation, masterkey = self._unlocked_state()
+        encrypted = map_chunked(
+            partial(_encrypt_keys, masterkey), wifs, workers, chunksize
+        )
+        for enc, wif in zip(encrypted, wifs):
+            self._cache_decrypted_key(enc, wif, generation)
+        return encrypted
+
+    def decrypt_many(self, wifs, workers=None, chunksize=BIP38_CHUNK_SIZE):
+        """ Decrypt many keys according to BIP38
+
+            Keys that are already cached are not decrypted again.
+
+            :param list wifs: Encrypted keys
+            :param int workers: Run the scrypt work in this many processes
+            :param int chunksize: Number of keys handed to a worker at once
+            :rtype: list
+        """
+        if not self.unlocked():
+            raise WalletLocked
+        keys = [self._get_decrypted_key(wif) for wif in wifs]
+        missing = list({wif for wif, key in zip(wifs, keys) if key is None})
+        generation, masterkey = self._unlocked_state()
+        decrypted = dict(
+            zip(
+                missing,
+                map_chunked(
+                    partial(_decrypt_keys, masterkey),
+                    missing,
+                    workers,
+                    chunksize,
+                ),
+            )
+        )
+        for wif, key in decrypted.items():
+            self._cache_decrypted_key(wif, key, generation)
+        return [
+            decrypted[wif] if key is None else key for wif, key in zip(wifs, keys)
+        ]
@@ -14,6 +14,10 @@ from .interfaces import StoreInterface
 log = logging.getLogger(__name__)
 timeformat = "%Y%m%d-%H%M%S"
 
+#: Number of keys looked up per query (SQLite limits the number of
+#: parameters of a statement)
+SQLITE_MAX_VARIABLES = 500
+
 
 class SQLiteFile:
     """ This class ensures that the user's data is stored in its OS
@@ -218,6 +222,82 @@ class SQLiteStore(SQLiteFile, SQLiteCommon, StoreInterface):
                 ), (key, value))
         self.sql_execute(query)
 
+    def set_many(self, items):
+        """ Sets many items in the store within a single transaction
+
+            :param list items: List of ``(key, value)`` tuples
+        """
+        update = "UPDATE {} SET {}=? WHERE {}=?".format(
+            self.__tablename__, self.__value__, self.__key__
+        )
+        insert = "INSERT INTO {} ({}, {}) VALUES (?, ?)".format(
+            self.__tablename__, self.__key__, self.__value__
+        )
+        connection = sqlite3.connect(self.sqlDataBaseFile)
+        try:
+            cursor = connection.cursor()
+            for key, value in items:
+                cursor.execute(update, (value, key))
+                if not cursor.rowcount:
+                    cursor.execute(insert, (key, value))
+            connection.commit()
+        finally:
+            connection.close()
+
+    def insert_many(self, items):
+        """ Inserts many new items into the store within a single
+            transaction
+
+            :param list items: List of ``(key, value)`` tuples
+            :raises KeyError: if any of the keys is already in the store,
+                nothing is inserted then
+        """
+        items = list(items)
+        insert = "INSERT INTO {} ({}, {}) VALUES (?, ?)".format(
+            self.__tablename__, self.__key__, self.__value__
+        )
+        connection = sqlite3.connect(self.sqlDataBaseFile)
+        try:
+            cursor = connection.cursor()
+            # Keep others from writing between the check and the insert
+            cursor.execute("BEGIN IMMEDIATE")
+            existing = self._existing_keys(cursor, [key for key, value in items])
+            if existing:
+                raise KeyError(existing[0])
+            cursor.executemany(insert, items)
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _existing_keys(self, cursor, keys):
+        existing = []
+        for i in range(0, len(keys), SQLITE_MAX_VARIABLES):
+            chunk = keys[i : i + SQLITE_MAX_VARIABLES]
+            cursor.execute(
+                "SELECT {} FROM {} WHERE {} IN ({})".format(
+                    self.__key__,
+                    self.__tablename__,
+                    self.__key__,
+                    ", ".join("?" * len(chunk)),
+                ),
+                chunk,
+            )
+            existing.extend(key for key, in cursor.fetchall())
+        return existing
+
+    def existing_keys(self, keys):
+        """ Returns those of ``keys`` that are already in the store (one
+            query per ``SQLITE_MAX_VARIABLES`` keys)
+
+            :param list keys: Keys to look up
+            :rtype: list
+        """
+        connection = sqlite3.connect(self.sqlDataBaseFile)
+        try:
+            return self._existing_keys(connection.cursor(), list(keys))
+        finally:
+            connection.close()
+
     def __getitem__(self, key):
         """ Gets an item from the store as if it was a dictionary
 
@@ -3,6 +3,7 @@ import string
 import random
 import unittest
 import base64
+from io import BytesIO
 from pprint import pprint
 from .fixtures import AESCipher
 
@@ -48,3 +49,24 @@ class Testcases(unittest.TestCase):
         for n in range(1, 16):
             name = "".join(random.choice(string.ascii_lowercase) for _ in range(64))
             self.assertEqual(self.aes.decrypt(self.aes.encrypt(name)), name)
+
+    def test_stream(self):
+        for n in [0, 1, 31, 32, 33, 100, 1000]:
+            data = bytes(random.getrandbits(8) for _ in range(n))
+            for chunksize in [1, 16, 17, 64]:
+                enc = BytesIO()
+                self.aes.encrypt_stream(BytesIO(data), enc, chunksize=chunksize)
+                dec = BytesIO()
+                self.aes.decrypt_stream(
+                    BytesIO(enc.getvalue()), dec, chunksize=chunksize
+                )
+                self.assertEqual(dec.getvalue(), data)
+
+    def test_stream_compatible(self):
+        name = "".join(random.choice(string.ascii_lowercase) for _ in range(100))
+        enc = BytesIO()
+        self.aes.encrypt_stream(BytesIO(bytes(name, "utf-8")), enc)
+        self.assertEqual(self.aes.decrypt(base64.b64encode(enc.getvalue())), name)
+        dec = BytesIO()
+        self.aes.decrypt_stream(BytesIO(base64.b64decode(self.aes.encrypt(name))), dec)
+        self.assertEqual(dec.getvalue(), bytes(name, "utf-8"))
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import unittest
+from binascii import hexlify, unhexlify
 from .fixtures import (
     Base58,
     base58decode,
@@ -12,6 +13,7 @@ from .fixtures import (
     b58decode,
     b58encode,
 )
+from graphenebase.base58 import encode_many, decode_many
 
 
 class Testcases(unittest.TestCase):
@@ -298,6 +300,41 @@ class Testcases(unittest.TestCase):
             ["000000", "00000000", "0000000000", "000000000000"],
         )
 
+    def test_many(self):
+        hexstrings = [
+            "800c28fca386c7a227600b2fe50b7cae11ec86d3bf1fbe471be89827e19d72aa1d507a5b8d",
+            "0001",
+            "ff" * 64,
+        ]
+        encoded = encode_many(hexstrings)
+        self.assertEqual(encoded, [base58encode(h) for h in hexstrings])
+        self.assertEqual(decode_many(encoded), hexstrings)
+
+    def test_chunk_boundaries(self):
+        def encode(n, leading=0):
+            data = bytes(leading) + n.to_bytes((n.bit_length() + 7) // 8, "big")
+            return base58encode(hexlify(data).decode("ascii"))
+
+        # 58 ** 10 - 1 is the largest ten digit chunk
+        self.assertEqual(encode(58 ** 10 - 1), "z" * 10)
+        self.assertEqual(encode(58 ** 10), "2" + "1" * 10)
+        self.assertEqual(encode(58 ** 20 + 57, leading=1), "12" + "1" * 19 + "z")
+        for n in [57, 58, 58 ** 10 - 1, 58 ** 10, 58 ** 20 - 1, 58 ** 30 + 1]:
+            data = n.to_bytes((n.bit_length() + 7) // 8, "big")
+            self.assertEqual(base58decode(encode(n)), hexlify(data).decode("ascii"))
+
+    def test_invalid_character(self):
+        with self.assertRaises(ValueError):
+            base58decode("5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvy0")
+
+    def test_raw_bytes(self):
+        h = "800c28fca386c7a227600b2fe50b7cae11ec86d3bf1fbe471be89827e19d72aa1d507a5b8d"
+        b = Base58(unhexlify(h))
+        self.assertEqual(bytes(b), unhexlify(h))
+        self.assertEqual(repr(b), h)
+        self.assertEqual(str(b), str(Base58(h)))
+        self.assertEqual(format(b, "WIF"), format(Base58(h), "WIF"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
+import hashlib
 import unittest
-from .fixtures import PrivateKey, encrypt, decrypt
+from .fixtures import PrivateKey, bip38, encrypt, decrypt
 
 
 class Testcases(unittest.TestCase):
@@ -74,6 +75,47 @@ class Testcases(unittest.TestCase):
             ],
         )
 
+    def test_scrypt_modules(self):
+        wif = "5HqUkGuo62BfcJU5vNhTXKJRXuUi9QSE6jp8C3uBJ2BVHtB8WSd"
+        encwif = "6PRN5mjUTtud6fUXbJXezfn6oABoSr6GSLjMbrGXRZxSUcxThxsUW8epQi"
+        module = bip38.SCRYPT_MODULE
+        try:
+            for bip38.SCRYPT_MODULE in bip38.SCRYPT_MODULES:
+                encrypted = encrypt(PrivateKey(wif), "TestingOneTwoThree")
+                self.assertEqual(format(encrypted, "encwif"), encwif)
+                self.assertEqual(
+                    format(decrypt(encrypted, "TestingOneTwoThree"), "wif"), wif
+                )
+        finally:
+            bip38.SCRYPT_MODULE = module
+
+    def test_set_scrypt_module(self):
+        if hasattr(hashlib, "scrypt"):
+            self.assertEqual(bip38.SCRYPT_MODULES[0], "hashlib")
+        self.assertEqual(bip38.SCRYPT_MODULE, bip38.SCRYPT_MODULES[0])
+        module = bip38.SCRYPT_MODULE
+        try:
+            for name in bip38.SCRYPT_MODULES:
+                bip38.set_scrypt_module(name)
+                self.assertEqual(bip38.SCRYPT_MODULE, name)
+            with self.assertRaises(ValueError):
+                bip38.set_scrypt_module("foobar")
+        finally:
+            bip38.SCRYPT_MODULE = module
+
+    def test_salt_cache(self):
+        bip38._address_salt.cache_clear()
+        wif = "5KN7MzqK5wt2TP1fQCYyHBtDrXdJuXbUzm4A9rKAteGu3Qi5CVR"
+        encrypted = encrypt(wif, "TestingOneTwoThree")
+        encrypt(wif, "TestingOneTwoThree")
+        info = bip38._address_salt.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        # Decrypting (with a wrong passphrase) does not cache the result
+        with self.assertRaises(bip38.SaltException):
+            decrypt(encrypted, "wrong")
+        decrypt(format(encrypted, "encwif"), "TestingOneTwoThree")
+        self.assertEqual(bip38._address_salt.cache_info().currsize, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
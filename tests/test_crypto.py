@@ -12,6 +12,11 @@ from .fixtures import (
     GrapheneAddress,
     BitcoinAddress,
 )
+from graphenebase.account import (
+    derive_addresses,
+    vanity_search,
+    GENESIS_ADDRESS_VARIANTS,
+)
 
 
 class Testcases(unittest.TestCase):
@@ -786,3 +791,135 @@ class Testcases(unittest.TestCase):
             PrivateKey("KJWcdkhL3w4RkVPcZMdJsjos22yB5cSkPExerktvKnRNZR5gx1S")
         with self.assertRaises(NotImplementedError):
             PrivateKey("LJWcdkhL3w4RkVPcZMdJsjos22yB5cSkPExerktvKnRNZR5gx1S")
+
+    def test_PublicKey_cache(self):
+        k = "GPH6UtYWWs3rkZGV8JA86qrgkG6tyFksgECefKE1MiH4HkLD8PFGL"
+        p1 = PublicKey(k)
+        p2 = PublicKey(k)
+        self.assertIs(p1.pubkey, p2.pubkey)
+        self.assertIs(p1.point(), p2.point())
+        self.assertEqual(p1.uncompressed(), p2.unCompressed())
+        self.assertEqual(repr(PublicKey(p1.uncompressed())), repr(p1))
+        self.assertEqual(repr(PublicKey(p1.pubkey)), repr(p1))
+        self.assertEqual(str(p1.address), str(p2.address))
+        p3 = PublicKey("BTS" + k[3:], prefix="BTS")
+        self.assertEqual(str(p3), "BTS" + k[3:])
+        self.assertEqual(str(p1), k)
+
+    def test_derive_addresses(self):
+        keys = [
+            "GPH6UtYWWs3rkZGV8JA86qrgkG6tyFksgECefKE1MiH4HkLD8PFGL",
+            PrivateKey("5JWcdkhL3w4RkVPcZMdJsjos22yB5cSkPExerktvKnRNZR5gx1S").pubkey,
+        ]
+        derived = derive_addresses(keys)
+        self.assertEqual(len(derived), 2)
+        for key, addresses in zip(keys, derived):
+            self.assertEqual(
+                addresses,
+                [
+                    str(Address.from_pubkey(key, compressed=c, version=v))
+                    for c, v in GENESIS_ADDRESS_VARIANTS
+                ],
+            )
+        self.assertEqual(
+            derive_addresses(keys[:1], [(True, 56)]),
+            [["GPHDXi9tQ6Pjf1SEv3m4jn2U5M2YgMPpHy2V"]],
+        )
+
+    def test_derive_addresses_prefix(self):
+        key = PublicKey("BTS6UtYWWs3rkZGV8JA86qrgkG6tyFksgECefKE1MiH4HkLD8PFGL", "BTS")
+        self.assertEqual(
+            derive_addresses([key], [(True, 56)]),
+            [["BTSDXi9tQ6Pjf1SEv3m4jn2U5M2YgMPpHy2V"]],
+        )
+        self.assertEqual(
+            derive_addresses([str(key)], [(True, 56)], prefix="BTS"),
+            [["BTSDXi9tQ6Pjf1SEv3m4jn2U5M2YgMPpHy2V"]],
+        )
+        (raw,), = derive_addresses([key], [(True, 56)], raw=True)
+        self.assertEqual(
+            str(Address(raw, prefix="BTS")), "BTSDXi9tQ6Pjf1SEv3m4jn2U5M2YgMPpHy2V"
+        )
+
+    def test_BrainKey_derive_many(self):
+        b = BrainKey(
+            "COLORER BICORN KASBEKE FAERIE LOCHIA GOMUTI SOVKHOZ Y GERMAL AUNTIE PERFUMY TIME FEATURE GANGAN CELEMIN MATZO"
+        )
+        keys = b.derive_many(5)
+        self.assertEqual(b.sequence, 0)
+        self.assertEqual(
+            str(keys[1]), "5Hsbn6kXio4bb7eW5bX7kTp2sdkmbzP8kGWoau46Cf7en7T1RRE"
+        )
+        expected = []
+        for _ in range(5):
+            expected.append(str(b.get_private()))
+            next(b)
+        self.assertEqual([str(k) for k in keys], expected)
+        raw = BrainKey(b.brainkey).derive_many(600, workers=2, raw=True)
+        self.assertEqual(len(raw), 600)
+        self.assertEqual(raw[:5], [bytes(k) for k in keys])
+        pairs = BrainKey(b.brainkey).derive_many(300, workers=2, public=True)
+        self.assertEqual([str(p) for p, _ in pairs[:5]], expected)
+        for private, public in pairs[:5] + pairs[-5:]:
+            self.assertEqual(str(public), str(private.pubkey))
+        triples = BrainKey(b.brainkey).derive_many(3, raw=True, address=True)
+        for (secret, public, address), key in zip(triples, keys):
+            self.assertEqual(public, bytes(key.pubkey))
+            self.assertEqual(address, bytes(key.address))
+
+    def test_PasswordKey_derive_many(self):
+        credentials = [("xeroc", "SuperSecret"), ("foobar", "password")]
+        keys = PasswordKey.derive_many(credentials, roles=["active", "owner"])
+        self.assertEqual(len(keys), 2)
+        for (account, password), roles in zip(credentials, keys):
+            self.assertEqual(list(roles), ["active", "owner"])
+            for role, key in roles.items():
+                self.assertEqual(
+                    str(key), str(PasswordKey(account, password, role).get_private())
+                )
+        raw = PasswordKey.derive_many(credentials * 100, workers=2, raw=True)
+        self.assertEqual(len(raw), 200)
+        self.assertEqual(raw[1]["active"], bytes(keys[1]["active"]))
+        triples = PasswordKey.derive_many(
+            credentials, roles=["active"], prefix="BTS", address=True
+        )
+        for roles, expected in zip(triples, keys):
+            private, public, address = roles["active"]
+            self.assertEqual(str(private), str(expected["active"]))
+            self.assertEqual(
+                str(public), str(expected["active"].pubkey).replace("GPH", "BTS")
+            )
+            self.assertEqual(
+                str(address), "BTS" + str(expected["active"].address)[3:]
+            )
+
+    def test_keys_from_bytes(self):
+        p = PrivateKey("5JWcdkhL3w4RkVPcZMdJsjos22yB5cSkPExerktvKnRNZR5gx1S")
+        self.assertEqual(str(PrivateKey(bytes(p))), str(p))
+        pub = p.pubkey
+        self.assertEqual(str(PublicKey(bytes(pub))), str(pub))
+        self.assertEqual(
+            str(PublicKey(bytes.fromhex(pub.uncompressed()))), str(pub)
+        )
+        self.assertEqual(PublicKey.fromBytes(bytes(pub) + b"\x01")[1], b"\x01")
+
+    def test_vanity_search(self):
+        reports = []
+        key = vanity_search("7", batch=16, report=lambda *r: reports.append(r))
+        self.assertTrue(str(key.pubkey).startswith("GPH7"))
+        self.assertEqual(len(reports[-1]), 2)
+
+        key = vanity_search("a", target="address", workers=2, batch=16)
+        self.assertTrue(str(GrapheneAddress.from_pubkey(key.pubkey)).startswith("GPHa"))
+
+        key = vanity_search("8", prefix="BTS")
+        self.assertTrue(str(key.pubkey).startswith("BTS8"))
+
+        # Public keys (02/03...) never start with a "z"
+        self.assertIsNone(vanity_search("z", batch=8, max_tries=16))
+        self.assertIsNone(vanity_search("z", batch=8, max_tries=16, workers=2))
+
+        with self.assertRaises(ValueError):
+            vanity_search("0")
+        with self.assertRaises(ValueError):
+            vanity_search("a", target="foobar")
@@ -1,12 +1,24 @@
 # -*- coding: utf-8 -*-
 import pytest
+import hashlib
 import unittest
 from binascii import hexlify
-from .fixtures import PrivateKey, ecdsa
+from .fixtures import PrivateKey, Signed_Transaction, ecdsa, utils
 
 
 wif = "5J4KCbg1G3my9b9hCaQXnHSm6vrwW9xQTJS6ZciW2Kek7cCkCEk"
+wif2 = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
 pub_key = repr(PrivateKey(wif).pubkey)
+pub_key2 = repr(PrivateKey(wif2).pubkey)
+
+
+def backends():
+    modules = ["ecdsa"]
+    if ecdsa.CRYPTOGRAPHY_AVAILABLE:
+        modules.append("cryptography")
+    if ecdsa.SECP256K1_AVAILABLE:
+        modules.append("secp256k1")
+    return modules
 
 
 class Testcases(unittest.TestCase):
@@ -35,6 +47,223 @@ class Testcases(unittest.TestCase):
         pub_key_sig = ecdsa.verify_message("Foobar", signature)
         self.assertEqual(hexlify(pub_key_sig).decode("latin"), pub_key)
 
+    def test_sign_async(self):
+        from graphenebase.utils import set_executor
+
+        try:
+            set_executor(workers=1)
+            futures = [ecdsa.sign_async(m, wif) for m in ["Foobar", "Barfoo"]]
+            for message, future in zip(["Foobar", "Barfoo"], futures):
+                p = ecdsa.verify_message(message, future.result())
+                self.assertEqual(hexlify(p).decode("latin"), pub_key)
+        finally:
+            set_executor()
+
+    def test_batch_signer(self):
+        module = ecdsa.SECP256K1_MODULE
+        try:
+            for ecdsa.SECP256K1_MODULE in backends():
+                signer = ecdsa.BatchSigner([wif, PrivateKey(wif2), wif])
+                self.assertEqual(len(signer.keys), 2)
+                sigs = signer.sign_messages(["Foobar", b"Barfoo"])
+                self.assertEqual(len(sigs), 2)
+                for message, pair in zip(["Foobar", "Barfoo"], sigs):
+                    keys = [
+                        hexlify(ecdsa.verify_message(message, s)).decode("latin")
+                        for s in pair
+                    ]
+                    self.assertEqual(keys, [pub_key, pub_key2])
+        finally:
+            ecdsa.SECP256K1_MODULE = module
+
+    def test_batch_signer_workers(self):
+        signer = ecdsa.BatchSigner([bytes(PrivateKey(wif))], workers=2, chunksize=2)
+        messages = [str(i) for i in range(5)]
+        sigs = signer.sign_messages(messages)
+        self.assertEqual(len(sigs), 5)
+        for message, (signature,) in zip(messages, sigs):
+            p = ecdsa.verify_message(message, signature)
+            self.assertEqual(hexlify(p).decode("latin"), pub_key)
+        # The worker processes are reused
+        pool = utils._process_pool(2)
+        signer.sign_messages(messages)
+        self.assertIs(utils._process_pool(2), pool)
+
+    def test_batch_signer_shared(self):
+        signer = ecdsa.batch_signer([wif, wif2])
+        self.assertIs(ecdsa.batch_signer([wif, wif2]), signer)
+        self.assertIsNot(ecdsa.batch_signer([wif2]), signer)
+        self.assertEqual(len(signer.keys), 2)
+
+    def test_batch_signer_transactions(self):
+        txs = [
+            Signed_Transaction(
+                ref_block_num=i,
+                ref_block_prefix=3707022213,
+                expiration="2016-04-06T08:29:27",
+                operations=[],
+            )
+            for i in range(3)
+        ]
+        signer = ecdsa.BatchSigner([wif, wif2])
+        for tx in signer.sign_transactions(txs, chain="GPH"):
+            self.assertEqual(len(tx["signatures"].data), 2)
+            tx.verify([PrivateKey(wif).pubkey, PrivateKey(wif2).pubkey], "GPH")
+
+    def test_verify_messages(self):
+        module = ecdsa.SECP256K1_MODULE
+        try:
+            for ecdsa.SECP256K1_MODULE in backends():
+                sig1 = ecdsa.sign_message("Foobar", wif)
+                sig2 = ecdsa.sign_message("Barfoo", wif2)
+                keys = ecdsa.verify_messages(
+                    [("Foobar", sig1), ("Barfoo", sig2), (b"Foobar", sig1)]
+                )
+                self.assertEqual(
+                    [hexlify(k).decode("latin") for k in keys],
+                    [pub_key, pub_key2, pub_key],
+                )
+        finally:
+            ecdsa.SECP256K1_MODULE = module
+
+    def test_verify_messages_workers(self):
+        pairs = [(str(i), ecdsa.sign_message(str(i), wif)) for i in range(5)]
+        keys = ecdsa.verify_messages(pairs, workers=2, chunksize=2)
+        self.assertEqual([hexlify(k).decode("latin") for k in keys], [pub_key] * 5)
+
+    def test_signing_keys_cache(self):
+        module = ecdsa.SECP256K1_MODULE
+        secret = bytes(PrivateKey(wif))
+        try:
+            for ecdsa.SECP256K1_MODULE in backends():
+                if ecdsa.SECP256K1_MODULE == "secp256k1":
+                    continue
+                ecdsa.signing_keys.cache_clear()
+                for message in ["Foobar", "Barfoo"]:
+                    signature = ecdsa.sign_message(message, wif)
+                    p = ecdsa.verify_message(message, signature)
+                    self.assertEqual(hexlify(p).decode("latin"), pub_key)
+                info = ecdsa.signing_keys.cache_info()
+                self.assertEqual((info.hits, info.misses), (1, 1))
+                self.assertIs(
+                    ecdsa.signing_keys(secret, ecdsa.SECP256K1_MODULE),
+                    ecdsa.signing_keys(secret, ecdsa.SECP256K1_MODULE),
+                )
+        finally:
+            ecdsa.SECP256K1_MODULE = module
+
+    def test_deterministic_canonical_signature(self):
+        module = ecdsa.SECP256K1_MODULE
+        order = ecdsa.ecdsa.SECP256k1.order
+        try:
+            for ecdsa.SECP256K1_MODULE in backends():
+                if ecdsa.SECP256K1_MODULE == "secp256k1":
+                    continue
+                for i in range(20):
+                    message = "Foobar %d" % i
+                    signature = ecdsa.sign_message(message, wif)
+                    self.assertEqual(signature, ecdsa.sign_message(message, wif))
+                    self.assertTrue(ecdsa._is_canonical(signature[1:]))
+                    s = int(hexlify(signature[33:]), 16)
+                    self.assertLessEqual(s, order // 2)
+                    p = ecdsa.verify_message(message, signature)
+                    self.assertEqual(hexlify(p).decode("latin"), pub_key)
+        finally:
+            ecdsa.SECP256K1_MODULE = module
+
+    def test_canonical_signature_backends_agree(self):
+        if not ecdsa.CRYPTOGRAPHY_AVAILABLE:
+            return
+        digest = bytes(32)
+        secret = bytes(PrivateKey(wif))
+        self.assertEqual(
+            ecdsa._canonical_signature(digest, secret, ecdsa._ecdsa_mul_generator),
+            ecdsa._canonical_signature(
+                digest, secret, ecdsa._cryptography_mul_generator
+            ),
+        )
+        if ecdsa.SECP256K1_AVAILABLE:
+            self.assertEqual(
+                ecdsa._canonical_signature(
+                    digest, secret, ecdsa._secp256k1_mul_generator
+                ),
+                ecdsa._canonical_signature(
+                    digest, secret, ecdsa._cryptography_mul_generator
+                ),
+            )
+
+    def test_recover_pubkey_parameter(self):
+        message = b"Foobar"
+        digest = hashlib.sha256(message).digest()
+        signature = ecdsa.sign_message(message, wif)
+        i = signature[0] - 4 - 27
+        pubkey = PrivateKey(wif).pubkey
+        keys = [pubkey, ecdsa.signing_keys(bytes(PrivateKey(wif)), "ecdsa")[1]]
+        if ecdsa.CRYPTOGRAPHY_AVAILABLE:
+            keys.append(
+                ecdsa.signing_keys(bytes(PrivateKey(wif)), "cryptography")[1]
+            )
+        for key in keys:
+            self.assertEqual(
+                ecdsa.recoverPubkeyParameter(message, digest, signature[1:], key), i
+            )
+        self.assertIsNone(
+            ecdsa.recoverPubkeyParameter(
+                message, digest, signature[1:], PrivateKey(wif2).pubkey
+            )
+        )
+
+    def test_recover_public_keys(self):
+        items = []
+        for message in ["Foobar", "Barfoo"]:
+            signature = ecdsa.sign_message(message, wif)
+            digest = hashlib.sha256(bytes(message, "ascii")).digest()
+            items.append((digest, signature[1:], signature[0] - 4 - 27))
+        for backend in list(ecdsa.recover_backends) + [None, ecdsa._recover_ecdsa]:
+            keys = ecdsa.recover_public_keys(items, backend=backend)
+            self.assertEqual([hexlify(k).decode("latin") for k in keys], [pub_key] * 2)
+
+    def test_recover_public_keys_invalid(self):
+        digest = hashlib.sha256(b"Foobar").digest()
+        for signature in [bytes(32) + b"\x01" * 32, b"\x01" * 32 + bytes(32)]:
+            for backend in list(ecdsa.recover_backends) + [ecdsa._recover_ecdsa]:
+                with self.assertRaises(ValueError):
+                    ecdsa.recover_public_keys([(digest, signature, 0)], backend)
+
+    def test_curve_backends(self):
+        secret = bytes(PrivateKey(wif))
+        tweak = hashlib.sha256(b"Foobar").digest()
+        pubkey = bytes(PrivateKey(wif2).pubkey)
+        reference = ecdsa.EcdsaCurve
+        self.assertEqual(reference.mul_generator(secret), bytes(PrivateKey(wif).pubkey))
+        for module in ecdsa.curve_backends:
+            backend = ecdsa.curve(module)
+            self.assertEqual(backend.name, module)
+            self.assertEqual(
+                backend.mul_generator(secret), reference.mul_generator(secret)
+            )
+            self.assertEqual(backend.mul(pubkey, tweak), reference.mul(pubkey, tweak))
+            self.assertEqual(backend.add(pubkey, tweak), reference.add(pubkey, tweak))
+            self.assertEqual(backend.decompress(pubkey), reference.decompress(pubkey))
+            self.assertEqual(
+                backend.ecdh(secret, pubkey), reference.ecdh(secret, pubkey)
+            )
+
+    def test_tweakadd_without_secp256k1(self):
+        module = ecdsa.SECP256K1_MODULE
+        pubkey = PrivateKey(wif).pubkey
+        try:
+            children = []
+            for ecdsa.SECP256K1_MODULE in backends():
+                children.append(str(pubkey.child(b"\x01" * 32)))
+        finally:
+            ecdsa.SECP256K1_MODULE = module
+        self.assertEqual(len(set(children)), 1)
+        self.assertEqual(
+            children[0],
+            str(PrivateKey(wif).child(b"\x01" * 32).pubkey),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 import unittest
 from itertools import cycle
 from .fixtures import BrainKey, Address, PublicKey, PrivateKey
+from graphenebase import memo as memo_module
 from graphenebase.memo import get_shared_secret, _pad, _unpad, encode_memo, decode_memo
 
 test_cases = [
@@ -166,6 +167,23 @@ class Testcases(unittest.TestCase):
             shared_secret = get_shared_secret(priv, pub)
             self.assertEqual(s[2], shared_secret)
 
+    def test_shared_secret_backends(self):
+        for module in memo_module.ecdsa.curve_backends:
+            for s in test_shared_secrets:
+                priv = bytes(PrivateKey(s[0]))
+                pub = bytes(PublicKey(s[1], prefix="GPH"))
+                self.assertEqual(
+                    s[2], memo_module._shared_secret.__wrapped__(priv, pub, module)
+                )
+
+    def test_shared_secret_cache(self):
+        memo_module._shared_secret.cache_clear()
+        s = test_shared_secrets[0]
+        for _ in range(3):
+            get_shared_secret(PrivateKey(s[0]), PublicKey(s[1], prefix="GPH"))
+        info = memo_module._shared_secret.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
     def test_shared_secrets_equal(self):
 
         wifs = cycle([x[0] for x in test_shared_secrets])
@@ -181,6 +199,24 @@ class Testcases(unittest.TestCase):
                 get_shared_secret(receiver_private_key, sender_public_key),
             )
 
+    def test_decode_memos(self):
+        items = [
+            (
+                PrivateKey(memo["wif"]),
+                PublicKey(memo["to"], prefix="GPH"),
+                memo["nonce"],
+                memo["message"],
+            )
+            for memo in test_cases + not_enough_padding
+        ]
+        expected = [memo["plain"] for memo in test_cases + not_enough_padding]
+        # broken checksum
+        items.insert(1, items[0][:3] + (items[-1][3],))
+        for workers in [None, 2]:
+            results = memo_module.decode_memos(items, workers=workers, chunksize=2)
+            self.assertIsInstance(results.pop(1), ValueError)
+            self.assertEqual(results, expected)
+
     def test_decrypt_bugged_padding(self):
         for memo in not_enough_padding:
             dec = decode_memo(
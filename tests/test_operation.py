@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import json
 import unittest
 
 from collections import OrderedDict
@@ -133,3 +134,12 @@ class Testcases(unittest.TestCase):
             # Test order of attributes
             self.assertEqual(list(op.items())[0][0], "string")
             self.assertEqual(list(op.items())[1][0], "extensions")
+
+    def test_to_python(self):
+        op = Operation(Newdemooepration(dict(string="1.2.0", optional="foobar")))
+        self.assertEqual(op.to_python(), op.json())
+        self.assertEqual(json.loads(str(op)), op.to_python())
+        self.assertEqual(
+            op.operation.to_python(),
+            {"string": "1.2.0", "optional": "foobar", "extensions": []},
+        )
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from graphenebase import operations
+from graphenebase.objects import Operation
+from graphenebase.operationids import operations as operation_ids
+from graphenebase.types import Uint16, String, PointInTime, VoteId
+from graphenebase.schema import (
+    SchemaObject,
+    OperationSchemas,
+    Field,
+    ObjectIdField,
+    OptionalField,
+    ArrayField,
+    MapField,
+    ExtensionsField,
+)
+
+
+class Demo(SchemaObject):
+    fields = [
+        ("fee", operations.Asset),
+        ("account", ObjectIdField("account")),
+        ("num", Uint16),
+        ("memo", OptionalField(String)),
+        ("votes", ArrayField(VoteId)),
+        ("weights", MapField(ObjectIdField("account"), Uint16)),
+        ("expiration", PointInTime),
+        ("extensions", ExtensionsField()),
+    ]
+
+
+data = {
+    "fee": {"amount": 10, "asset_id": "1.3.0"},
+    "account": "1.2.100",
+    "num": 5,
+    "votes": ["0:30", "1:24"],
+    "weights": [["1.2.1", 2]],
+    "expiration": "2018-07-06T22:10:00",
+}
+
+
+class Testcases(unittest.TestCase):
+    def test_construct(self):
+        o = Demo(**data)
+        self.assertEqual(list(o.keys()), [name for name, _ in Demo.fields])
+        j = o.json()
+        self.assertEqual(j["fee"], data["fee"])
+        self.assertEqual(j["account"], "1.2.100")
+        self.assertEqual(j["votes"], ["0:30", "1:24"])
+        self.assertNotIn("memo", j)
+        self.assertEqual(Demo(dict(data, memo="foobar")).json()["memo"], "foobar")
+
+    def test_validate(self):
+        Demo.validate(data)
+        with self.assertRaises(ValueError):
+            Demo(dict(account="1.2.100"))
+        with self.assertRaises(ValueError):
+            Demo.validate(dict())
+
+    def test_fromBytes(self):
+        for o in [Demo(**data), Demo(memo="foobar", **data)]:
+            r, rest = Demo.fromBytes(bytes(o) + b"\x01")
+            self.assertEqual(rest, b"\x01")
+            self.assertEqual(bytes(r), bytes(o))
+        with self.assertRaises(NotImplementedError):
+            ArrayField(Field(operations.Permission)).fromBytes(b"\x01\x00")
+
+    def test_registry(self):
+        schemas = OperationSchemas(operation_ids)
+        with self.assertRaises(ValueError):
+            schemas.register("foobar", [])
+        schemas.register("nonexisting3", [("num", Uint16)])
+        self.assertIn("nonexisting3", schemas)
+        klass = schemas.klass("nonexisting3")
+        self.assertIs(klass, schemas.klass("nonexisting3"))
+        self.assertEqual(klass.__name__, "Nonexisting3")
+        self.assertEqual(bytes(klass(num=1)), b"\x01\x00")
+
+    def test_operation_from_registry(self):
+        operations.operation_schemas.register(
+            "nonexisting2", [("string", String), ("extensions", ExtensionsField())]
+        )
+        try:
+            op = Operation(["nonexisting2", dict(string="foobar")])
+            self.assertEqual(op.id, 3)
+            self.assertEqual(op.json(), [3, {"string": "foobar", "extensions": []}])
+            self.assertEqual(bytes(op), b"\x03\x06foobar\x00")
+            self.assertEqual(Operation(op.operation).name, "nonexisting2")
+            with self.assertRaises(NotImplementedError):
+                Operation(["nonexisting3", dict()])
+        finally:
+            operations.operation_schemas.unregister("nonexisting2")
+        self.assertNotIn("nonexisting2", operations.operation_schemas)
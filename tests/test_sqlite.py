@@ -32,3 +32,22 @@ class Testcases(unittest.TestCase):
 
         self.assertEqual(store["default"], "value")
         self.assertEqual(len(store), 1)
+
+    def test_insert_many(self):
+        store = MyStore(profile="insert_many", data_dir="/tmp/temporaryFolder")
+        store.wipe()
+        items = [("key%d" % i, "value%d" % i) for i in range(1200)]
+        store.insert_many(items[:1000])
+        self.assertEqual(len(store), 1000)
+        # One existing key aborts the whole batch
+        with self.assertRaises(KeyError):
+            store.insert_many(items[999:])
+        self.assertEqual(len(store), 1000)
+        store.insert_many(items[1000:])
+        self.assertEqual(store["key1100"], "value1100")
+        self.assertEqual(len(store), 1200)
+        self.assertEqual(
+            sorted(store.existing_keys(["key1", "foobar", "key1199"])),
+            ["key1", "key1199"],
+        )
+        store.wipe()
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
+import threading
 import unittest
 
 from .fixtures import (
@@ -186,6 +187,24 @@ class Testcases(unittest.TestCase):
         keys.delete("GPH5u9tEsKaqtCpKibrXJAMhaRUVBspB5pr9X34PPdrSbvBb6ajZY")
         self.assertEqual(len(keys.getPublicKeys()), 1)
 
+        pairs = [
+            pubprivpair("5Hqr1Rx6v3MLAvaYCxLYqaSEsm4eHaDFkLksPF2e1sDS7omneaZ"),
+            pubprivpair("5J4KCbg1G3my9b9hCaQXnHSm6vrwW9xQTJS6ZciW2Kek7cCkCEk"),
+        ]
+        with self.assertRaises(KeyAlreadyInStoreException):
+            keys.add_many(pairs + pairs[:1])
+        self.assertEqual(len(keys.getPublicKeys()), 1)
+        keys.add_many(pairs)
+        self.assertEqual(len(keys.getPublicKeys()), 3)
+        exported = keys.export_all()
+        for pair in pairs:
+            self.assertIn(pair, exported)
+        with self.assertRaises(KeyAlreadyInStoreException):
+            keys.add_many(pairs[1:])
+        for wif, pub in pairs:
+            keys.delete(pub)
+        self.assertEqual(len(keys.getPublicKeys()), 1)
+
         if isinstance(
             keys, (storage.SqliteEncryptedKeyStore, storage.InRamEncryptedKeyStore)
         ):
@@ -220,6 +239,179 @@ class Testcases(unittest.TestCase):
         keys.unlock(new_pass)
         self.assertEqual(keys.decrypted_master, master)
 
+    def test_decrypted_key_cache(self):
+        os.environ.pop("UNLOCK", None)
+        config = storage.InRamConfigurationStore()
+        keys = storage.InRamEncryptedKeyStore(
+            config=config, decrypted_key_cache_size=1
+        )
+        keys.unlock("foobar")
+        wif1 = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+        wif2 = "5J4KCbg1G3my9b9hCaQXnHSm6vrwW9xQTJS6ZciW2Kek7cCkCEk"
+        keys.add(*pubprivpair(wif1))
+        pub1 = str(PrivateKey(wif1).pubkey)
+
+        calls = []
+        decrypt = bip38.decrypt
+
+        def counting_decrypt(*args):
+            calls.append(args)
+            return decrypt(*args)
+
+        bip38.decrypt = counting_decrypt
+        try:
+            # Freshly added key is known without running scrypt
+            self.assertEqual(keys.getPrivateKeyForPublicKey(pub1), wif1)
+            self.assertEqual(len(calls), 0)
+
+            # Bounded in size
+            keys.add(*pubprivpair(wif2))
+            self.assertEqual(keys.getPrivateKeyForPublicKey(pub1), wif1)
+            self.assertEqual(keys.getPrivateKeyForPublicKey(pub1), wif1)
+            self.assertEqual(len(calls), 1)
+
+            # Wiped on lock
+            keys.lock()
+            with self.assertRaises(WalletLocked):
+                keys.getPrivateKeyForPublicKey(pub1)
+            keys.unlock("foobar")
+            self.assertEqual(keys.getPrivateKeyForPublicKey(pub1), wif1)
+            self.assertEqual(len(calls), 2)
+
+            # Expires
+            keys.decrypted_key_cache_ttl = 0
+            keys.clear_decrypted_keys()
+            keys.getPrivateKeyForPublicKey(pub1)
+            keys.getPrivateKeyForPublicKey(pub1)
+            self.assertEqual(len(calls), 4)
+        finally:
+            bip38.decrypt = decrypt
+
+    def test_bulk_encrypted_keys(self):
+        os.environ.pop("UNLOCK", None)
+        keys = storage.SqliteEncryptedKeyStore(
+            profile="testing", config=storage.InRamConfigurationStore()
+        )
+        keys.wipe()
+        keys.unlock("foobar")
+        pairs = [pubprivpair(str(PrivateKey("%064x" % i))) for i in range(1, 4)]
+        keys.add_many(pairs, workers=2, chunksize=1)
+        self.assertEqual(sorted(keys.getPublicKeys()), sorted(p for w, p in pairs))
+        # Existing keys are found before anything is encrypted
+        keys.encrypt_many = None
+        with self.assertRaises(KeyAlreadyInStoreException):
+            keys.add_many([pubprivpair(str(PrivateKey("%064x" % 4)))] + pairs[:1])
+        del keys.encrypt_many
+        keys.clear_decrypted_keys()
+        self.assertEqual(
+            sorted(keys.export_all(workers=2, chunksize=1)), sorted(pairs)
+        )
+        keys.lock()
+        with self.assertRaises(WalletLocked):
+            keys.export_all()
+        keys.wipe()
+
+    def test_cipher_reused(self):
+        config = storage.InRamConfigurationStore()
+        keys = storage.InRamEncryptedKeyStore(config=config)
+        keys.newMaster("foobar")
+        aes = keys._cipher()
+        keys.getEncryptedMaster()
+        self.assertIs(keys._cipher(), aes)
+        keys.changePassword("barfoo")
+        self.assertIsNot(keys._cipher(), aes)
+        keys.lock()
+        self.assertIsNone(keys._aes)
+
+    def test_async(self):
+        from graphenebase.utils import set_executor
+
+        os.environ.pop("UNLOCK", None)
+        wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+        config = storage.InRamConfigurationStore()
+        keys = storage.InRamEncryptedKeyStore(config=config)
+        try:
+            set_executor(workers=1)
+            keys.unlock_async("foobar").result()
+            self.assertTrue(keys.unlocked())
+            encrypted = keys.encrypt(wif)
+            master = keys.masterkey
+            keys.lock()
+
+            with self.assertRaises(WalletLocked):
+                keys.decrypt_async(encrypted)
+            with self.assertRaises(WrongMasterPasswordException):
+                keys.unlock_async("barfoo").result()
+            self.assertTrue(keys.locked())
+
+            keys.unlock_async("foobar").result()
+            self.assertEqual(keys.masterkey, master)
+            self.assertEqual(keys.decrypt_async(encrypted).result(), wif)
+            # cached
+            self.assertTrue(keys.decrypt_async(encrypted).done())
+        finally:
+            set_executor()
+
+    def test_async_lock_before_result(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from graphenebase.utils import set_executor
+
+        os.environ.pop("UNLOCK", None)
+        wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+        config = storage.InRamConfigurationStore()
+        keys = storage.InRamEncryptedKeyStore(config=config)
+        keys.unlock("foobar")
+        encrypted = keys.encrypt(wif)
+        keys.clear_decrypted_keys()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            set_executor(executor)
+            # Keep the worker busy until the store is locked
+            for call in [
+                lambda: keys.decrypt_async(encrypted),
+                lambda: keys.unlock_async("foobar"),
+            ]:
+                release = threading.Event()
+                executor.submit(release.wait)
+                future = call()
+                keys.lock()
+                release.set()
+                with self.assertRaises(WalletLocked):
+                    future.result()
+                self.assertTrue(keys.locked())
+                self.assertEqual(len(keys._decrypted_keys), 0)
+                keys.unlock("foobar")
+        finally:
+            set_executor()
+            executor.shutdown()
+
+    def test_lock_clears_key_caches(self):
+        from graphenebase import ecdsa, memo
+
+        os.environ.pop("UNLOCK", None)
+        wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+        priv = PrivateKey(wif)
+        config = storage.InRamConfigurationStore()
+        keys = storage.InRamEncryptedKeyStore(config=config)
+        keys.unlock("foobar")
+        keys.encrypt(wif)
+        ecdsa.sign_message("foobar", wif)
+        ecdsa.batch_signer([wif])
+        memo.get_shared_secret(priv, priv.pubkey)
+        caches = [
+            bip38._address_salt,
+            ecdsa.signing_keys,
+            ecdsa._batch_signer,
+            memo._shared_secret,
+        ]
+        if ecdsa.SECP256K1_MODULE == "secp256k1":  # pragma: no cover
+            caches.remove(ecdsa.signing_keys)
+        for cache in caches:
+            self.assertGreater(cache.cache_info().currsize, 0)
+        keys.lock()
+        for cache in caches:
+            self.assertEqual(cache.cache_info().currsize, 0)
+
     def test_wrongmastermass(self):
         config = storage.InRamConfigurationStore()
         keys = storage.InRamEncryptedKeyStore(config=config)
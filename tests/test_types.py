@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 import json
+import pickle
+import tracemalloc
 import unittest
 from .fixtures import types
 from datetime import datetime
@@ -213,6 +215,39 @@ class Testcases(unittest.TestCase):
             self.assertEqual(types.varint(i), expected[i])
             self.assertEqual(types.varintdecode(expected[i]), i)
 
+    def test_varint_multibyte(self):
+        for i in [128, 300, 2 ** 14, 2 ** 32 - 1, 2 ** 63]:
+            b = types.varint(i)
+            self.assertEqual(types.varintdecode2(b), (i, len(b)))
+        self.assertEqual(types.varint(300), b"\xac\x02")
+
+    def test_varintdecode_offset(self):
+        buf = memoryview(b"\xff" + types.varint(300) + types.varint(5))
+        self.assertEqual(types.varintdecode2(buf, 1), (300, 2))
+        self.assertEqual(types.varintdecode2(buf, 3), (5, 1))
+        self.assertEqual(types.varintdecode2(buf, 4), (0, 0))
+
+    def test_varintdecode_truncated(self):
+        data = types.varint(2 ** 32)
+        for i in range(1, len(data)):
+            with self.assertRaises(ValueError):
+                types.varintdecode2(data[:i])
+        with self.assertRaises(ValueError):
+            types.varintdecode_many(types.varint(5) + data[:-1], 2)
+
+    def test_varint_many(self):
+        values = [0, 1, 127, 128, 300, 2 ** 32 - 1]
+        data = types.varint_many(values)
+        self.assertEqual(data, b"".join(types.varint(v) for v in values))
+        self.assertEqual(
+            types.varintdecode_many(data, len(values)), (values, len(data))
+        )
+        self.assertEqual(
+            types.varintdecode_many(b"\x00" + data, 2, offset=1), ([0, 1], 2)
+        )
+        with self.assertRaises(ValueError):
+            types.varintdecode_many(data, len(values) + 1)
+
     def test_variable_buffer(self):
         self.assertEqual(types.variable_buffer(b"Hello"), b"\x05Hello")
 
@@ -351,6 +386,45 @@ class Testcases(unittest.TestCase):
         with self.assertRaises(Exception):
             types.ObjectId("1.2")
 
+    def test_objectid_interned(self):
+        u = types.ObjectId("1.3.0", "asset")
+        self.assertIs(u, types.ObjectId("1.3.0"))
+        self.assertIsNot(u, types.FullObjectId("1.3.0"))
+        self.assertEqual(types.parse_object_id("1.3.0"), (1, 3, 0))
+        with self.assertRaises(AttributeError):
+            u.Id = "1.3.1"
+        self.assertIs(pickle.loads(pickle.dumps(u)), u)
+        with self.assertRaises(AssertionError):
+            types.ObjectId("1.3.0", "account")
+        with self.assertRaises(AttributeError):
+            u.instance = types.Id(1)
+
+    def test_objectid_failed_verification_not_cached(self):
+        types._interned_object_id.cache_clear()
+        with self.assertRaises(AssertionError):
+            types.ObjectId("1.3.123456", "account")
+        self.assertEqual(types._interned_object_id.cache_info().currsize, 0)
+
+    def test_objectid_subclass_attributes(self):
+        class MyObjectId(types.ObjectId):
+            def __init__(self, object_str, type_verify=None, label=None):
+                super().__init__(object_str, type_verify)
+                self.label = label
+
+        class MyFullObjectId(types.FullObjectId):
+            def __init__(self, object_str):
+                self.label = "full"
+
+        u = MyObjectId("1.2.30", "account", label="foobar")
+        self.assertEqual(u.label, "foobar")
+        self.assertIsNot(u, MyObjectId("1.2.30"))
+        self.assertEqual(bytes(u), bytes(types.ObjectId("1.2.30")))
+        f = MyFullObjectId("1.2.30")
+        self.assertEqual(f.label, "full")
+        self.assertEqual(bytes(f), bytes(types.FullObjectId("1.2.30")))
+        with self.assertRaises(ValueError):
+            types.parse_object_id("1.3.x")
+
     def test_fullobjectid(self):
         u = types.FullObjectId("1.2.30")
         self.assertEqual(bytes(u), b"\x1e\x00\x00\x00\x00\x00\x02\x01")
@@ -368,3 +442,66 @@ class Testcases(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             MyEnum("barbar")
+
+    def test_to_python(self):
+        class Tmp(types.Uint16):
+            def json(self):
+                return "Foobar"
+
+        for u in [
+            types.Uint8(10),
+            types.Int64(-5),
+            types.Varint32(300),
+            types.Bool(False),
+            types.Id(10),
+            types.Signature(b"\x00" * 65),
+            types.Array([types.Uint8(10), 11, "Foobar"]),
+            types.Set([types.ObjectId("1.2.0")]),
+            types.Map([[types.Uint16(10), types.Uint16(11)]]),
+            types.Optional(types.Uint16(10)),
+            types.Static_variant(Tmp(10), 10),
+            types.VoteId("0:30"),
+            types.ObjectId("1.2.30"),
+            types.PointInTime("2018-07-06T22:10:00"),
+        ]:
+            try:
+                expected = types.JsonObj(u)
+            except Exception:
+                expected = str(u)
+            self.assertEqual(u.to_python(), expected, type(u).__name__)
+            self.assertEqual(types.to_python(u), expected)
+        self.assertEqual(types.String("123").to_python(), "123")
+        self.assertEqual(types.Bytes("1234").to_python(), "1234")
+
+    def test_slots(self):
+        for u in [
+            types.Uint8(1),
+            types.Uint16(1),
+            types.Uint32(1),
+            types.Int64(1),
+            types.Varint32(1),
+            types.String("foo"),
+            types.Bytes("00"),
+            types.Bool(True),
+            types.Set([]),
+            types.Optional(None),
+            types.Signature(b"\x00"),
+            types.PointInTime("2018-07-06T22:10:00"),
+            types.ObjectId("1.2.30"),
+            types.FullObjectId("1.2.30"),
+            types.VoteId("0:30"),
+        ]:
+            self.assertFalse(hasattr(u, "__dict__"), type(u).__name__)
+
+    def test_slots_memory(self):
+        class Unslotted(types.Uint16):
+            pass
+
+        def traced(klass):
+            tracemalloc.start()
+            objs = [klass(i) for i in range(1000)]  # noqa: F841
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return size
+
+        self.assertLess(traced(types.Uint16), traced(Unslotted))
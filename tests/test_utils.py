@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from dateutil.parser import parse
 from .fixtures import utils
@@ -34,3 +35,19 @@ class Testcases(unittest.TestCase):
             datetime(2033, 5, 18, 3, 33, 20, tzinfo=timezone.utc),
             utils.parse_time("2033-05-18T03:33:20"),
         )
+
+    def test_executor(self):
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                utils.set_executor(executor)
+                self.assertIs(utils.get_executor(), executor)
+                future = utils.chain_future(utils.submit(pow, 2, 10), str)
+                self.assertEqual(future.result(), "1024")
+                future = utils.chain_future(utils.submit(int, "x"), str)
+                with self.assertRaises(ValueError):
+                    future.result()
+            utils.set_executor(workers=1)
+            self.assertEqual(utils.submit(pow, 2, 10).result(), 1024)
+        finally:
+            utils.set_executor()
+        self.assertEqual(utils.completed_future(1).result(), 1)
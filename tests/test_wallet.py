@@ -1,8 +1,37 @@
 # -*- coding: utf-8 -*-
 import unittest
-from graphenecommon.exceptions import KeyNotFound
+from graphenecommon.exceptions import KeyAlreadyInStoreException, KeyNotFound
 from .fixtures import fixture_data, storage, Wallet, PrivateKey
 
+wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+pub = "GPH6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV"
+
+
+class RPC:
+    def __init__(self):
+        self.calls = []
+
+    def get_key_references(self, pubs):
+        self.calls.append(list(pubs))
+        return [["1.2.100", "1.2.101"] if p == pub else [] for p in pubs]
+
+    def get_objects(self, ids):
+        self.calls.append(list(ids))
+        return [
+            {
+                "id": i,
+                "name": "init%s" % i[-1],
+                "owner": {"key_auths": [[pub, 1]]},
+                "active": {"key_auths": [] if i == "1.2.101" else [[pub, 1]]},
+                "options": {"memo_key": pub},
+            }
+            for i in ids
+        ]
+
+
+class IndexedWallet(Wallet):
+    rpc = RPC()
+
 
 class Testcases(unittest.TestCase):
     def setUp(self):
@@ -37,6 +66,82 @@ class Testcases(unittest.TestCase):
         self.assertIn(str(wif3.pubkey), wallet.store.getPublicKeys())
         self.assertEqual(wallet.getPrivateKeyForPublicKey(wif3.pubkey), str(wif3))
 
+        wif4, wif5 = PrivateKey(), PrivateKey()
+        wallet.addPrivateKeys([wif4, str(wif5)])
+        self.assertEqual(wallet.getPrivateKeyForPublicKey(wif4.pubkey), str(wif4))
+        self.assertEqual(wallet.getPrivateKeyForPublicKey(wif5.pubkey), str(wif5))
+        count = len(wallet.getPublicKeys())
+        with self.assertRaises(KeyAlreadyInStoreException):
+            wallet.addPrivateKeys([PrivateKey(), wif4])
+        self.assertEqual(len(wallet.getPublicKeys()), count)
+
         wallet.removePrivateKeyFromPublicKey(wif3.pubkey)
         with self.assertRaises(KeyNotFound):
             wallet.getPrivateKeyForPublicKey(wif3.pubkey)
+
+    def test_account_index(self):
+        wallet = IndexedWallet(key_store=storage.InRamPlainKeyStore())
+        wallet.rpc.calls.clear()
+        wallet._saveAccountIndex({})
+        other = PrivateKey()
+        wallet.addPrivateKeys([wif, other])
+        # New keys are indexed right away, the index is parsed only once
+        self.assertEqual(len(wallet.rpc.calls), 1)
+        self.assertEqual(
+            wallet._loadAccountIndex()[pub], {"1.2.100": None, "1.2.101": None}
+        )
+        self.assertIs(wallet._loadAccountIndex(), wallet._loadAccountIndex())
+        expected = {
+            pub: {
+                "1.2.100": {"name": "init0", "type": "owner"},
+                "1.2.101": {"name": "init1", "type": "owner"},
+            },
+            str(other.pubkey): {},
+        }
+        self.assertEqual(wallet.getAccountIndex(), expected)
+        self.assertEqual(len(wallet.rpc.calls), 2)
+        self.assertEqual(sorted(wallet.rpc.calls[0]), sorted(expected))
+        self.assertEqual(wallet.rpc.calls[1], ["1.2.100", "1.2.101"])
+
+        # Persisted and not queried again
+        self.assertEqual(wallet.getAccountIndex(), expected)
+        self.assertEqual(
+            list(wallet.getAccountsFromPublicKey(pub)), ["1.2.100", "1.2.101"]
+        )
+        self.assertEqual(wallet.getAccountFromPublicKey(pub), "1.2.100")
+        self.assertEqual(
+            sorted((a["name"], a["type"]) for a in wallet.getAccounts()),
+            [("init0", "owner"), ("init1", "owner")],
+        )
+        self.assertEqual(len(wallet.rpc.calls), 2)
+        wallet.rpc.calls.clear()
+
+        # Incremental updates
+        new = PrivateKey()
+        wallet.addPrivateKey(new)
+        wallet.removePrivateKeyFromPublicKey(other.pubkey)
+        index = wallet.getAccountIndex()
+        self.assertEqual(sorted(index), sorted([pub, str(new.pubkey)]))
+        self.assertEqual(wallet.rpc.calls, [[str(new.pubkey)]])
+
+        wallet.getAccountIndex(refresh=True)
+        self.assertEqual(len(wallet.rpc.calls[1]), 2)
+        wallet.rpc.calls.clear()
+
+        # A miss costs one call and is written back
+        wallet._saveAccountIndex({})
+        self.assertEqual(wallet.getAccountFromPublicKey(pub), "1.2.100")
+        self.assertEqual(wallet.rpc.calls, [[pub]])
+        self.assertEqual(list(wallet.getAccountsFromPublicKey(pub))[1], "1.2.101")
+        self.assertEqual(len(wallet.rpc.calls), 1)
+        self.assertEqual(len(wallet.getAccounts()), 2)
+        self.assertEqual(
+            wallet.rpc.calls[1:], [[str(new.pubkey)], ["1.2.100", "1.2.101"]]
+        )
+        # Keys that are not in the wallet are not indexed
+        self.assertIsNone(wallet.getAccountFromPublicKey(str(other.pubkey)))
+        self.assertNotIn(str(other.pubkey), wallet._loadAccountIndex())
+
+        wallet.removeAccount("init1")
+        self.assertNotIn(pub, wallet.getPublicKeys())
+        self.assertNotIn(pub, wallet.getAccountIndex())